@@ -2,22 +2,56 @@
 
 __version__ = "0.2.11"
 
-from aws_spy import responses
-from aws_spy.core.exceptions import BaseSpyError
-from aws_spy.core.logging import logger
-from aws_spy.core.params_alias import Header, Path, Query
-from aws_spy.core.schemas import (
-    CORS,
-    VPC,
-    Authorizer,
-    CloudFormationRef,
-    HTTPApi,
-    JSONFileRef,
-    Provider,
-    ServerlessConfig,
-    build_cognito_issue_url,
-)
-from aws_spy.main import SpyAPI, SpyRouter
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from aws_spy import responses
+    from aws_spy.core.concurrency import offload, run_in_threadpool
+    from aws_spy.core.config import (
+        CORS,
+        VPC,
+        Authorizer,
+        CloudFormationRef,
+        HTTPApi,
+        JSONFileRef,
+        Provider,
+        ServerlessConfig,
+        build_cognito_issue_url,
+    )
+    from aws_spy.core.exceptions import BaseSpyError
+    from aws_spy.core.logging import logger
+    from aws_spy.core.params_alias import Header, Path, Query
+    from aws_spy.core.streams import DynamoDBRecord, KinesisRecord
+    from aws_spy.dependencies import Depends
+    from aws_spy.main import SpyAPI, SpyRouter
+
+# Everything is imported on first access, so a Lambda pays only for what it uses.
+# Deploy-time models (aws_spy.core.config) are never imported by the runtime itself.
+_LAZY_IMPORTS = {
+    "SpyAPI": "aws_spy.main",
+    "SpyRouter": "aws_spy.main",
+    "Query": "aws_spy.core.params_alias",
+    "Path": "aws_spy.core.params_alias",
+    "Header": "aws_spy.core.params_alias",
+    "ServerlessConfig": "aws_spy.core.config",
+    "Provider": "aws_spy.core.config",
+    "VPC": "aws_spy.core.config",
+    "HTTPApi": "aws_spy.core.config",
+    "CORS": "aws_spy.core.config",
+    "Authorizer": "aws_spy.core.config",
+    "build_cognito_issue_url": "aws_spy.core.config",
+    "JSONFileRef": "aws_spy.core.config",
+    "CloudFormationRef": "aws_spy.core.config",
+    "logger": "aws_spy.core.logging",
+    "BaseSpyError": "aws_spy.core.exceptions",
+    "run_in_threadpool": "aws_spy.core.concurrency",
+    "offload": "aws_spy.core.concurrency",
+    "Depends": "aws_spy.dependencies",
+    "KinesisRecord": "aws_spy.core.streams",
+    "DynamoDBRecord": "aws_spy.core.streams",
+}
+_LAZY_MODULES = ("responses",)
 
 __all__ = (
     "SpyAPI",
@@ -37,4 +71,24 @@ __all__ = (
     "logger",
     "responses",
     "BaseSpyError",
+    "run_in_threadpool",
+    "offload",
+    "Depends",
+    "KinesisRecord",
+    "DynamoDBRecord",
 )
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,174 @@
+import asyncio
+import base64
+import re
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+
+import typing_extensions as te
+
+from aws_spy.core.etag import strip_body
+from aws_spy.core.schemas import Methods, SpyRoute
+from aws_spy.dependencies import aclose_container
+from aws_spy.responses import ErrorResponse
+from aws_spy.runtime import RoutePlan, compile_route
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from aws_spy.main import SpyAPI
+
+Scope = dict[str, t.Any]
+Message = dict[str, t.Any]
+Receive = t.Callable[[], t.Awaitable[Message]]
+Send = t.Callable[[Message], t.Awaitable[None]]
+
+PATH_PARAM_PATTERN = re.compile(r"{(\w+)}")
+
+
+def compile_path(path: str) -> re.Pattern[str]:
+    pattern = "".join(
+        f"(?P<{part}>[^/]+)" if index % 2 else re.escape(part)
+        for index, part in enumerate(PATH_PARAM_PATTERN.split(path))
+    )
+    return re.compile(f"^{pattern}$")
+
+
+class PathMatcher:
+    """
+    Static paths are looked up in a dict, parametrised ones are matched by regexes compiled upfront.
+    """
+
+    def __init__(self: te.Self, routes: dict[str, dict[Methods, SpyRoute]]) -> None:
+        self.static: dict[str, dict[str, tuple[str, RoutePlan]]] = {}
+        self.dynamic: list[tuple[re.Pattern[str], dict[str, tuple[str, RoutePlan]]]] = []
+        for path, methods in routes.items():
+            plans = {method.upper(): (path, compile_route(route)) for method, route in methods.items()}
+            if PATH_PARAM_PATTERN.search(path):
+                self.dynamic.append((compile_path(path), plans))
+            else:
+                self.static[path] = plans
+
+    def match(self: te.Self, path: str) -> tuple[dict[str, tuple[str, RoutePlan]], dict[str, str]] | None:
+        plans = self.static.get(path)
+        if plans is not None:
+            return plans, {}
+        for pattern, plans in self.dynamic:
+            match = pattern.match(path)
+            if match is not None:
+                # ASGI servers percent-decode scope's path already
+                return plans, match.groupdict()
+        return None
+
+
+def build_event(scope: Scope, body: bytes, route_path: str, path_params: dict[str, str]) -> dict[str, t.Any]:
+    """
+    Translates ASGI HTTP scope into API Gateway HTTP API (payload 2.0) event.
+    """
+    headers: dict[str, str] = {}
+    for key, value in scope["headers"]:
+        name = key.decode("latin-1")
+        headers[name] = f"{headers[name]},{value.decode('latin-1')}" if name in headers else value.decode("latin-1")
+    query_string = scope.get("query_string", b"").decode("latin-1")
+    query_params: dict[str, str] = {}
+    for key, value in parse_qsl(query_string, keep_blank_values=True):
+        query_params[key] = f"{query_params[key]},{value}" if key in query_params else value
+
+    event: dict[str, t.Any] = {
+        "version": "2.0",
+        "routeKey": f"{scope['method']} {route_path}",
+        "rawPath": scope["path"],
+        "rawQueryString": query_string,
+        "headers": headers,
+        "requestContext": {
+            "http": {
+                "method": scope["method"],
+                "path": scope["path"],
+                "sourceIp": scope["client"][0] if scope.get("client") else "",
+            },
+        },
+        "isBase64Encoded": False,
+    }
+    if query_params:
+        event["queryStringParameters"] = query_params
+    if path_params:
+        event["pathParameters"] = path_params
+    if body:
+        try:
+            event["body"] = body.decode()
+        except UnicodeDecodeError:
+            event["body"] = base64.b64encode(body).decode()
+            event["isBase64Encoded"] = True
+    return event
+
+
+class ASGIApp:
+    """
+    Serves SpyAPI routes from a long-running ASGI server.
+    Sync handlers run in a thread pool, async handlers are awaited on the server's loop.
+    """
+
+    def __init__(self: te.Self, app: "SpyAPI", *, max_workers: int | None = None) -> None:
+        self.matcher = PathMatcher(app.routes)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="spy")
+
+    async def __call__(self: te.Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":  # pragma: no cover
+            msg = f'Unsupported ASGI scope type "{scope["type"]}".'
+            raise RuntimeError(msg)
+
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        response = await self.handle(scope, bytes(body))
+        await self.send_response(send, response)
+
+    async def handle(self: te.Self, scope: Scope, body: bytes) -> dict[str, t.Any]:
+        matched = self.matcher.match(scope["path"])
+        if matched is None:
+            return ErrorResponse("Not Found", status_code=404).response
+        plans, path_params = matched
+        # GET routes answer HEAD requests too, without the body
+        is_head = scope["method"] == "HEAD" and "HEAD" not in plans
+        method = "GET" if is_head else scope["method"]
+        if method not in plans:
+            return ErrorResponse("Method Not Allowed", status_code=405).response
+
+        route_path, plan = plans[method]
+        event = build_event(scope, body, route_path, path_params)
+        if plan.is_async:
+            response = await plan.call_async(event, None)
+        else:
+            response = await asyncio.get_running_loop().run_in_executor(self.executor, plan, event, None)
+        return strip_body(response) if is_head else response
+
+    @staticmethod
+    async def send_response(send: Send, response: dict[str, t.Any]) -> None:
+        body = response.get("body") or b""
+        if response.get("isBase64Encoded"):
+            body = base64.b64decode(body)
+        elif isinstance(body, str):
+            body = body.encode()
+        headers = [
+            (str(key).lower().encode("latin-1"), str(value).encode("latin-1"))
+            for key, value in (response.get("headers") or {}).items()
+        ]
+        headers.extend((b"set-cookie", cookie.encode("latin-1")) for cookie in response.get("cookies") or ())
+        await send({"type": "http.response.start", "status": int(response.get("statusCode", 200)), "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def lifespan(self: te.Self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=True)
+                await aclose_container()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,324 @@
+import inspect
+import typing as t
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import typing_extensions as te
+from pydantic import Field, model_validator
+
+from aws_spy.core.encoders import get_type_adapter
+from aws_spy.core.exceptions import FunctionDefinitionError
+from aws_spy.core.logging import logger
+from aws_spy.core.schemas import LH, SpyFunction, get_record_model, is_flat_model
+from aws_spy.core.streams import (
+    DynamoDBRecord,
+    KinesisRecord,
+    build_dynamodb_parser,
+    build_kinesis_parser,
+    get_dynamodb_sequence_number,
+    get_kinesis_sequence_number,
+)
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aws_spy.core.columnar import ColumnBuilder, Columns
+
+Record = dict[str, t.Any]
+Parser = Callable[[Record], t.Any]
+
+
+class SpyBatchFunction(SpyFunction):
+    """
+    Function invoked by an event source mapping, its handler processes a single record.
+    """
+
+    batch_size: int = Field(10, ge=1, le=10000)
+    maximum_batching_window: int = Field(0, ge=0, le=300)
+    max_concurrency: int = Field(1, ge=1)
+    # type record payloads are validated into, taken from handler's first argument if not given
+    record_model: t.Any = Field(None, exclude=True, repr=False)
+    # handler gets the whole batch at once, as a column per field of the flat `record_model`
+    columnar: bool = Field(default=False)
+
+    @model_validator(mode="after")
+    def set_record_model(self: te.Self) -> te.Self:
+        if self.columnar:
+            if not is_flat_model(self.record_model):
+                msg = f"Columnar batches of {self.name} function need a flat pydantic model!"
+                raise FunctionDefinitionError(msg)
+        elif self.record_model is None:
+            self.record_model = get_record_model(self.handler)
+        return self
+
+
+# SQS rejects bigger batches without a batching window
+SQS_MAX_UNBATCHED_SIZE = 10
+
+
+class SpySQSFunction(SpyBatchFunction):
+    queue: str  # ARN, may be a CloudFormationRef or JSONFileRef
+
+    @model_validator(mode="after")
+    def check_batching_window(self: te.Self) -> te.Self:
+        if self.batch_size > SQS_MAX_UNBATCHED_SIZE and not self.maximum_batching_window:
+            msg = f"{self.name} function needs maximum_batching_window for batches bigger than 10 messages!"
+            raise FunctionDefinitionError(msg)
+        return self
+
+
+class SpyStreamFunction(SpyBatchFunction):
+    """
+    Stream consumer, a failure makes Lambda retry the batch from the failed record's sequence number.
+    """
+
+    stream: str  # ARN, may be a CloudFormationRef or JSONFileRef
+    starting_position: t.Literal["LATEST", "TRIM_HORIZON"] = Field("LATEST")
+    batch_size: int = Field(100, ge=1, le=10000)
+
+
+class SpyKinesisFunction(SpyStreamFunction):
+    ...
+
+
+class SpyDynamoDBStreamFunction(SpyStreamFunction):
+    ...
+
+
+def build_batch_response(failures: list[str]) -> dict[str, t.Any]:
+    """
+    Partial batch response, only the failed records are retried by the event source mapping.
+    """
+    return {"batchItemFailures": [{"itemIdentifier": identifier} for identifier in failures]}
+
+
+def build_parser(record_model: t.Any, get_payload: Callable[[Record], str | bytes]) -> Parser:
+    if record_model is None:
+        return get_payload
+    validate_json = get_type_adapter(record_model).validate_json
+
+    def parse(record: Record) -> t.Any:
+        return validate_json(get_payload(record))
+
+    return parse
+
+
+def get_sqs_body(record: Record) -> str:
+    return record["body"]
+
+
+def get_sqs_message_id(record: Record) -> str:
+    return record["messageId"]
+
+
+def is_fifo_batch(records: list[Record]) -> bool:
+    return bool(records) and records[0].get("eventSourceARN", "").endswith(".fifo")
+
+
+@dataclass(frozen=True, slots=True)
+class BatchPlan:
+    """
+    Runtime descriptor of a batch function, built once per function.
+    Records are processed by the handler one by one, up to `max_concurrency` at a time,
+    and the ones it failed on are reported back instead of failing the whole batch.
+    Stream batches are `checkpoint`ed, only the first failed record is reported as Lambda retries from it.
+    """
+
+    function: SpyBatchFunction
+    handler: LH
+    parse: Parser
+    identify: Callable[[Record], str]
+    add_payload: bool
+    add_record: bool
+    add_context: bool
+    is_async: bool
+    max_concurrency: int
+    executor: "ThreadPoolExecutor | None"
+    wrap: Callable[[Record], t.Any] | None = None
+    checkpoint: bool = False
+
+    def __call__(self, event: dict[str, t.Any], context: t.Any = None) -> dict[str, t.Any]:
+        records = event.get("Records") or []
+        if self.is_async:
+            from aws_spy.core.concurrency import run_sync
+
+            failures = run_sync(self.process_batch_async(records, context))
+        else:
+            failures = self.process_batch(records, context)
+        return build_batch_response(failures[:1] if self.checkpoint else failures)
+
+    def is_ordered(self, records: list[Record]) -> bool:
+        """
+        Records of FIFO queues, and stream records processed one at a time,
+        are processed in order, stopping at the first failure.
+        """
+        return (self.checkpoint and self.max_concurrency == 1) or is_fifo_batch(records)
+
+    def build_arguments(self, record: Record, context: t.Any) -> tuple[tuple[t.Any, ...], dict[str, t.Any]]:
+        item = record if self.wrap is None else self.wrap(record)
+        kwargs = {}
+        if self.add_record:
+            kwargs["record"] = item
+        if self.add_context:
+            kwargs["context"] = context
+        return ((self.parse(item),) if self.add_payload else ()), kwargs
+
+    def process(self, record: Record, context: t.Any) -> bool:
+        try:
+            args, kwargs = self.build_arguments(record, context)
+            self.handler(*args, **kwargs)
+        except Exception:
+            logger.exception("Processing %s record of %s failed", self.identify(record), self.function.name)
+            return False
+        return True
+
+    async def process_async(self, record: Record, context: t.Any) -> bool:
+        try:
+            args, kwargs = self.build_arguments(record, context)
+            await self.handler(*args, **kwargs)
+        except Exception:
+            logger.exception("Processing %s record of %s failed", self.identify(record), self.function.name)
+            return False
+        return True
+
+    def process_batch(self, records: list[Record], context: t.Any) -> list[str]:
+        if self.is_ordered(records):
+            for index, record in enumerate(records):
+                if not self.process(record, context):
+                    return [self.identify(unprocessed) for unprocessed in records[index:]]
+            return []
+        if self.executor is None or len(records) == 1:
+            results = [self.process(record, context) for record in records]
+        else:
+            results = list(self.executor.map(self.process, records, [context] * len(records)))
+        return [self.identify(record) for record, result in zip(records, results, strict=True) if not result]
+
+    async def process_batch_async(self, records: list[Record], context: t.Any) -> list[str]:
+        import asyncio
+
+        if self.is_ordered(records):
+            for index, record in enumerate(records):
+                if not await self.process_async(record, context):
+                    return [self.identify(unprocessed) for unprocessed in records[index:]]
+            return []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(record: Record) -> bool:
+            async with semaphore:
+                return await self.process_async(record, context)
+
+        results = await asyncio.gather(*(bounded(record) for record in records))
+        return [self.identify(record) for record, result in zip(records, results, strict=True) if not result]
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarBatchPlan(BatchPlan):
+    """
+    Batch plan calling the handler once, with valid records turned into a column per field.
+    Records failing validation are reported on their own, a handler failure fails all the others.
+    """
+
+    columns: "ColumnBuilder | None" = None
+
+    def build_batch(self, records: list[Record]) -> tuple["Columns", list[Record], list[str]]:
+        """
+        Records are validated straight into dicts of `columns.row_type`, no model instances are built.
+        """
+        ordered = self.is_ordered(records)
+        rows = []
+        valid_records = []
+        failures = []
+        for index, record in enumerate(records):
+            try:
+                rows.append(self.parse(record if self.wrap is None else self.wrap(record)))
+            except Exception:
+                logger.exception("Validating %s record of %s failed", self.identify(record), self.function.name)
+                if ordered:
+                    failures.extend(self.identify(unprocessed) for unprocessed in records[index:])
+                    break
+                failures.append(self.identify(record))
+            else:
+                valid_records.append(record)
+        try:
+            columns = self.columns.build(rows)  # type: ignore
+        except Exception:
+            # values were validated to fit their columns, so this is not expected to fail
+            logger.exception("Building columns of %s failed", self.function.name)
+            return {}, [], [self.identify(record) for record in records]
+        return columns, valid_records, failures
+
+    def process_batch(self, records: list[Record], context: t.Any) -> list[str]:
+        columns, valid_records, failures = self.build_batch(records)
+        if valid_records:
+            try:
+                self.handler(columns, **self.build_kwargs(context))
+            except Exception:
+                logger.exception("Processing batch of %s failed", self.function.name)
+                return [self.identify(record) for record in records]
+        return failures
+
+    async def process_batch_async(self, records: list[Record], context: t.Any) -> list[str]:
+        columns, valid_records, failures = self.build_batch(records)
+        if valid_records:
+            try:
+                await self.handler(columns, **self.build_kwargs(context))
+            except Exception:
+                logger.exception("Processing batch of %s failed", self.function.name)
+                return [self.identify(record) for record in records]
+        return failures
+
+    def build_kwargs(self, context: t.Any) -> dict[str, t.Any]:
+        return {"context": context} if self.add_context else {}
+
+
+def build_executor(function: SpyBatchFunction) -> "ThreadPoolExecutor | None":
+    if function.max_concurrency == 1 or function.columnar or inspect.iscoroutinefunction(function.handler):
+        return None
+    from concurrent.futures import ThreadPoolExecutor
+
+    # kept for the life of the container, threads are started on demand
+    return ThreadPoolExecutor(max_workers=function.max_concurrency, thread_name_prefix=f"spy-{function.name}")
+
+
+def compile_batch_function(function: SpyBatchFunction) -> BatchPlan:
+    if function.plan is None:
+        parameters = list(inspect.signature(function.handler).parameters)
+        columns = None
+        validated_type = function.record_model
+        if function.columnar:
+            # NumPy is imported only by containers running columnar functions
+            from aws_spy.core.columnar import ColumnBuilder
+
+            columns = ColumnBuilder(function.record_model)
+            validated_type = columns.row_type
+        options: dict[str, t.Any] = {
+            "function": function,
+            "handler": function.handler,
+            "add_payload": bool(parameters) and parameters[0] not in ("record", "context"),
+            "add_record": "record" in parameters,
+            "add_context": "context" in parameters,
+            "is_async": inspect.iscoroutinefunction(function.handler),
+            "max_concurrency": function.max_concurrency,
+            "executor": build_executor(function),
+        }
+        if isinstance(function, SpySQSFunction):
+            options.update(parse=build_parser(validated_type, get_sqs_body), identify=get_sqs_message_id)
+        elif isinstance(function, SpyKinesisFunction):
+            options.update(
+                parse=build_kinesis_parser(validated_type),
+                identify=get_kinesis_sequence_number,
+                wrap=KinesisRecord,
+                checkpoint=True,
+            )
+        elif isinstance(function, SpyDynamoDBStreamFunction):
+            options.update(
+                parse=build_dynamodb_parser(function.record_model, validated_type),
+                identify=get_dynamodb_sequence_number,
+                wrap=DynamoDBRecord,
+                checkpoint=True,
+            )
+        if columns is not None:
+            function.plan = ColumnarBatchPlan(**options, columns=columns)
+        else:
+            function.plan = BatchPlan(**options)
+    return function.plan
@@ -0,0 +1,149 @@
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+import typing_extensions as te
+from pydantic import BaseModel, Field
+
+Response = dict[str, t.Any]
+CACHEABLE_STATUS_CODES = range(200, 300)
+
+
+class CacheBackend(te.Protocol):
+    """
+    Second cache tier shared between containers, e.g. ElastiCache or DynamoDB.
+    """
+
+    def get(self: te.Self, key: str) -> Response | None:
+        ...
+
+    def set(self: te.Self, key: str, response: Response, ttl: float) -> None:  # noqa: A003
+        ...
+
+
+class InMemoryBackend:
+    """
+    Local stand-in for a shared cache backend.
+    """
+
+    def __init__(self: te.Self) -> None:
+        self.data: dict[str, tuple[float, Response]] = {}
+
+    def get(self: te.Self, key: str) -> Response | None:
+        expires_at, response = self.data.get(key, (0.0, None))
+        return response if expires_at > time.monotonic() else None
+
+    def set(self: te.Self, key: str, response: Response, ttl: float) -> None:  # noqa: A003
+        self.data[key] = (time.monotonic() + ttl, response)
+
+
+class ResponseCache(BaseModel):
+    ttl: float = Field(60, gt=0)
+    max_entries: int = Field(256, ge=1)
+    # sum of cached bodies' lengths, unbounded if None
+    max_bytes: int | None = Field(None, ge=1)
+    cache_control: str | None = Field(None)
+    backend: t.Any = Field(None, exclude=True)  # CacheBackend
+
+    @property
+    def cache_control_header(self: te.Self) -> str:
+        return self.cache_control or f"max-age={int(self.ttl)}"
+
+
+def get_body_size(response: Response) -> int:
+    body = response.get("body")
+    return len(body) if isinstance(body, str | bytes) else 0
+
+
+def copy_response(response: Response) -> Response:
+    """
+    Cached responses are shared, so callers get copies they can add headers to.
+    """
+    if "headers" not in response:
+        return response.copy()
+    return {**response, "headers": response["headers"].copy()}
+
+
+class ResponseCacheStore:
+    """
+    Serialized responses of a single route, kept in LRU order for the life of the container.
+    """
+
+    def __init__(self: te.Self, name: str, config: ResponseCache) -> None:
+        self.name = name
+        self.config = config
+        self.entries: OrderedDict[str, tuple[float, Response]] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self: te.Self, key: str) -> Response | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return copy_response(response)
+                self._remove(key)
+        backend = self.config.backend
+        if backend is not None:
+            response = backend.get(f"{self.name}:{key}")
+            if response is not None:
+                self._store(key, response)
+                with self.lock:
+                    self.hits += 1
+                return copy_response(response)
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def set(self: te.Self, key: str, response: Response) -> Response:  # noqa: A003
+        """
+        Caches successful responses only, returns the response with Cache-Control header set.
+        """
+        if int(response.get("statusCode", 200)) not in CACHEABLE_STATUS_CODES:
+            return response
+        response["headers"] = {**(response.get("headers") or {}), "Cache-Control": self.config.cache_control_header}
+        self._store(key, response)
+        if self.config.backend is not None:
+            self.config.backend.set(f"{self.name}:{key}", response, self.config.ttl)
+        return copy_response(response)
+
+    def _store(self: te.Self, key: str, response: Response) -> None:
+        size = get_body_size(response)
+        max_bytes = self.config.max_bytes
+        if max_bytes is not None and size > max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + self.config.ttl, response)
+            self.size += size
+            while len(self.entries) > self.config.max_entries or (max_bytes is not None and self.size > max_bytes):
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self: te.Self, key: str) -> None:
+        _, response = self.entries.pop(key)
+        self.size -= get_body_size(response)
+
+    def clear(self: te.Self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    @property
+    def stats(self: te.Self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "bytes": self.size}
+
+
+def build_cache_key(kwargs: dict[str, t.Any], *variants: str | None) -> str:
+    """
+    Key out of validated param values, so equal values in different raw forms (e.g. "01" and "1") share entries.
+    `variants` are request properties the response depends on besides params, e.g. Accept-Encoding.
+    """
+    items = sorted((name, value) for name, value in kwargs.items() if name not in ("event", "context"))
+    return repr((items, *variants)) if variants else repr(items)
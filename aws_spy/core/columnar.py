@@ -0,0 +1,70 @@
+import array
+import typing as t
+
+import typing_extensions as te
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# array module typecodes of fields stored in contiguous buffers, other fields become lists
+TYPECODES: dict[t.Any, str] = {int: "q", float: "d", bool: "b"}
+NUMPY_DTYPES = {"q": "int64", "d": "float64", "b": "bool"}
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+Columns = dict[str, t.Any]
+
+
+def build_row_type(model: type[BaseModel]) -> t.Any:
+    """
+    TypedDict with the fields of a flat model, records are validated into plain dicts instead of model instances.
+    Field types, constraints and aliases are kept, model and field validators are not run.
+    Integers are bounded to int64, so a record not fitting its column fails validation on its own.
+    """
+    fields = {}
+    for name, field in model.model_fields.items():
+        metadata: list[t.Any] = [Field(ge=INT64_MIN, le=INT64_MAX)] if field.annotation is int else []
+        metadata.extend(field.metadata)
+        if field.validation_alias is not None:
+            metadata.append(Field(validation_alias=field.validation_alias))
+        annotation = te.Annotated[(field.annotation, *metadata)] if metadata else field.annotation
+        fields[name] = annotation if field.is_required() else te.NotRequired[annotation]
+    row_type = te.TypedDict(f"{model.__name__}Row", fields)  # type: ignore
+    row_type.__pydantic_config__ = ConfigDict(**model.model_config)  # type: ignore
+    return row_type
+
+
+class ColumnBuilder:
+    """
+    Turns records of a flat model, validated into `row_type` dicts, into one column per field, built once per model.
+    Numeric fields are packed into `array` buffers, viewed as NumPy arrays without copying if NumPy is installed.
+    """
+
+    __slots__ = ("fields", "row_type", "use_numpy")
+
+    def __init__(self: te.Self, model: type[BaseModel], *, use_numpy: bool | None = None) -> None:
+        # name, typecode and default of every field
+        self.fields = [
+            (
+                name,
+                TYPECODES.get(field.annotation),
+                None if field.is_required() else field.get_default(call_default_factory=True),
+            )
+            for name, field in model.model_fields.items()
+        ]
+        self.row_type = build_row_type(model)
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+
+    def build(self: te.Self, rows: list[dict[str, t.Any]]) -> Columns:
+        return {
+            name: self.build_column([row.get(name, default) for row in rows], typecode)
+            for name, typecode, default in self.fields
+        }
+
+    def build_column(self: te.Self, values: list[t.Any], typecode: str | None) -> t.Any:
+        if typecode is None:
+            return np.array(values, dtype=object) if self.use_numpy else values
+        buffer = array.array(typecode, values)
+        return np.frombuffer(buffer, dtype=NUMPY_DTYPES[typecode]) if self.use_numpy else buffer
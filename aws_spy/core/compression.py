@@ -0,0 +1,175 @@
+import base64
+import binascii
+import gzip
+import os
+import typing as t
+import zlib
+
+from pydantic import BaseModel, Field
+
+from aws_spy.core.exceptions import RequestBodyTooLargeError, UnsupportedContentEncodingError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+Encoding = t.Literal["br", "gzip", "deflate"]
+
+# bodies sent without compression can't be bigger than API Gateway's 10 MB payload limit,
+# compressed ones are not allowed to grow past it either
+MAX_REQUEST_BODY_SIZE = int(os.environ.get("SPY_MAX_REQUEST_BODY_SIZE", 10 * 1024 * 1024))
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+BROTLI_CHUNK_SIZE = 1024
+
+
+class Compression(BaseModel):
+    minimum_size: int = Field(1024)
+    level: int = Field(6)
+    encodings: list[Encoding] = Field(default_factory=lambda: ["br", "gzip", "deflate"])
+
+
+def get_header(headers: dict[str, t.Any] | None, name: str) -> t.Any:
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is not None:
+        return value
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def negotiate_encoding(accept_encoding: str | None, encodings: list[Encoding]) -> Encoding | None:
+    """
+    Picks the encoding with the highest q-value from the Accept-Encoding header.
+    On equal q-values the server preference (order of `encodings`) wins.
+    """
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        accepted[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        if encoding == "br" and brotli is None:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: Encoding, level: int) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == "deflate":
+        return zlib.compress(data, level)
+    return brotli.compress(data, quality=min(level, 11))
+
+
+def decompress(data: bytes, encoding: str, max_size: int = MAX_REQUEST_BODY_SIZE) -> bytes:
+    """
+    Decompresses data, raising RequestBodyTooLargeError as soon as the output outgrows `max_size`.
+    """
+    if encoding == "gzip":
+        return inflate(data, GZIP_WBITS, max_size)
+    if encoding == "deflate":
+        return inflate(data, zlib.MAX_WBITS, max_size)
+    if encoding == "br" and brotli is not None:
+        return unbrotli(data, max_size)
+    msg = f"Unsupported content encoding: {encoding}"
+    raise UnsupportedContentEncodingError(msg)
+
+
+def raise_too_large(max_size: int) -> t.NoReturn:
+    msg = f"Decompressed request body is bigger than {max_size} bytes."
+    raise RequestBodyTooLargeError(msg)
+
+
+def inflate(data: bytes, wbits: int, max_size: int) -> bytes:
+    output = bytearray()
+    while True:
+        decompressor = zlib.decompressobj(wbits)
+        output += decompressor.decompress(data, max_size - len(output) + 1)
+        if len(output) > max_size:
+            raise_too_large(max_size)
+        if not decompressor.eof:
+            msg = "Compressed file ended before the end-of-stream marker was reached"
+            raise EOFError(msg)
+        data = decompressor.unused_data
+        # gzip bodies may be made of many members
+        if wbits != GZIP_WBITS or not data:
+            return bytes(output)
+
+
+def unbrotli(data: bytes, max_size: int) -> bytes:
+    # brotli decompressor has no output limit, so it is fed small chunks and checked after each
+    decompressor = brotli.Decompressor()
+    output = bytearray()
+    for start in range(0, len(data), BROTLI_CHUNK_SIZE):
+        output += decompressor.process(data[start : start + BROTLI_CHUNK_SIZE])
+        if len(output) > max_size:
+            raise_too_large(max_size)
+    if not decompressor.is_finished():
+        msg = "Compressed file ended before the end-of-stream marker was reached"
+        raise EOFError(msg)
+    return bytes(output)
+
+
+def compress_response(
+    response: dict[str, t.Any],
+    accept_encoding: str | None,
+    compression: Compression,
+) -> dict[str, t.Any]:
+    body = response.get("body")
+    headers = response.get("headers") or {}
+    if not isinstance(body, str) or response.get("isBase64Encoded") or get_header(headers, "Content-Encoding"):
+        return response
+
+    data = body.encode()
+    if len(data) < compression.minimum_size:
+        return response
+    encoding = negotiate_encoding(accept_encoding, compression.encodings)
+    if encoding is None:
+        return response
+
+    return {
+        **response,
+        "body": base64.b64encode(compress(data, encoding, compression.level)).decode(),
+        "isBase64Encoded": True,
+        "headers": {**headers, "Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+    }
+
+
+def decode_request_body(event: dict[str, t.Any], max_size: int = MAX_REQUEST_BODY_SIZE) -> str | bytes | None:
+    """
+    Returns the raw request body, undoing API Gateway base64 encoding and Content-Encoding.
+    Raises ValueError when the body can not be decoded, RequestBodyTooLargeError when it decompresses past `max_size`
+    and UnsupportedContentEncodingError for content encodings it doesn't know.
+    """
+    body = event.get("body")
+    is_base64 = event.get("isBase64Encoded")
+    content_encoding = get_header(event.get("headers"), "Content-Encoding")
+    if not body or (not is_base64 and not content_encoding):
+        return body
+
+    try:
+        data = base64.b64decode(body) if is_base64 else body.encode()
+        if content_encoding and content_encoding.lower() != "identity":
+            data = decompress(data, content_encoding.lower(), max_size)
+    except (OSError, EOFError, zlib.error, binascii.Error) as e:
+        msg = "Request body could not be decoded."
+        raise ValueError(msg) from e
+    return data
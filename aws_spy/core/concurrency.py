@@ -0,0 +1,79 @@
+import asyncio
+import contextvars
+import os
+import typing as t
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+import typing_extensions as te
+
+T = t.TypeVar("T")
+P = te.ParamSpec("P")
+
+# set to "0" to use the default asyncio loop even if uvloop is installed
+UVLOOP_ENV = "SPY_UVLOOP"
+THREADPOOL_WORKERS_ENV = "SPY_THREADPOOL_WORKERS"
+DEFAULT_THREADPOOL_WORKERS = 8
+
+_loop: asyncio.AbstractEventLoop | None = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    if os.environ.get(UVLOOP_ENV) != "0":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop kept for the whole life of the process, so warm invocations reuse it
+    together with everything bound to it, e.g. connection pools of async clients.
+    """
+    global _loop  # noqa: PLW0603
+    if _loop is None or _loop.is_closed():
+        _loop = new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run_sync(coroutine: Coroutine[t.Any, t.Any, T]) -> T:
+    """
+    Runs coroutine to completion on the persistent event loop, instead of `asyncio.run` creating a new one.
+    """
+    return get_event_loop().run_until_complete(coroutine)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        max_workers = int(os.environ.get(THREADPOOL_WORKERS_ENV, DEFAULT_THREADPOOL_WORKERS))
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="spy-offload")
+    return _executor
+
+
+async def run_in_threadpool(function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Awaits blocking `function` run in a bounded thread pool, so the event loop keeps serving other coroutines.
+    """
+    context = contextvars.copy_context()
+    call = partial(context.run, function, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), call)  # type: ignore
+
+
+def offload(function: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+    """
+    Turns blocking function into an awaitable one run by `run_in_threadpool`.
+    """
+
+    @wraps(function)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return await run_in_threadpool(function, *args, **kwargs)
+
+    return wrapper
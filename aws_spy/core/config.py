@@ -0,0 +1,305 @@
+import os
+import typing as t
+from enum import Enum
+from pathlib import Path
+
+import typing_extensions as te
+from pydantic import BaseModel, Field, model_validator
+
+from aws_spy.core.batch import SpyBatchFunction, SpyDynamoDBStreamFunction, SpySQSFunction, SpyStreamFunction
+from aws_spy.core.schemas import Methods, SpyFunction, SpyRoute
+from aws_spy.dispatch import ROUTER_ENV
+
+MANDATORY_PLUGINS = [
+    "serverless-python-requirements",
+    "serverless-plugin-common-excludes",
+    "serverless-plugin-include-dependencies",
+]
+# every architecture has its own layer stack, see aws_spy/layer/spy-layer.yml
+SPY_LAYER_STACK = "spy-layer"
+SPY_LAYER_EXPORT = "ServerlesspyLayerExport"
+
+
+class Functions(str, Enum):
+    BENCH = "bench"
+    DEPLOY = "deploy"
+    LAYER = "layer"
+    # OPENAPI = "openapi"
+    SLS = "sls"
+
+
+def get_spy_layer_stack(architecture: str) -> str:
+    return f"{SPY_LAYER_STACK}-{architecture}"
+
+
+class _CloudFormationRef(BaseModel):
+    stack_name: str
+    export_name: str
+
+    def __str__(self: te.Self) -> str:
+        return f"${{cf:{self.stack_name}-${{opt:stage}}.{self.export_name}}}"
+
+
+class CloudFormationRef(_CloudFormationRef):
+    def __new__(cls: type[te.Self], stack_name: str, export_name: str) -> str:  # type: ignore
+        instance = _CloudFormationRef(stack_name=stack_name, export_name=export_name)
+        return str(instance)
+
+
+class _JSONFileRef(BaseModel):
+    file_path: str
+    field: str
+
+    def __str__(self: te.Self) -> str:
+        return f"${{file({self.file_path}):{self.field}}}"
+
+
+class JSONFileRef(_JSONFileRef):
+    def __new__(cls: type[te.Self], file_path: str, field: str) -> str:  # type: ignore
+        instance = _JSONFileRef(file_path=file_path, field=field)
+        return str(instance)
+
+
+def build_cognito_issue_url(user_pool_id: str | CloudFormationRef | JSONFileRef) -> str:
+    return f"https://cognito-idp.${{region}}.amazonaws.com/{user_pool_id}"
+
+
+class Authorizer(BaseModel):
+    type: t.Literal["jwt"] = Field("jwt", frozen=True)  # noqa: A003
+    identitySource: str = "$request.header.Authorization"  # noqa: N815
+    issuerUrl: str  # noqa: N815
+    audience: list[str | CloudFormationRef | JSONFileRef]
+
+
+class CORS(BaseModel):
+    allowedHeaders: list[str]  # noqa: N815
+    exposedResponseHeaders: list[str]  # noqa: N815
+    allowedMethods: list[str]  # noqa: N815
+    allowedOrigins: list[str]  # noqa: N815
+
+
+class HTTPApi(BaseModel):
+    authorizers: dict[str, Authorizer] | None = Field(None)
+    cors: CORS | None = Field(None)
+
+
+class VPC(BaseModel):
+    securityGroupIds: list[str | CloudFormationRef | JSONFileRef]  # noqa: N815
+    subnetIds: list[str | CloudFormationRef | JSONFileRef]  # noqa: N815
+
+
+def split_path(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def is_caught(path: str, catch_all_path: str) -> bool:
+    """
+    Whether requests to the path may be routed to the catch-all path, path parameters match any segment.
+    """
+    segments = split_path(path)
+    catch_all_segments = split_path(catch_all_path)
+    if catch_all_segments[-1:] == ["{proxy+}"]:
+        catch_all_segments = catch_all_segments[:-1]
+        if len(segments) <= len(catch_all_segments):
+            return False
+    elif len(segments) != len(catch_all_segments):
+        return False
+    return all(
+        segment == catch_all_segment or segment.startswith("{")
+        for segment, catch_all_segment in zip(segments, catch_all_segments, strict=False)
+    )
+
+
+class Function(BaseModel):
+    handler: str
+    module: str
+    events: list[dict[str, t.Any]] | None = Field(None)
+    layers: list[str | CloudFormationRef | JSONFileRef]
+    environment: dict[str, t.Any] | None = Field(None)
+    package: dict[str, t.Any] | None = Field(None)
+
+    @staticmethod
+    def generate_rel_path_for_function(route: SpyRoute) -> str:
+        return os.path.relpath(Path(route.handler.__code__.co_filename), Path().resolve())
+
+    @staticmethod
+    def build_handler_string(relative_path: str, function_name: str) -> str:
+        return relative_path.split(os.sep)[-1].replace(".py", "") + f".{function_name}"
+
+    @staticmethod
+    def build_module_string(relative_path: str) -> str:
+        return "/".join(relative_path.split(os.sep)[:-1])
+
+    @staticmethod
+    def build_layers(
+        layers: list[str | CloudFormationRef | JSONFileRef], architecture: str = "arm64"
+    ) -> list[str | CloudFormationRef | JSONFileRef]:
+        # deduplicated in a stable order, so regenerated files don't trigger CloudFormation updates
+        spy_layer = CloudFormationRef(stack_name=get_spy_layer_stack(architecture), export_name=SPY_LAYER_EXPORT)
+        return list(dict.fromkeys([spy_layer, *layers]))
+
+    @classmethod
+    def from_function(
+        cls: type[te.Self], *, function: SpyFunction, architecture: str = "arm64"
+    ) -> te.Self:  # type: ignore
+        rel_path = cls.generate_rel_path_for_function(function)
+        return cls(
+            handler=cls.build_handler_string(rel_path, function.handler.__name__),
+            module=cls.build_module_string(rel_path),
+            events=cls.build_function_events(function),
+            layers=cls.build_layers(function.layers, architecture),  # type: ignore
+        )
+
+    @staticmethod
+    def build_batch_event(function: SpyBatchFunction) -> dict[str, t.Any]:
+        return {
+            "batchSize": function.batch_size,
+            "maximumBatchingWindow": function.maximum_batching_window,
+            "functionResponseType": "ReportBatchItemFailures",
+        }
+
+    @classmethod
+    def build_function_events(cls: type[te.Self], function: SpyFunction) -> list[dict[str, t.Any]] | None:
+        if isinstance(function, SpySQSFunction):
+            return [{"sqs": {"arn": function.queue, **cls.build_batch_event(function)}}]
+        if isinstance(function, SpyStreamFunction):
+            stream = {
+                "type": "dynamodb" if isinstance(function, SpyDynamoDBStreamFunction) else "kinesis",
+                "arn": function.stream,
+                "startingPosition": function.starting_position,
+                **cls.build_batch_event(function),
+            }
+            return [{"stream": stream}]
+        return None
+
+    @staticmethod
+    def build_module_import_path(relative_path: str) -> str:
+        return relative_path.removesuffix(".py").replace(os.sep, ".")
+
+    @staticmethod
+    def build_catch_all_paths(paths: list[str]) -> list[str]:
+        """
+        Paths catching all given paths, under their longest common static prefix.
+        """
+        split_paths = [split_path(path) for path in paths]
+        prefix: list[str] = []
+        for segments in zip(*split_paths, strict=False):
+            if len(set(segments)) > 1 or segments[0].startswith("{"):
+                break
+            prefix.append(segments[0])
+
+        prefix_path = "/" + "/".join(prefix)
+        catch_all_paths = []
+        if any(len(segments) == len(prefix) for segments in split_paths):
+            catch_all_paths.append(prefix_path)
+        if any(len(segments) > len(prefix) for segments in split_paths):
+            catch_all_paths.append(prefix_path.rstrip("/") + "/{proxy+}")
+        return catch_all_paths
+
+    @staticmethod
+    def build_catch_all_events(paths: list[str], authorizer: str | None) -> list[dict[str, t.Any]]:
+        """
+        httpApi events catching all given paths, see `build_catch_all_paths`.
+        """
+        events = []
+        for event_path in Function.build_catch_all_paths(paths):
+            http_api_event: dict[str, t.Any] = {"path": event_path, "method": "*"}
+            if authorizer:
+                http_api_event["authorizer"] = {"name": authorizer}
+            events.append({"httpApi": http_api_event})
+        return events
+
+    @classmethod
+    def from_router(
+        cls: type[te.Self],
+        *,
+        name: str,
+        routes: list[tuple[str, Methods, SpyRoute]],
+        other_paths: list[str] | None = None,
+        architecture: str = "arm64",
+    ) -> te.Self:
+        """
+        Router Lambda serving all given routes, see aws_spy.dispatch.
+        `other_paths` are served by other router Lambdas, routes are declared one by one when catch-all events
+        would catch any of them, or if routes have different authorizers.
+        """
+        paths = [path for path, _, _ in routes]
+        layers = [layer for _, _, route in routes for layer in route.layers]
+        authorizers = {route.authorizer for _, _, route in routes}
+        catch_all_paths = cls.build_catch_all_paths(paths)
+        if len(authorizers) == 1 and not any(
+            is_caught(path, catch_all_path) for path in other_paths or [] for catch_all_path in catch_all_paths
+        ):
+            events = cls.build_catch_all_events(paths, authorizers.pop())
+        else:
+            events = [
+                event for path, method, route in routes for event in cls.build_http_api_events(route, path, method)
+            ]
+
+        return cls(
+            handler="aws_spy.dispatch.handler",
+            module=".",
+            events=events,
+            layers=cls.build_layers(layers, architecture),  # type: ignore
+            environment={ROUTER_ENV: name},
+        )
+
+    @staticmethod
+    def build_http_api_event(route: SpyRoute, path: str, method: Methods | str) -> dict[str, t.Any]:
+        http_api_event: dict[str, t.Any] = {"path": path, "method": method.upper()}
+        if route.authorizer:
+            http_api_event["authorizer"] = {"name": route.authorizer}
+        return http_api_event
+
+    @classmethod
+    def build_http_api_events(
+        cls: type[te.Self], route: SpyRoute, path: str, method: Methods
+    ) -> list[dict[str, t.Any]]:
+        events = [{"httpApi": cls.build_http_api_event(route, path, method)}]
+        if route.etag:
+            # conditional GET routes answer HEAD requests too
+            events.append({"httpApi": cls.build_http_api_event(route, path, "head")})
+        return events
+
+    @classmethod
+    def from_route(
+        cls: type[te.Self], *, route: SpyRoute, path: str, method: Methods, architecture: str = "arm64"
+    ) -> te.Self:  # type: ignore
+        rel_path = cls.generate_rel_path_for_function(route)
+        return cls(
+            handler=cls.build_handler_string(rel_path, route.handler.__name__),
+            module=cls.build_module_string(rel_path),
+            events=cls.build_http_api_events(route, path, method),
+            layers=cls.build_layers(route.layers, architecture),  # type: ignore
+        )
+
+
+class Provider(BaseModel):
+    name: t.Literal["aws"] = Field("aws", frozen=True)
+    runtime: t.Literal["python3.10"] = Field("python3.10", frozen=True)
+    region: str = "eu-central-1"
+    architecture: t.Literal["arm64", "x86_64"] = Field("arm64")
+    role: str | CloudFormationRef | JSONFileRef | None = Field(None)
+    httpApi: HTTPApi | None = Field(None)  # noqa: N815
+    vpc: VPC | None = Field(None)
+
+
+class ServerlessConfig(BaseModel):
+    service: str
+    custom: dict[str, t.Any] | None = Field(None)
+    plugins: list[str]
+    configValidationMode: t.Literal["error", "warn"] = Field("warn", frozen=True)  # noqa: N815
+    provider: Provider
+    package: dict[str, bool] = Field({"individually": True})
+    functions: dict[str, Function] | None = Field(None)
+
+    @model_validator(mode="before")
+    def set_default_plugins(  # type: ignore
+        cls: type[te.Self],  # noqa: N805
+        values: dict[str, t.Any],
+    ) -> dict[str, t.Any]:
+        provided_plugins = values.get("plugins")
+        provided_plugins = provided_plugins if provided_plugins is not None else []
+        values["plugins"] = list(dict.fromkeys(provided_plugins + MANDATORY_PLUGINS))
+
+        return values
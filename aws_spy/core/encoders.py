@@ -1,18 +1,208 @@
 import datetime
 import json
 import typing as t
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from decimal import Decimal
+from functools import cache
 from uuid import UUID
 
+import pydantic_core
+import typing_extensions as te
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 T = t.TypeVar("T")
+JSONBackendName = t.Literal["stdlib", "orjson", "pydantic-core", "auto"]
+
+ENCODERS: dict[type, Callable[[t.Any], t.Any]] = {
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    UUID: str,
+    Decimal: float,
+}
+
+
+def register_encoder(type_: type[T], encoder: Callable[[T], t.Any]) -> None:
+    """
+    Encoder of a type JSON backends can't serialize on their own.
+    All backends use it, except the pydantic-core one for types it handles natively
+    (e.g. UUID, Decimal, enums) and orjson for UUID.
+    """
+    ENCODERS[type_] = encoder
+    _find_encoder.cache_clear()
+
+
+@cache
+def _find_encoder(type_: type) -> Callable[[t.Any], t.Any] | None:
+    for base in type_.__mro__:
+        if base in ENCODERS:
+            return ENCODERS[base]
+    return None
+
+
+def encode_default(o: t.Any) -> t.Any:
+    encoder = ENCODERS.get(type(o)) or _find_encoder(type(o))
+    if encoder is None:
+        msg = f"Object of type {type(o).__name__} is not JSON serializable"
+        raise TypeError(msg)
+    return encoder(o)
 
 
 class JSONEncoder(json.JSONEncoder):
     def default(self, o: T) -> T | str | float:
-        if isinstance(o, datetime.datetime | datetime.date):
-            return o.isoformat()
-        elif isinstance(o, UUID):
-            return str(o)
-        elif isinstance(o, Decimal):
-            return float(o)
-        return super().default(o)  # pragma: no cover
+        try:
+            return encode_default(o)
+        except TypeError:
+            return super().default(o)  # pragma: no cover
+
+
+class JSONBackend(ABC):
+    name: t.ClassVar[str]
+
+    def __init__(self: te.Self, *, compact: bool = False) -> None:
+        self.compact = compact
+
+    @abstractmethod
+    def dumps(self: te.Self, obj: t.Any) -> str:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def loads(self: te.Self, data: str | bytes) -> t.Any:
+        raise NotImplementedError  # pragma: no cover
+
+    def dumps_model(self: te.Self, serializer: "ModelSerializer", data: t.Any) -> str:
+        """
+        Models are dumped to Python objects first, so their output is the same as `dumps` output of a dict.
+        """
+        return self.dumps(serializer.to_python(data))
+
+
+class StdlibJSONBackend(JSONBackend):
+    name = "stdlib"
+
+    def __init__(self: te.Self, *, compact: bool = False) -> None:
+        super().__init__(compact=compact)
+        self.separators = (",", ":") if compact else None
+
+    def dumps(self: te.Self, obj: t.Any) -> str:
+        return json.dumps(obj, default=encode_default, ensure_ascii=False, separators=self.separators)
+
+    def loads(self: te.Self, data: str | bytes) -> t.Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    orjson output is always compact. UUID is handled natively, the remaining types (including datetime,
+    date and Decimal) go through the ENCODERS table, so they are written the same as by the stdlib backend.
+    """
+
+    name = "orjson"
+
+    def __init__(self: te.Self, *, compact: bool = True) -> None:
+        if orjson is None:
+            msg = 'Could not import "orjson". Install it to use the orjson JSON backend.'
+            raise ImportError(msg)
+        super().__init__(compact=compact)
+        self.option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self: te.Self, obj: t.Any) -> str:
+        return orjson.dumps(obj, default=encode_default, option=self.option).decode()
+
+    def loads(self: te.Self, data: str | bytes) -> t.Any:
+        return orjson.loads(data)
+
+
+class PydanticCoreJSONBackend(JSONBackend):
+    """
+    pydantic-core output is always compact. Types known to pydantic-core are handled natively,
+    so unlike other backends it writes Decimal as a string, the ENCODERS table is used as a fallback.
+    """
+
+    name = "pydantic-core"
+
+    def dumps(self: te.Self, obj: t.Any) -> str:
+        return pydantic_core.to_json(obj, fallback=encode_default).decode()
+
+    def dumps_model(self: te.Self, serializer: "ModelSerializer", data: t.Any) -> str:
+        # straight to JSON with the model's compiled serializer, without intermediate Python objects
+        return serializer.to_json(data)
+
+    def loads(self: te.Self, data: str | bytes) -> t.Any:
+        return pydantic_core.from_json(data)
+
+
+JSON_BACKENDS: dict[str, type[JSONBackend]] = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonBackend.name: OrjsonBackend,
+    PydanticCoreJSONBackend.name: PydanticCoreJSONBackend,
+}
+
+_json_backend: JSONBackend = StdlibJSONBackend()
+
+
+def build_json_backend(name: JSONBackendName, *, compact: bool = False) -> JSONBackend:
+    if name == "auto":
+        name = OrjsonBackend.name if orjson is not None else PydanticCoreJSONBackend.name
+    return JSON_BACKENDS[name](compact=compact)
+
+
+def set_json_backend(backend: JSONBackend | JSONBackendName, *, compact: bool = False) -> None:
+    global _json_backend  # noqa: PLW0603
+    _json_backend = backend if isinstance(backend, JSONBackend) else build_json_backend(backend, compact=compact)
+
+
+def get_json_backend() -> JSONBackend:
+    return _json_backend
+
+
+class ModelSerializer:
+    """
+    JSON serializer bound to a single model class.
+    Uses the model's compiled pydantic-core validator and serializer,
+    so data goes to a JSON string without an intermediate dict.
+    """
+
+    __slots__ = ("model_class", "validator", "serializer")
+
+    def __init__(self: te.Self, model_class: type[BaseModel]) -> None:
+        self.model_class = model_class
+        self.validator = model_class.__pydantic_validator__
+        self.serializer = model_class.__pydantic_serializer__
+
+    def to_json(self: te.Self, data: t.Any) -> str:
+        if not isinstance(data, self.model_class):
+            # dicts and foreign models (read by attributes) in a single validation pass
+            data = self.validator.validate_python(data, from_attributes=True)
+        return self.serializer.to_json(data).decode()
+
+    def to_python(self: te.Self, data: t.Any) -> t.Any:
+        if not isinstance(data, self.model_class):
+            data = self.validator.validate_python(data, from_attributes=True)
+        return self.serializer.to_python(data)
+
+    def to_jsonable(self: te.Self, data: t.Any) -> t.Any:
+        """
+        Same as `to_json`, but to JSON compatible Python objects, e.g. for Lambda returning them itself.
+        """
+        if not isinstance(data, self.model_class):
+            data = self.validator.validate_python(data, from_attributes=True)
+        return self.serializer.to_python(data, mode="json")
+
+
+@cache
+def get_model_serializer(model_class: type[BaseModel]) -> ModelSerializer:
+    return ModelSerializer(model_class)
+
+
+@cache
+def get_type_adapter(type_: t.Any) -> TypeAdapter:
+    """
+    Validator of any type pydantic understands, built once per type as building one compiles its schema.
+    """
+    return TypeAdapter(type_)
@@ -0,0 +1,68 @@
+import hashlib
+import typing as t
+
+from aws_spy.core.compression import get_header
+from aws_spy.core.event_utils import get_request_method
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+
+def compute_etag(body: str | bytes) -> str:
+    """
+    Strong ETag of a serialized body, a fast non-cryptographic hash is enough to tell representations apart.
+    """
+    data = body.encode() if isinstance(body, str) else body
+    if xxhash is not None:
+        return f'"{xxhash.xxh3_64_hexdigest(data)}"'
+    # a 128-bit digest, a 32-bit checksum collides across versions of a resource and answers 304 wrongly
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def quote_etag(token: str) -> str:
+    if token.startswith(('"', 'W/"')):
+        return token
+    return f'"{token}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison, as If-None-Match requires.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
+
+
+def is_head_request(event: dict[str, t.Any]) -> bool:
+    return get_request_method(event).upper() == "HEAD"
+
+
+def not_modified(event: dict[str, t.Any], response: dict[str, t.Any]) -> dict[str, t.Any] | None:
+    """
+    Bodiless 304 when the client already holds the response's representation.
+    """
+    headers = response.get("headers") or {}
+    etag = headers.get("ETag")
+    if etag is None or not etag_matches(get_header(event.get("headers"), "If-None-Match"), etag):
+        return None
+    return build_not_modified(etag, headers)
+
+
+def build_not_modified(etag: str, headers: dict[str, t.Any] | None = None) -> dict[str, t.Any]:
+    not_modified_headers = {"ETag": etag}
+    if headers and "Cache-Control" in headers:
+        not_modified_headers["Cache-Control"] = headers["Cache-Control"]
+    return {"statusCode": 304, "headers": not_modified_headers, "body": ""}
+
+
+def strip_body(response: dict[str, t.Any]) -> dict[str, t.Any]:
+    """
+    Response to a HEAD request, same headers as for GET.
+    """
+    return {**response, "body": "", "isBase64Encoded": False}
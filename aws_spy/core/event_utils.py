@@ -1,13 +1,23 @@
-import json
 import typing as t
+from functools import cache
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from aws_spy.core.schemas_utils import ParamSchema
+from aws_spy.core.schemas_utils import ParamSchema, get_annotation_name
 
 RequestBodyType = t.TypeVar("RequestBodyType", bound=BaseModel)
 
 
+def get_request_method(event: dict[str, t.Any]) -> str:
+    http = event.get("requestContext", {}).get("http")
+    return http["method"] if http is not None else event.get("httpMethod", "")  # payload 1.0
+
+
+@cache
+def get_param_adapter(annotation: t.Any) -> TypeAdapter[t.Any]:
+    return TypeAdapter(annotation)
+
+
 def export_params_from_event(
     in_event_params: dict[str, t.Any] | None,
     expected_params: list[ParamSchema],
@@ -22,34 +32,39 @@ def export_params_from_event(
             errors.append(f"Required parameter {expected_param.name} not found in {type_}.")
             continue
         try:
-            param = expected_param.annotation(param) if param is not None else None
-        except ValueError:
-            errors.append(f"{expected_param.name} should be {expected_param.annotation.__name__} type.")
+            param = get_param_adapter(expected_param.annotation).validate_python(param) if param is not None else None
+        except ValidationError:
+            errors.append(f"{expected_param.name} should be {get_annotation_name(expected_param.annotation)} type.")
             continue
         args[expected_param.arg_name] = param
 
     return args, errors
 
 
+def translate_validation_error(error: ValidationError) -> list[str]:
+    errors = []
+    for error_ in error.errors():
+        if error_["type"].startswith("type_error"):
+            errors.append(f'Wrong type received at: {error_["loc"][0]}. Expected: {error_["type"].split(".")[-1]}')
+            continue
+        if error_["type"].endswith("missing"):
+            errors.append(f'Value not found at: {error_["loc"][0]}')
+            continue
+        errors.append(f"Unknown error: {error_}")  # pragma: no cover
+    return errors
+
+
 def export_request_body(
-    body: str, request_body_class: type[RequestBodyType]
+    body: str | bytes | None, request_body_class: type[RequestBodyType]
 ) -> tuple[RequestBodyType | dict[str, t.Any] | None, list[str]]:
-    try:
-        body = json.loads(body)
-    except json.JSONDecodeError:
+    if not body:
         return None, ["Request body is empty!"]
     try:
-        request_body = request_body_class.model_validate(body)
+        # validated straight from the raw JSON, without building an intermediate dict
+        request_body = request_body_class.model_validate_json(body)
     except ValidationError as e:
-        errors = []
-        for error in e.errors():
-            if error["type"].startswith("type_error"):
-                errors.append(f'Wrong type received at: {error["loc"][0]}. Expected: {error["type"].split(".")[-1]}')
-                continue
-            if error["type"].endswith("missing"):
-                errors.append(f'Value not found at: {error["loc"][0]}')
-                continue
-            errors.append(f"Unknown error: {error}")  # pragma: no cover
-        return None, errors
+        if e.error_count() == 1 and e.errors()[0]["type"] == "json_invalid":
+            return None, ["Request body is empty!"]
+        return None, translate_validation_error(e)
 
     return request_body, []
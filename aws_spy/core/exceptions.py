@@ -25,3 +25,11 @@ class BaseSpyError(Exception):
         # for ErrorResponse
         self.status_code = status_code
         self.additional_headers = additional_headers
+
+
+class RequestBodyTooLargeError(ValueError):
+    ...
+
+
+class UnsupportedContentEncodingError(ValueError):
+    ...
@@ -0,0 +1,107 @@
+import hashlib
+import marshal
+import os
+import typing as t
+from collections.abc import Iterable
+from functools import cache
+
+from aws_spy.core.params import Param
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from aws_spy.core.schemas import LH, SpyRoute
+
+MANIFEST_FILE_NAME = "spy_manifest.marshal"
+MANIFEST_VERSION = 1
+
+ManifestEntry = dict[str, t.Any]
+# method, path, handler's module, handler's name
+DispatchEntry = tuple[str, str, str, str]
+
+
+def _describe_default(default: t.Any) -> str:
+    if isinstance(default, Param):
+        return f"{type(default).__name__}({default.name!r})"
+    return type(default).__qualname__
+
+
+def fingerprint(handler: "LH", path: str, method: str) -> str | None:
+    """
+    Hash of everything route introspection depends on, a manifest entry is used only when it matches.
+    """
+    code = getattr(handler, "__code__", None)
+    if code is None:
+        return None
+    defaults = (*(handler.__defaults__ or ()), *(handler.__kwdefaults__ or {}).values())
+    parts = [
+        handler.__module__,
+        handler.__qualname__,
+        path,
+        getattr(method, "value", method),
+        repr(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]),
+        *(f"{name}:{annotation!r}" for name, annotation in handler.__annotations__.items()),
+        *(_describe_default(default) for default in defaults),
+    ]
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def build_manifest_entry(route: "SpyRoute") -> ManifestEntry:
+    return {
+        # params of dependencies are not handler's ones, such routes are always introspected
+        "fingerprint": fingerprint(route.handler, route.path, route.method) if not route.dependencies else None,
+        "add_event": route.add_event,
+        "add_context": route.add_context,
+        "request_body_arg_name": route.request_body_arg_name,
+        "params": [
+            (param_type, param.name, param.arg_name)
+            for param_type, params in (
+                ("path", route.path_params),
+                ("header", route.header_params),
+                ("query", route.query_params),
+            )
+            for param in params
+        ],
+    }
+
+
+def write_manifest(
+    routes: Iterable["SpyRoute"], path: str, dispatch: dict[str, list[DispatchEntry]] | None = None
+) -> None:
+    """
+    `dispatch` holds routes served by router Lambdas, per router function name, see aws_spy.dispatch.
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "routes": {route.name: build_manifest_entry(route) for route in routes},
+        "dispatch": dispatch or {},
+    }
+    with open(path, "wb") as file:
+        marshal.dump(manifest, file)
+
+
+def get_manifest_path() -> str | None:
+    path = os.environ.get("SPY_MANIFEST")
+    if path is None and "LAMBDA_TASK_ROOT" in os.environ:
+        path = os.path.join(os.environ["LAMBDA_TASK_ROOT"], MANIFEST_FILE_NAME)
+    return path
+
+
+@cache
+def load_manifest() -> dict[str, t.Any]:
+    path = get_manifest_path()
+    if path is None:
+        return {}
+    try:
+        with open(path, "rb") as file:
+            manifest = marshal.load(file)  # noqa: S302
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def get_manifest_entry(name: str, handler: "LH", path: str, method: str) -> ManifestEntry | None:
+    entry = load_manifest().get("routes", {}).get(name)
+    if entry is None or entry["fingerprint"] is None or entry["fingerprint"] != fingerprint(handler, path, method):
+        return None
+    return entry
@@ -0,0 +1,138 @@
+import json
+import sys
+import threading
+import time
+import typing as t
+
+import typing_extensions as te
+from pydantic import BaseModel, Field
+
+# CloudWatch accepts at most 100 values per metric in a single EMF document
+MAX_AGGREGATED_VALUES = 100
+
+_cold_start = True
+
+
+class Metrics(BaseModel):
+    namespace: str = Field("aws-spy")
+    # invocations aggregated into one log line, 1 writes a line per invocation
+    flush_every: int = Field(1, ge=1, le=MAX_AGGREGATED_VALUES)
+    server_timing: bool = Field(False)
+
+
+def pop_cold_start() -> bool:
+    """
+    True for the first recorded invocation of the process only.
+    """
+    global _cold_start
+    cold_start, _cold_start = _cold_start, False
+    return cold_start
+
+
+class PhaseTimer:
+    """
+    Durations (ns) of consecutive invocation phases, each lap ends one phase and starts the next.
+    """
+
+    __slots__ = ("start", "mark", "phases")
+
+    def __init__(self: te.Self) -> None:
+        self.start = self.mark = time.perf_counter_ns()
+        self.phases: dict[str, int] = {}
+
+    def lap(self: te.Self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        self.phases[phase] = now - self.mark
+        self.mark = now
+
+    def stop(self: te.Self) -> dict[str, int]:
+        self.phases["total"] = time.perf_counter_ns() - self.start
+        return self.phases
+
+
+def to_milliseconds(duration: int) -> float:
+    return round(duration / 1_000_000, 3)
+
+
+def server_timing_header(phases: dict[str, int]) -> str:
+    return ", ".join(f"{phase};dur={to_milliseconds(duration)}" for phase, duration in phases.items())
+
+
+def build_emf_document(
+    namespace: str, route: str, status_code: t.Any, *, cold_start: bool, metrics: dict[str, t.Any]
+) -> dict[str, t.Any]:
+    """
+    CloudWatch Embedded Metric Format document, metric values are either numbers or lists of them.
+    """
+    return {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [["Route"]],
+                    "Metrics": [{"Name": name, "Unit": "Milliseconds"} for name in metrics],
+                }
+            ],
+        },
+        "Route": route,
+        "StatusCode": status_code,
+        "ColdStart": cold_start,
+        **metrics,
+    }
+
+
+class MetricsRecorder:
+    """
+    Writes phase timings of invocations to stdout as EMF log lines, CloudWatch turns them into metrics.
+    Aggregated invocations are buffered in memory, an environment shut down before a flush loses them.
+    """
+
+    def __init__(self: te.Self, config: Metrics, stream: t.TextIO | None = None) -> None:
+        self.config = config
+        self.stream = stream
+        self.pending: dict[str, list[tuple[t.Any, bool, dict[str, int]]]] = {}
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def record(self: te.Self, route: str, status_code: t.Any, phases: dict[str, int]) -> None:
+        cold_start = pop_cold_start()
+        if self.config.flush_every == 1:
+            metrics = {phase: to_milliseconds(duration) for phase, duration in phases.items()}
+            self.write(
+                [build_emf_document(self.config.namespace, route, status_code, cold_start=cold_start, metrics=metrics)]
+            )
+            return
+
+        with self.lock:
+            self.pending.setdefault(route, []).append((status_code, cold_start, phases))
+            self.count += 1
+            if self.count < self.config.flush_every:
+                return
+            pending, self.pending, self.count = self.pending, {}, 0
+        self.write([self.aggregate(route, invocations) for route, invocations in pending.items()])
+
+    def flush(self: te.Self) -> None:
+        with self.lock:
+            pending, self.pending, self.count = self.pending, {}, 0
+        self.write([self.aggregate(route, invocations) for route, invocations in pending.items()])
+
+    def aggregate(self: te.Self, route: str, invocations: list[tuple[t.Any, bool, dict[str, int]]]) -> dict[str, t.Any]:
+        metrics: dict[str, list[float]] = {}
+        for _, _, phases in invocations:
+            for phase, duration in phases.items():
+                metrics.setdefault(phase, []).append(to_milliseconds(duration))
+        return build_emf_document(
+            self.config.namespace,
+            route,
+            [status_code for status_code, _, _ in invocations],
+            cold_start=any(cold_start for _, cold_start, _ in invocations),
+            metrics=metrics,
+        )
+
+    def write(self: te.Self, documents: list[dict[str, t.Any]]) -> None:
+        if not documents:
+            return
+        stream = self.stream or sys.stdout
+        stream.write("".join(json.dumps(document, separators=(",", ":")) + "\n" for document in documents))
+        stream.flush()
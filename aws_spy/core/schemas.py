@@ -3,29 +3,25 @@ import os
 import typing as t
 from collections.abc import Callable
 from enum import Enum
-from pathlib import Path
+from types import SimpleNamespace
 
 import typing_extensions as te
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from aws_spy.core.cache import ResponseCache
+from aws_spy.core.compression import Compression
 from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.manifest import get_manifest_entry
 from aws_spy.core.schemas_utils import (
     ParamSchema,
     get_path_param_names,
+    handler_args_from_manifest,
     resolve_handler_args,
 )
 
-# from aws_spy.dependencies import DependencySchema, get_dependencies
-
-
 LHReturnType = t.TypeVar("LHReturnType")
 LH = Callable[..., LHReturnType]  # Lambda Handler
 Decorator = Callable[[LH], LH]
-MANDATORY_PLUGINS = [
-    "serverless-python-requirements",
-    "serverless-plugin-common-excludes",
-    "serverless-plugin-include-dependencies",
-]
 
 
 class Methods(str, Enum):
@@ -45,45 +41,11 @@ DEFAULT_STATUS_CODES = {
 }
 
 
-class Functions(str, Enum):
-    LAYER = "layer"
-    # OPENAPI = "openapi"
-    SLS = "sls"
-
-
-class _CloudFormationRef(BaseModel):
-    stack_name: str
-    export_name: str
-
-    def __str__(self: te.Self) -> str:
-        return f"${{cf:{self.stack_name}-${{opt:stage}}.{self.export_name}}}"
-
-
-class CloudFormationRef(_CloudFormationRef):
-    def __new__(cls: type[te.Self], stack_name: str, export_name: str) -> str:  # type: ignore
-        instance = _CloudFormationRef(stack_name=stack_name, export_name=export_name)
-        return str(instance)
-
-
-class _JSONFileRef(BaseModel):
-    file_path: str
-    field: str
-
-    def __str__(self: te.Self) -> str:
-        return f"${{file({self.file_path}):{self.field}}}"
-
-
-class JSONFileRef(_JSONFileRef):
-    def __new__(cls: type[te.Self], file_path: str, field: str) -> str:  # type: ignore
-        instance = _JSONFileRef(file_path=file_path, field=field)
-        return str(instance)
-
-
 class SpyBaseModel(BaseModel):
     name: str
     handler: LH
     use_vpc: bool = Field(True)
-    layers: list[str | CloudFormationRef | JSONFileRef] | None = Field(default_factory=list)
+    layers: list[str] | None = Field(default_factory=list)
     add_event: bool = Field(default=False)
     add_context: bool = Field(default=False)
     skip_validation: bool = Field(default=False)
@@ -97,7 +59,58 @@ class SpyBaseModel(BaseModel):
 
 
 class SpyFunction(SpyBaseModel):
-    ...
+    plan: t.Any = Field(None, exclude=True, repr=False)  # runtime.FunctionPlan or batch.BatchPlan
+
+
+def get_event_model(handler: LH) -> type[BaseModel] | None:
+    """
+    Pydantic model or TypedDict annotated on function handler's first argument, events are validated into it.
+    """
+    _, annotation = get_first_param_annotation(handler)
+    if te.is_typeddict(annotation) or (inspect.isclass(annotation) and issubclass(annotation, BaseModel)):
+        return annotation
+    return None
+
+
+def is_flat_model(model: t.Any) -> bool:
+    if not (inspect.isclass(model) and issubclass(model, BaseModel)):
+        return False
+    for field in model.model_fields.values():
+        annotation = field.annotation
+        if t.get_origin(annotation) in (list, dict, set, frozenset, tuple):
+            return False
+        if inspect.isclass(annotation) and issubclass(annotation, BaseModel | list | dict | set | frozenset | tuple):
+            return False
+    return True
+
+
+def get_first_param_annotation(handler: LH) -> tuple[str | None, t.Any]:
+    """
+    Name and annotation of handler's first parameter, only that annotation is resolved.
+    Annotations of other parameters may be names imported under `TYPE_CHECKING` (e.g. `context: LambdaContext`),
+    an unresolvable one is treated as missing.
+    """
+    parameters = list(inspect.signature(handler).parameters.values())
+    if not parameters:
+        return None, None
+    name, annotation = parameters[0].name, parameters[0].annotation
+    if annotation is inspect.Parameter.empty:
+        return name, None
+    if isinstance(annotation, str):
+        try:
+            annotation = t.get_type_hints(
+                SimpleNamespace(__annotations__={name: annotation}), inspect.unwrap(handler).__globals__
+            )[name]
+        except NameError:
+            return name, None
+    return name, annotation
+
+
+def get_record_model(handler: LH) -> t.Any:
+    name, annotation = get_first_param_annotation(handler)
+    if name in (None, "record", "context"):
+        return None
+    return None if annotation in (None, str, t.Any) else annotation
 
 
 class SpyRoute(SpyBaseModel):
@@ -111,7 +124,18 @@ class SpyRoute(SpyBaseModel):
     header_params: list[ParamSchema] = Field(default_factory=list)
     path_params: list[ParamSchema] = Field(default_factory=list)
     query_params: list[ParamSchema] = Field(default_factory=list)
-    # dependencies: list[DependencySchema] = Field(default_factory=list)
+    compression: Compression | bool | None = Field(None)
+    cache: ResponseCache | bool | None = Field(None)
+    etag: bool = Field(default=False)
+    params_validator: t.Any = Field(None, exclude=True, repr=False)  # schemas_utils.ParamsValidator
+    plan: t.Any = Field(None, exclude=True, repr=False)  # runtime.RoutePlan, built by compile_route
+    metrics: t.Any = Field(None, exclude=True, repr=False)  # metrics.MetricsRecorder, timing is off without it
+    json_backend: t.Any = Field(None, exclude=True, repr=False)  # encoders.JSONBackend, process default if None
+    # handler argument -> dependencies.Dependency
+    dependencies: dict[str, t.Any] = Field(default_factory=dict, exclude=True, repr=False)
+
+    def materialize(self: te.Self) -> te.Self:
+        return self
 
     @model_validator(mode="before")
     def set_status_code(  # type: ignore
@@ -136,33 +160,48 @@ class SpyRoute(SpyBaseModel):
         path: str = model.path
         handler: LH = model.handler
 
-        path_params = get_path_param_names(path)
-        handler_args = resolve_handler_args(handler)
-        # values["dependencies"] = get_dependencies(handler)
-
-        args = inspect.signature(handler).parameters
-        args_count = len(args)
-        # exclude lambdas event and context from count
-        if "event" in args:
-            model.add_event = True
-            args_count -= 1
-        if "context" in args:
-            model.add_context = True
-            args_count -= 1
-        if handler_args.count != args_count and not model.skip_validation:
-            msg = f'Unrecognized params for {method.upper()} method on "{path}" path!'
-            raise RouteDefinitionError(msg)
-
-        for path_param in path_params:
-            if path_param not in handler_args.path.keys():
-                msg = f"You did not specify {path_param} in your handler arguments!"
-                raise RouteDefinitionError(msg)
-
-        for path_arg in handler_args.path.keys():
-            if path_arg not in path_params:
-                msg = f'Your {path_arg} path parameter is missing in {method.upper()} method on "{path}" path!'
+        manifest_entry = get_manifest_entry(model.name, handler, path, method)
+        if manifest_entry is not None:
+            # resolved and checked at build time, see aws_spy.core.manifest
+            handler_args = handler_args_from_manifest(handler, manifest_entry)
+            model.add_event = manifest_entry["add_event"]
+            model.add_context = manifest_entry["add_context"]
+        else:
+            path_params = get_path_param_names(path)
+            handler_args = resolve_handler_args(handler)
+
+            args = inspect.signature(handler).parameters
+            args_count = len(args)
+            # exclude lambdas event and context from count
+            if "event" in args:
+                model.add_event = True
+                args_count -= 1
+            if "context" in args:
+                model.add_context = True
+                args_count -= 1
+            if handler_args.count != args_count and not model.skip_validation:
+                msg = f'Unrecognized params for {method.upper()} method on "{path}" path!'
                 raise RouteDefinitionError(msg)
 
+            for path_param in path_params:
+                if path_param not in handler_args.path.keys():
+                    msg = f"You did not specify {path_param} in your handler arguments!"
+                    raise RouteDefinitionError(msg)
+
+            for path_arg in handler_args.path.keys():
+                if path_arg not in path_params:
+                    msg = f'Your {path_arg} path parameter is missing in {method.upper()} method on "{path}" path!'
+                    raise RouteDefinitionError(msg)
+
+        model.params_validator = handler_args.validator
+        model.dependencies = handler_args.dependencies
+        if model.cache and not model.skip_validation and (model.dependencies or model.add_event or model.add_context):
+            # cache keys are built from handler params only, anything else would be skipped by cache hits
+            msg = (
+                f'Responses of {method.upper()} method on "{path}" path can\'t be cached, '
+                "its handler takes dependencies, event or context!"
+            )
+            raise RouteDefinitionError(msg)
         if handler_args.request_body:
             model.request_body = handler_args.request_body
             model.request_body_arg_name = handler_args.request_body_arg_name
@@ -178,119 +217,97 @@ class SpyRoute(SpyBaseModel):
         return model
 
 
-def build_cognito_issue_url(user_pool_id: str | CloudFormationRef | JSONFileRef) -> str:
-    return f"https://cognito-idp.${{region}}.amazonaws.com/{user_pool_id}"
-
-
-class Authorizer(BaseModel):
-    type: t.Literal["jwt"] = Field("jwt", frozen=True)  # noqa: A003
-    identitySource: str = "$request.header.Authorization"  # noqa: N815
-    issuerUrl: str  # noqa: N815
-    audience: list[str | CloudFormationRef | JSONFileRef]
-
-
-class CORS(BaseModel):
-    allowedHeaders: list[str]  # noqa: N815
-    exposedResponseHeaders: list[str]  # noqa: N815
-    allowedMethods: list[str]  # noqa: N815
-    allowedOrigins: list[str]  # noqa: N815
-
-
-class HTTPApi(BaseModel):
-    authorizers: dict[str, Authorizer] | None = Field(None)
-    cors: CORS | None = Field(None)
-
-
-class VPC(BaseModel):
-    securityGroupIds: list[str | CloudFormationRef | JSONFileRef]  # noqa: N815
-    subnetIds: list[str | CloudFormationRef | JSONFileRef]  # noqa: N815
-
-
-class Function(BaseModel):
-    handler: str
-    module: str
-    events: list[dict[str, t.Any]] | None = Field(None)
-    layers: list[str | CloudFormationRef | JSONFileRef]
-    environment: dict[str, t.Any] | None = Field(None)
-
-    @staticmethod
-    def generate_rel_path_for_function(route: SpyRoute) -> str:
-        return os.path.relpath(Path(route.handler.__code__.co_filename), Path().resolve())
-
-    @staticmethod
-    def build_handler_string(relative_path: str, function_name: str) -> str:
-        return relative_path.split(os.sep)[-1].replace(".py", "") + f".{function_name}"
-
-    @staticmethod
-    def build_module_string(relative_path: str) -> str:
-        return "/".join(relative_path.split(os.sep)[:-1])
-
-    @staticmethod
-    def build_layers(
-        layers: list[str | CloudFormationRef | JSONFileRef],
-    ) -> list[str | CloudFormationRef | JSONFileRef]:
-        return list(
-            set(
-                [  # noqa: RUF005
-                    CloudFormationRef(
-                        stack_name="spy-layer",
-                        export_name="ServerlesspyLayerExport",
-                    )
-                ]
-                + layers,
+class RouteStub:
+    """
+    Cheap record of a route definition.
+    Validation and handler introspection happen only when the route is materialised.
+    """
+
+    __slots__ = ("name", "method", "path", "handler", "compression", "metrics", "json_backend", "options", "route")
+
+    def __init__(
+        self: te.Self,
+        *,
+        name: str,
+        method: Methods,
+        path: str,
+        handler: LH,
+        compression: Compression | bool | None = None,
+        **options: t.Any,
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.path = path
+        self.handler = handler
+        self.compression = compression
+        self.metrics: t.Any = None
+        self.json_backend: t.Any = None
+        self.options = options
+        self.route: SpyRoute | None = None
+
+    @property
+    def plan(self: te.Self) -> t.Any:
+        return self.route.plan if self.route is not None else None
+
+    def materialize(self: te.Self) -> SpyRoute:
+        if self.route is None:
+            self.route = SpyRoute(
+                name=self.name,
+                method=self.method,
+                path=self.path,
+                handler=self.handler,
+                compression=self.compression,
+                metrics=self.metrics,
+                json_backend=self.json_backend,
+                **self.options,
             )
-        )
-
-    @classmethod
-    def from_function(cls: type[te.Self], *, function: SpyFunction) -> te.Self:  # type: ignore
-        rel_path = cls.generate_rel_path_for_function(function)
-        return cls(
-            handler=cls.build_handler_string(rel_path, function.handler.__name__),
-            module=cls.build_module_string(rel_path),
-            layers=cls.build_layers(function.layers),  # type: ignore
-        )
-
-    @classmethod
-    def from_route(cls: type[te.Self], *, route: SpyRoute, path: str, method: Methods) -> te.Self:  # type: ignore
-        rel_path = cls.generate_rel_path_for_function(route)
-        http_api_event: dict[str, t.Any] = {"path": path, "method": method.upper()}
-        if route.authorizer:
-            http_api_event["authorizer"] = {"name": route.authorizer}
-
-        return cls(
-            handler=cls.build_handler_string(rel_path, route.handler.__name__),
-            module=cls.build_module_string(rel_path),
-            events=[{"httpApi": http_api_event}],
-            layers=cls.build_layers(route.layers),  # type: ignore
-        )
-
-
-class Provider(BaseModel):
-    name: t.Literal["aws"] = Field("aws", frozen=True)
-    runtime: t.Literal["python3.10"] = Field("python3.10", frozen=True)
-    region: str = "eu-central-1"
-    architecture: t.Literal["arm64", "x86_64"] = Field("arm64", frozen=True)  # pydantic_core
-    role: str | CloudFormationRef | JSONFileRef | None = Field(None)
-    httpApi: HTTPApi | None = Field(None)  # noqa: N815
-    vpc: VPC | None = Field(None)
-
-
-class ServerlessConfig(BaseModel):
-    service: str
-    custom: dict[str, t.Any] | None = Field(None)
-    plugins: list[str]
-    configValidationMode: t.Literal["error", "warn"] = Field("warn", frozen=True)  # noqa: N815
-    provider: Provider
-    package: dict[str, bool] = Field({"individually": True})
-    functions: dict[str, Function] | None = Field(None)
+        return self.route
+
+
+def is_lambda_handler(handler: LH) -> bool:
+    """
+    Whether the handler is the entrypoint of the running Lambda, based on the `_HANDLER`
+    variable set by the runtime, e.g. "users.get_user" for get_user defined in users.py.
+    """
+    lambda_handler = os.environ.get("_HANDLER")
+    if not lambda_handler:
+        return False
+    module_name, _, function_name = lambda_handler.rpartition(".")
+    return handler.__name__ == function_name and handler.__module__.rpartition(".")[-1] == module_name.split("/")[-1]
+
+
+def should_defer_routes() -> bool:
+    """
+    Routes are deferred inside Lambda, where a single one is served, and validated eagerly elsewhere
+    (CLI, tests). `SPY_DEFER_ROUTES` set to "1" or "0" overrides the detection.
+    """
+    defer_routes = os.environ.get("SPY_DEFER_ROUTES")
+    if defer_routes is not None:
+        return defer_routes == "1"
+    return "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+
+# deploy-time models used to live here, they are imported from aws_spy.core.config only when asked for
+_CONFIG_NAMES = (
+    "MANDATORY_PLUGINS",
+    "Functions",
+    "CloudFormationRef",
+    "JSONFileRef",
+    "build_cognito_issue_url",
+    "Authorizer",
+    "CORS",
+    "HTTPApi",
+    "VPC",
+    "Function",
+    "Provider",
+    "ServerlessConfig",
+)
 
-    @model_validator(mode="before")
-    def set_default_plugins(  # type: ignore
-        cls: type[te.Self],  # noqa: N805
-        values: dict[str, t.Any],
-    ) -> dict[str, t.Any]:
-        provided_plugins = values.get("plugins")
-        provided_plugins = provided_plugins if provided_plugins is not None else []
-        values["plugins"] = list(set(provided_plugins + MANDATORY_PLUGINS))
 
-        return values
+def __getattr__(name: str) -> t.Any:
+    if name not in _CONFIG_NAMES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    from aws_spy.core import config
+
+    return getattr(config, name)
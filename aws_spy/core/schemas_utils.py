@@ -5,20 +5,28 @@ from collections.abc import Callable
 from enum import Enum
 
 import typing_extensions as te
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import SchemaValidator
 
 from aws_spy.core import types
 from aws_spy.core.exceptions import RouteDefinitionError
-from aws_spy.core.params import Param, ParamType
+from aws_spy.core.params import HeaderClass, Param, ParamType, PathClass, QueryClass
+from aws_spy.dependencies import Dependency, dependency_param_key, iter_dependency_params
 
 LH = t.TypeVar("LH", bound=Callable[..., t.Any])
 
+PARAM_CLASSES: dict[ParamType, type[Param]] = {
+    ParamType.QUERY: QueryClass,
+    ParamType.PATH: PathClass,
+    ParamType.HEADER: HeaderClass,
+}
+
 
 class ParamSchema(BaseModel):
     name: str
     arg_name: str
     in_: Param
-    annotation: type
+    annotation: t.Any
     is_required: bool
     enum: list[str] | None
 
@@ -26,16 +34,120 @@ class ParamSchema(BaseModel):
         arbitrary_types_allowed = True
 
 
+def get_annotation_name(annotation: t.Any) -> str:
+    if t.get_origin(annotation) is t.Annotated:
+        annotation = t.get_args(annotation)[0]
+    return getattr(annotation, "__name__", str(annotation))
+
+
+class ParamsValidator:
+    """
+    Validates all path, header and query params of a route in a single pydantic-core call.
+    The TypedDict schema is synthesised from the route params and compiled on first use.
+    """
+
+    SOURCES: t.ClassVar[tuple[tuple[ParamType, str], ...]] = (
+        (ParamType.PATH, "pathParameters"),
+        (ParamType.HEADER, "headers"),
+        (ParamType.QUERY, "queryStringParameters"),
+    )
+
+    def __init__(
+        self: te.Self,
+        *,
+        path: list[ParamSchema],
+        header: list[ParamSchema],
+        query: list[ParamSchema],
+    ) -> None:
+        params = {ParamType.PATH: path, ParamType.HEADER: header, ParamType.QUERY: query}
+        self.sources = [
+            (param_type.value, event_key, param_type is ParamType.HEADER)
+            for param_type, event_key in self.SOURCES
+            if params[param_type]
+        ]
+        # headers are matched case-insensitively, so their keys are lowered once here
+        self.params = {
+            (param_type.value, self._key(param_type, param.name)): param
+            for param_type, params_ in params.items()
+            for param in params_
+        }
+        self.defaults = {param.arg_name: None for param in self.params.values() if not param.is_required}
+        self._validator: SchemaValidator | None = None
+
+    def __bool__(self: te.Self) -> bool:
+        return bool(self.sources)
+
+    @staticmethod
+    def _key(param_type: ParamType, name: str) -> str:
+        return name.lower() if param_type is ParamType.HEADER else name
+
+    @property
+    def validator(self: te.Self) -> SchemaValidator:
+        if self._validator is None:
+            sources = {}
+            for source, _, _ in self.sources:
+                fields = {}
+                for (in_, key), param in self.params.items():
+                    if in_ != source:
+                        continue
+                    annotation = t.Annotated[param.annotation, Field(alias=key)]
+                    fields[param.arg_name] = te.Required[annotation] if param.is_required else annotation
+                sources[source] = te.TypedDict(f"{source.title()}Params", fields, total=False)  # type: ignore
+            self._validator = TypeAdapter(te.TypedDict("Params", sources)).validator  # type: ignore
+        return self._validator  # type: ignore
+
+    def validate(self: te.Self, event: dict[str, t.Any]) -> tuple[dict[str, t.Any], list[str]]:
+        raw = {}
+        for source, event_key, is_header in self.sources:
+            values = event.get(event_key) or {}
+            if is_header:
+                values = {key.lower(): value for key, value in values.items()}
+            raw[source] = values
+        try:
+            validated = self.validator.validate_python(raw)
+        except ValidationError as e:
+            return {}, self.translate_errors(e)
+
+        args = self.defaults.copy()
+        for values in validated.values():
+            args.update(values)
+        return args, []
+
+    def translate_errors(self: te.Self, error: ValidationError) -> list[str]:
+        errors, seen = [], set()
+        for error_ in error.errors():
+            loc = error_["loc"][:2]
+            param = self.params.get(loc)  # type: ignore
+            if param is None or loc in seen:  # pragma: no cover
+                continue
+            seen.add(loc)
+            if error_["type"] == "missing":
+                errors.append(f"Required parameter {param.name} not found in {loc[0]}.")
+            else:
+                errors.append(f"{param.name} should be {get_annotation_name(param.annotation)} type.")
+        return errors
+
+
 class HandlerArgs(BaseModel):
     query: dict[str, ParamSchema]
     path: dict[str, ParamSchema]
     header: dict[str, ParamSchema]
     request_body: type[BaseModel] | None
     request_body_arg_name: str | None
+    validator: ParamsValidator
+    dependencies: dict[str, Dependency] = {}
+    dependency_params: set[str] = set()
+
+    class Config:
+        arbitrary_types_allowed = True
 
     @property
     def count(self: te.Self) -> int:
-        return len(self.query) + len(self.path) + len(self.header) + (1 if self.request_body is not None else 0)
+        """
+        Number of handler arguments, params asked for by dependencies only are not counted.
+        """
+        params_count = len(self.query) + len(self.path) + len(self.header) - len(self.dependency_params)
+        return params_count + len(self.dependencies) + (1 if self.request_body is not None else 0)
 
 
 def _is_request_body(arg) -> bool:
@@ -54,7 +166,11 @@ def resolve_handler_args(handler: LH) -> HandlerArgs:
     }
     request_body = None
     request_body_arg_name = None
+    dependencies: dict[str, Dependency] = {}
     for arg_name, arg_value in inspect.signature(handler).parameters.items():
+        if isinstance(arg_value.default, Dependency):
+            dependencies[arg_name] = arg_value.default
+            continue
         try:
             if _is_request_body(arg_value) and request_body is None:
                 request_body = arg_value.annotation
@@ -67,29 +183,79 @@ def resolve_handler_args(handler: LH) -> HandlerArgs:
                     msg = f'{handler.__name__} expects two same {param.in_} params: "{param_name}"!'
                     raise RouteDefinitionError(msg)
 
-                enum = None
-                is_required = types.is_type_required(arg_value.annotation)
-                annotation = arg_value.annotation if is_required else types.get_type_from_optional(arg_value.annotation)
-                if issubclass(annotation, Enum):
-                    enum = [e.value for e in annotation]
-
-                params[param.in_][param_name] = ParamSchema(
-                    name=param_name,
-                    in_=arg_value.default,
-                    arg_name=arg_name,
-                    annotation=annotation,
-                    enum=enum,
-                    is_required=is_required,
-                )
+                params[param.in_][param_name] = build_param_schema(param, param_name, arg_name, arg_value.annotation)
         except TypeError:  # pragma: no cover
             continue
 
+    # params of dependencies are validated together with the handler's ones
+    dependency_params: set[str] = set()
+    for param, arg_name, annotation in iter_dependency_params(dependencies):
+        param_name = param.name if param.name is not None else arg_name
+        if param_name not in params[param.in_]:
+            key = dependency_param_key(param.in_, param_name)
+            params[param.in_][param_name] = build_param_schema(param, param_name, key, annotation)
+            dependency_params.add(key)
+
+    handler_args = build_handler_args(params, request_body, request_body_arg_name)
+    handler_args.dependencies = dependencies
+    handler_args.dependency_params = dependency_params
+    return handler_args
+
+
+def handler_args_from_manifest(handler: LH, entry: dict[str, t.Any]) -> HandlerArgs:
+    """
+    Rebuilds handler args from a build-time manifest entry,
+    annotations are taken from the handler itself, so no signature introspection is needed.
+    """
+    annotations = handler.__annotations__
+    params: dict[ParamType, dict[str, ParamSchema]] = {
+        ParamType.HEADER: {},
+        ParamType.PATH: {},
+        ParamType.QUERY: {},
+    }
+    for param_type, param_name, arg_name in entry["params"]:
+        param = PARAM_CLASSES[ParamType(param_type)](param_name)
+        params[param.in_][param_name] = build_param_schema(param, param_name, arg_name, annotations[arg_name])
+
+    request_body_arg_name = entry["request_body_arg_name"]
+    request_body = annotations[request_body_arg_name] if request_body_arg_name is not None else None
+    return build_handler_args(params, request_body, request_body_arg_name)
+
+
+def build_param_schema(param: Param, param_name: str, arg_name: str, annotation: t.Any) -> ParamSchema:
+    enum = None
+    is_required = types.is_type_required(annotation)
+    if not is_required:
+        annotation = types.get_type_from_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        enum = [e.value for e in annotation]
+
+    return ParamSchema(
+        name=param_name,
+        in_=param,
+        arg_name=arg_name,
+        annotation=annotation,
+        enum=enum,
+        is_required=is_required,
+    )
+
+
+def build_handler_args(
+    params: dict[ParamType, dict[str, ParamSchema]],
+    request_body: type[BaseModel] | None,
+    request_body_arg_name: str | None,
+) -> HandlerArgs:
     return HandlerArgs(
         query=params[ParamType.QUERY],
         path=params[ParamType.PATH],
         header=params[ParamType.HEADER],
         request_body=request_body,
         request_body_arg_name=request_body_arg_name,
+        validator=ParamsValidator(
+            path=list(params[ParamType.PATH].values()),
+            header=list(params[ParamType.HEADER].values()),
+            query=list(params[ParamType.QUERY].values()),
+        ),
     )
 
 
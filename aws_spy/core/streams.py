@@ -0,0 +1,189 @@
+import base64
+import gzip
+import inspect
+import typing as t
+from collections.abc import Callable
+from decimal import Decimal
+from functools import cache
+
+import typing_extensions as te
+from pydantic import BaseModel
+
+from aws_spy.core.encoders import get_type_adapter
+
+Record = dict[str, t.Any]
+AttributeValue = dict[str, t.Any]
+Image = dict[str, AttributeValue]
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class KinesisRecord:
+    """
+    Kinesis record with the payload decoded only when accessed, so records skipped by e.g. partition key cost nothing.
+    """
+
+    __slots__ = ("raw", "_data")
+
+    def __init__(self: te.Self, raw: Record) -> None:
+        self.raw = raw
+        self._data: bytes | None = None
+
+    @property
+    def partition_key(self: te.Self) -> str:
+        return self.raw["kinesis"]["partitionKey"]
+
+    @property
+    def sequence_number(self: te.Self) -> str:
+        return self.raw["kinesis"]["sequenceNumber"]
+
+    @property
+    def data(self: te.Self) -> bytes:
+        if self._data is None:
+            data = base64.b64decode(self.raw["kinesis"]["data"])
+            # e.g. CloudWatch Logs subscriptions deliver gzipped payloads
+            self._data = gzip.decompress(data) if data.startswith(GZIP_MAGIC) else data
+        return self._data
+
+
+class DynamoDBRecord:
+    """
+    DynamoDB stream record with images unmarshalled only when accessed.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self: te.Self, raw: Record) -> None:
+        self.raw = raw
+
+    @property
+    def event_name(self: te.Self) -> str:
+        return self.raw["eventName"]
+
+    @property
+    def sequence_number(self: te.Self) -> str:
+        return self.raw["dynamodb"]["SequenceNumber"]
+
+    @property
+    def keys(self: te.Self) -> dict[str, t.Any]:
+        return unmarshal_image(self.raw["dynamodb"].get("Keys") or {})
+
+    @property
+    def new_image(self: te.Self) -> dict[str, t.Any] | None:
+        image = self.raw["dynamodb"].get("NewImage")
+        return None if image is None else unmarshal_image(image)
+
+    @property
+    def old_image(self: te.Self) -> dict[str, t.Any] | None:
+        image = self.raw["dynamodb"].get("OldImage")
+        return None if image is None else unmarshal_image(image)
+
+    @property
+    def image(self: te.Self) -> Image:
+        """
+        Raw image the record is about, the old one for removed items.
+        """
+        dynamodb = self.raw["dynamodb"]
+        return dynamodb.get("NewImage") or dynamodb.get("OldImage") or dynamodb.get("Keys") or {}
+
+
+def unmarshal_value(value: AttributeValue) -> t.Any:
+    """
+    Python value of DynamoDB typed attribute value, e.g. `{"N": "1"}` -> `Decimal("1")`.
+    """
+    ((type_, data),) = value.items()
+    if type_ in ("S", "BOOL"):
+        return data
+    if type_ == "N":
+        return Decimal(data)
+    if type_ == "M":
+        return unmarshal_image(data)
+    if type_ == "L":
+        return [unmarshal_value(item) for item in data]
+    if type_ == "NULL":
+        return None
+    if type_ == "B":
+        return base64.b64decode(data)
+    if type_ == "SS":
+        return set(data)
+    if type_ == "NS":
+        return {Decimal(item) for item in data}
+    if type_ == "BS":
+        return {base64.b64decode(item) for item in data}
+    msg = f"Unknown DynamoDB attribute type: {type_}"
+    raise ValueError(msg)
+
+
+def unmarshal_image(image: Image) -> dict[str, t.Any]:
+    return {name: unmarshal_value(value) for name, value in image.items()}
+
+
+class DynamoDBConverter:
+    """
+    Unmarshals images of a single model, with a converter picked per field upfront.
+    Attributes the model has no field for are not converted at all.
+    """
+
+    __slots__ = ("converters",)
+
+    def __init__(self: te.Self, model: type[BaseModel]) -> None:
+        self.converters: dict[str, Callable[[AttributeValue], t.Any]] = {
+            field.alias or name: build_attribute_converter(field.annotation)
+            for name, field in model.model_fields.items()
+        }
+
+    def __call__(self: te.Self, image: Image) -> dict[str, t.Any]:
+        return {name: convert(image[name]) for name, convert in self.converters.items() if name in image}
+
+
+def is_model(annotation: t.Any) -> bool:
+    return inspect.isclass(annotation) and issubclass(annotation, BaseModel)
+
+
+def build_attribute_converter(annotation: t.Any) -> Callable[[AttributeValue], t.Any]:
+    if is_model(annotation):
+        converter = get_dynamodb_converter(annotation)
+
+        def convert_model(value: AttributeValue) -> t.Any:
+            return converter(value["M"]) if "M" in value else unmarshal_value(value)
+
+        return convert_model
+    return unmarshal_value
+
+
+@cache
+def get_dynamodb_converter(model: type[BaseModel]) -> DynamoDBConverter:
+    return DynamoDBConverter(model)
+
+
+def build_kinesis_parser(record_model: t.Any) -> Callable[[KinesisRecord], t.Any]:
+    if record_model in (None, KinesisRecord):
+        return lambda record: record
+    validate_json = get_type_adapter(record_model).validate_json
+
+    def parse(record: KinesisRecord) -> t.Any:
+        return validate_json(record.data)
+
+    return parse
+
+
+def build_dynamodb_parser(record_model: t.Any, validated_type: t.Any = None) -> Callable[[DynamoDBRecord], t.Any]:
+    """
+    Images are converted per `record_model` and validated into `validated_type` (the model itself if not given).
+    """
+    if record_model in (None, DynamoDBRecord):
+        return lambda record: record
+    validate_python = get_type_adapter(validated_type or record_model).validate_python
+    convert = get_dynamodb_converter(record_model) if is_model(record_model) else unmarshal_image
+
+    def parse(record: DynamoDBRecord) -> t.Any:
+        return validate_python(convert(record.image))
+
+    return parse
+
+
+def get_kinesis_sequence_number(record: Record) -> str:
+    return record["kinesis"]["sequenceNumber"]
+
+
+def get_dynamodb_sequence_number(record: Record) -> str:
+    return record["dynamodb"]["SequenceNumber"]
@@ -1,38 +1,248 @@
-# import inspect
-# from collections.abc import Callable
-# from typing import TypedDict
+import inspect
+import threading
+import typing as t
+from collections.abc import Callable, Iterator
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
 
-# from pydantic import BaseModel
-# from typing_extensions import Self
+import typing_extensions as te
 
+from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.params import Param, ParamType
 
-# class Dependency:
-#     def __init__(self: Self, func: Callable) -> None:
-#         self.func = func
+# "invocation" values are created once per invocation, "container" ones once per Lambda container
+Scope = t.Literal["invocation", "container"]
+LAMBDA_ARGS = ("event", "context")
 
+# where a dependency argument comes from
+PARAM = 0
+DEPENDENCY = 1
+EVENT = 2
+CONTEXT = 3
 
-# def is_dependency(arg) -> bool:
-#     return isinstance(arg.param, Dependency)
+_container: dict[Callable[..., t.Any], t.Any] = {}
+_container_lock = threading.Lock()
+_container_stack = ExitStack()
+_async_container_stack = AsyncExitStack()
 
 
-# class DependencySchema(TypedDict):
-#     arg_name: str
-#     func: Callable
-#     dependencies: dict[Callable, list["DependencySchema"]]
+class Dependency:
+    __slots__ = ("call", "scope", "use_cache")
 
+    def __init__(self: te.Self, call: Callable[..., t.Any], *, scope: Scope = "invocation", use_cache: bool = True):
+        if scope not in t.get_args(Scope):
+            msg = f'Unknown "{scope}" scope of {call.__name__} dependency.'
+            raise RouteDefinitionError(msg)
+        self.call = call
+        self.scope = scope
+        self.use_cache = use_cache
 
-# class FunctionDependencies(BaseModel):
-#     dependency_tree: dict[str, DependencySchema]
 
+def Depends(call: Callable[..., t.Any], *, scope: Scope = "invocation", use_cache: bool = True) -> t.Any:  # noqa: N802
+    """
+    Marks handler argument as a value returned by `call`, functions yielding a value are torn down afterwards.
+    """
+    return Dependency(call, scope=scope, use_cache=use_cache)
 
-# def get_dependencies(func: Callable) -> FunctionDependencies:
-#     dependencies = {}
-#     for arg in inspect.signature(func).parameters.values():
-#         if is_dependency(arg):
-#             dependencies[arg.name] = DependencySchema(
-#                 arg_name=arg.name,
-#                 func=arg.default.func,
-#                 dependencies=get_dependencies(arg.default.func).dependency_tree,
-#             )
 
-#     return FunctionDependencies(dependency_tree=dependencies)
+def dependency_param_key(param_type: ParamType, param_name: str) -> str:
+    """
+    Key of a param used only by dependencies, never a valid handler argument name.
+    """
+    return f"{param_type.value}:{param_name}"
+
+
+def get_dependencies(handler: Callable[..., t.Any]) -> dict[str, Dependency]:
+    return {
+        arg_name: arg.default
+        for arg_name, arg in inspect.signature(handler).parameters.items()
+        if isinstance(arg.default, Dependency)
+    }
+
+
+def iter_dependency_params(dependencies: dict[str, Dependency]) -> Iterator[tuple[Param, str, t.Any]]:
+    """
+    Params (with argument names and annotations) of all dependencies, nested ones included.
+    """
+    seen: set[Callable[..., t.Any]] = set()
+    pending = list(dependencies.values())
+    while pending:
+        dependency = pending.pop()
+        if dependency.call in seen:
+            continue
+        seen.add(dependency.call)
+        for arg_name, arg in inspect.signature(dependency.call).parameters.items():
+            if isinstance(arg.default, Dependency):
+                pending.append(arg.default)
+            elif isinstance(arg.default, Param):
+                yield arg.default, arg_name, arg.annotation
+            elif arg_name not in LAMBDA_ARGS and arg.default is inspect.Parameter.empty:
+                msg = f'Unrecognized "{arg_name}" param of {dependency.call.__name__} dependency!'
+                raise RouteDefinitionError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class DependencyNode:
+    key: Callable[..., t.Any]
+    call: Callable[..., t.Any]
+    scope: Scope
+    is_async: bool
+    is_context_manager: bool
+    # argument name, source (PARAM, DEPENDENCY, EVENT or CONTEXT), param key or node index
+    arguments: tuple[tuple[str, int, t.Any], ...]
+
+    def build_kwargs(self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], values: list[t.Any]) -> dict[str, t.Any]:
+        call_kwargs = {}
+        for arg_name, source, reference in self.arguments:
+            if source == PARAM:
+                call_kwargs[arg_name] = kwargs[reference]
+            elif source == DEPENDENCY:
+                call_kwargs[arg_name] = values[reference]
+            else:
+                call_kwargs[arg_name] = args[0] if source == EVENT else args[1]
+        return call_kwargs
+
+
+class DependencyGraph:
+    """
+    Dependencies of a single route, sorted so every node comes after the ones it depends on.
+    Cached dependencies are a single node, so they're called once per invocation.
+    """
+
+    def __init__(
+        self: te.Self,
+        dependencies: dict[str, Dependency],
+        param_keys: dict[tuple[ParamType, str], str],
+        handler_arg_names: t.Iterable[str],
+    ) -> None:
+        self.nodes: list[DependencyNode] = []
+        self._cached: dict[Callable[..., t.Any], int] = {}
+        self.param_keys = param_keys
+        self.handler_args = tuple(
+            (arg_name, self._add(dependency, ())) for arg_name, dependency in dependencies.items()
+        )
+        # params only dependencies asked for are not handler arguments
+        self.dependency_param_keys = tuple(set(param_keys.values()).difference(handler_arg_names))
+        self.is_async = any(node.is_async for node in self.nodes)
+
+    def _add(self: te.Self, dependency: Dependency, path: tuple[Callable[..., t.Any], ...]) -> int:
+        call = dependency.call
+        if dependency.use_cache and call in self._cached:
+            return self._cached[call]
+        if call in path:
+            msg = f"Circular dependency on {call.__name__}!"
+            raise RouteDefinitionError(msg)
+
+        arguments = []
+        for arg_name, arg in inspect.signature(call).parameters.items():
+            if isinstance(arg.default, Dependency):
+                index = self._add(arg.default, (*path, call))
+                if dependency.scope == "container" and self.nodes[index].scope != "container":
+                    msg = f"Container scoped {call.__name__} dependency can't depend on invocation scoped ones!"
+                    raise RouteDefinitionError(msg)
+                arguments.append((arg_name, DEPENDENCY, index))
+            elif dependency.scope == "container" and (isinstance(arg.default, Param) or arg_name in LAMBDA_ARGS):
+                msg = f"Container scoped {call.__name__} dependency can't use request data!"
+                raise RouteDefinitionError(msg)
+            elif isinstance(arg.default, Param):
+                key = self.param_keys[(arg.default.in_, arg.default.name or arg_name)]
+                arguments.append((arg_name, PARAM, key))
+            elif arg_name in LAMBDA_ARGS:
+                arguments.append((arg_name, EVENT if arg_name == "event" else CONTEXT, None))
+
+        is_generator = inspect.isgeneratorfunction(call)
+        is_async_generator = inspect.isasyncgenfunction(call)
+        if is_generator:
+            wrapped = contextmanager(call)
+        elif is_async_generator:
+            wrapped = asynccontextmanager(call)
+        else:
+            wrapped = call
+        self.nodes.append(
+            DependencyNode(
+                key=call,
+                call=wrapped,
+                scope=dependency.scope,
+                is_async=is_async_generator or inspect.iscoroutinefunction(call),
+                is_context_manager=is_generator or is_async_generator,
+                arguments=tuple(arguments),
+            )
+        )
+        index = len(self.nodes) - 1
+        if dependency.use_cache:
+            self._cached[call] = index
+        return index
+
+    def solve(self: te.Self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], stack: ExitStack) -> None:
+        """
+        Adds dependency values to handler kwargs, teardowns of yielding dependencies are pushed onto the stack.
+        """
+        values: list[t.Any] = []
+        for node in self.nodes:
+            if node.scope == "container":
+                values.append(get_container_value(node, values))
+                continue
+            value = node.call(**node.build_kwargs(kwargs, args, values))
+            values.append(stack.enter_context(value) if node.is_context_manager else value)
+        self.export(kwargs, values)
+
+    async def solve_async(
+        self: te.Self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], stack: AsyncExitStack
+    ) -> None:
+        values: list[t.Any] = []
+        for node in self.nodes:
+            if node.scope == "container":
+                values.append(await get_container_value_async(node, values))
+                continue
+            value = node.call(**node.build_kwargs(kwargs, args, values))
+            if node.is_context_manager:
+                value = await stack.enter_async_context(value) if node.is_async else stack.enter_context(value)
+            elif node.is_async:
+                value = await value
+            values.append(value)
+        self.export(kwargs, values)
+
+    def export(self: te.Self, kwargs: dict[str, t.Any], values: list[t.Any]) -> None:
+        for key in self.dependency_param_keys:
+            del kwargs[key]
+        for arg_name, index in self.handler_args:
+            kwargs[arg_name] = values[index]
+
+
+def get_container_value(node: DependencyNode, values: list[t.Any]) -> t.Any:
+    try:
+        return _container[node.key]
+    except KeyError:
+        pass
+    with _container_lock:
+        if node.key not in _container:
+            value = node.call(**node.build_kwargs({}, (), values))
+            _container[node.key] = _container_stack.enter_context(value) if node.is_context_manager else value
+    return _container[node.key]
+
+
+async def get_container_value_async(node: DependencyNode, values: list[t.Any]) -> t.Any:
+    if not node.is_async:
+        return get_container_value(node, values)
+    try:
+        return _container[node.key]
+    except KeyError:
+        pass
+    # no lock across awaits, concurrent first requests may create the value more than once
+    value = node.call(**node.build_kwargs({}, (), values))
+    value = await _async_container_stack.enter_async_context(value) if node.is_context_manager else await value
+    return _container.setdefault(node.key, value)
+
+
+def close_container() -> None:
+    """
+    Tears down container scoped dependencies, they are created again on next use.
+    """
+    with _container_lock:
+        _container.clear()
+        _container_stack.close()
+
+
+async def aclose_container() -> None:
+    close_container()
+    await _async_container_stack.aclose()
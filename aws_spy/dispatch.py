@@ -0,0 +1,188 @@
+import importlib
+import os
+import typing as t
+
+import typing_extensions as te
+
+from aws_spy.core.etag import strip_body
+from aws_spy.core.event_utils import get_request_method
+from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.manifest import load_manifest
+from aws_spy.responses import ErrorResponse
+from aws_spy.runtime import compile_route
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from aws_spy.core.schemas import LH, SpyRoute
+    from aws_spy.main import SpyAPI
+
+# router function served by the running Lambda, set by `aws-spy sls`
+ROUTER_ENV = "SPY_ROUTER"
+
+
+def get_router_function(tags: list[str] | None, router_functions: dict[str, list[str] | None]) -> str | None:
+    """
+    Name of the router Lambda serving a route with given tags,
+    groups with tags are matched first, a group without tags takes all remaining routes.
+    """
+    route_tags = set(tags or ())
+    for name, group_tags in router_functions.items():
+        if group_tags is not None and route_tags.intersection(group_tags):
+            return name
+    for name, group_tags in router_functions.items():
+        if group_tags is None:
+            return name
+    return None
+
+
+class DispatchTarget:
+    """
+    Route handler, its module is imported on the first request hitting it.
+    """
+
+    __slots__ = ("module", "name", "_handler")
+
+    def __init__(self: te.Self, module: str, name: str, handler: "LH | None" = None) -> None:
+        self.module = module
+        self.name = name
+        self._handler = handler
+
+    @property
+    def handler(self: te.Self) -> "LH":
+        if self._handler is None:
+            self._handler = getattr(importlib.import_module(self.module), self.name)
+        return self._handler
+
+
+class RadixNode:
+    __slots__ = ("children", "params", "targets")
+
+    def __init__(self: te.Self) -> None:
+        self.children: dict[str, RadixNode] = {}
+        self.params: dict[str, RadixNode] = {}
+        self.targets: dict[str, DispatchTarget] = {}
+
+
+def split_path(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+class RadixTree:
+    """
+    Routes tree keyed by path segments, static segments are matched before path params.
+    """
+
+    def __init__(self: te.Self) -> None:
+        self.root = RadixNode()
+
+    def insert(self: te.Self, method: str, path: str, target: DispatchTarget) -> None:
+        node = self.root
+        for segment in split_path(path):
+            if segment.startswith("{") and segment.endswith("}"):
+                node = node.params.setdefault(segment[1:-1], RadixNode())
+            else:
+                node = node.children.setdefault(segment, RadixNode())
+        if method.upper() in node.targets:
+            msg = f'There is already existing "{method.upper()}" method definition under "{path}" path.'
+            raise RouteDefinitionError(msg)
+        node.targets[method.upper()] = target
+
+    def lookup(self: te.Self, path: str) -> tuple[dict[str, DispatchTarget], dict[str, str]] | None:
+        params: dict[str, str] = {}
+        node = self._lookup(self.root, split_path(path), 0, params)
+        return (node.targets, params) if node is not None else None
+
+    def _lookup(
+        self: te.Self, node: RadixNode, segments: list[str], index: int, params: dict[str, str]
+    ) -> RadixNode | None:
+        if index == len(segments):
+            return node if node.targets else None
+        segment = segments[index]
+        child = node.children.get(segment)
+        if child is not None:
+            found = self._lookup(child, segments, index + 1, params)
+            if found is not None:
+                return found
+        for name, child in node.params.items():
+            found = self._lookup(child, segments, index + 1, params)
+            if found is not None:
+                params[name] = segment
+                return found
+        return None
+
+
+def get_request_path(event: dict[str, t.Any]) -> str:
+    if "rawPath" not in event:
+        return event.get("path", "/")  # payload 1.0
+    path = event["rawPath"]
+    stage = event.get("requestContext", {}).get("stage")
+    if stage and stage != "$default" and path.startswith(f"/{stage}/"):
+        path = path[len(stage) + 1 :]
+    return path
+
+
+class Dispatcher:
+    """
+    Serves many routes from a single Lambda.
+    """
+
+    def __init__(self: te.Self, tree: RadixTree) -> None:
+        self.tree = tree
+
+    @classmethod
+    def from_manifest(cls: type[te.Self], router_function: str | None = None) -> te.Self:
+        router_function = router_function or os.environ.get(ROUTER_ENV, "")
+        entries = load_manifest().get("dispatch", {}).get(router_function)
+        if entries is None:
+            msg = f'No routes of "{router_function}" router function found in route manifest.'
+            raise RouteDefinitionError(msg)
+        tree = RadixTree()
+        for method, path, module, name in entries:
+            tree.insert(method, path, DispatchTarget(module, name))
+        return cls(tree)
+
+    @classmethod
+    def from_app(cls: type[te.Self], app: "SpyAPI", router_function: str | None = None) -> te.Self:
+        tree = RadixTree()
+        for path, methods in app.routes.items():
+            for method, route in methods.items():
+                if router_function is None or (
+                    get_router_function(route.tags, app.router_functions or {}) == router_function
+                ):
+                    tree.insert(method, path, cls.target_for(route))
+        return cls(tree)
+
+    @staticmethod
+    def target_for(route: "SpyRoute") -> DispatchTarget:
+        return DispatchTarget(route.handler.__module__, route.handler.__name__, compile_route(route))
+
+    def __call__(self: te.Self, event: dict[str, t.Any], context: t.Any) -> dict[str, t.Any]:
+        matched = self.tree.lookup(get_request_path(event))
+        if matched is None:
+            return ErrorResponse("Not Found", status_code=404).response
+        targets, params = matched
+        method = get_request_method(event).upper()
+        # GET routes answer HEAD requests too, without the body
+        is_head = method == "HEAD" and method not in targets
+        target = targets.get("GET" if is_head else method)
+        if target is None:
+            return ErrorResponse("Method Not Allowed", status_code=405).response
+
+        path_params = event.get("pathParameters")
+        # catch-all events carry "proxy" only, params are extracted from the path then
+        if params and (not path_params or "proxy" in path_params):
+            event = {**event, "pathParameters": params}
+        response = target.handler(event, context)
+        return strip_body(response) if is_head else response
+
+
+_dispatcher: Dispatcher | None = None
+
+
+def handler(event: dict[str, t.Any], context: t.Any) -> dict[str, t.Any]:
+    """
+    Entrypoint of router Lambdas.
+    """
+    global _dispatcher  # noqa: PLW0603
+    if _dispatcher is None:
+        _dispatcher = Dispatcher.from_manifest()
+    return _dispatcher(event, context)
@@ -0,0 +1,354 @@
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from functools import partial
+
+from pydantic import BaseModel
+
+import aws_spy
+from aws_spy import Path, Query, SpyAPI
+from aws_spy.core.config import Provider, ServerlessConfig
+from aws_spy.core.encoders import JSON_BACKENDS, JSONBackend, build_json_backend
+from aws_spy.responses import ErrorResponse, JSONResponse
+
+BENCHMARKS: dict[str, Callable[[], "BenchmarkResult"]] = {}
+DEFAULT_THRESHOLD = 0.1
+ROUTE_COUNTS = (10, 100, 1000)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    p50_us: float
+    min_us: float
+    samples: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_us / self.baseline_us
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.baseline_us:.2f} us -> {self.current_us:.2f} us ({self.ratio - 1:+.1%})"
+
+
+def benchmark(name: str) -> Callable[[Callable[[], BenchmarkResult]], Callable[[], BenchmarkResult]]:
+    def decorator(function: Callable[[], BenchmarkResult]) -> Callable[[], BenchmarkResult]:
+        BENCHMARKS[name] = function
+        return function
+
+    return decorator
+
+
+def measure(function: Callable[[], t.Any], *, number: int = 1000, repeat: int = 15) -> BenchmarkResult:
+    """
+    Per call time of `function`, median and minimum out of `repeat` batches of `number` calls.
+    """
+    function()  # warm up caches, e.g. lazily compiled route plans
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter_ns() - start) / number / 1000)
+    return BenchmarkResult(p50_us=statistics.median(timings), min_us=min(timings), samples=repeat)
+
+
+class Item(BaseModel):
+    name: str
+    price: int
+    tags: list[str]
+
+
+def build_config() -> ServerlessConfig:
+    return ServerlessConfig(service="bench", plugins=[], provider=Provider())
+
+
+def build_event(**kwargs: t.Any) -> dict[str, t.Any]:
+    return {"headers": {}, "queryStringParameters": None, "pathParameters": None, "body": None, **kwargs}
+
+
+ITEMS = [Item(name=f"item-{i}", price=i, tags=["a", "b"]) for i in range(1000)]
+
+
+@benchmark("wrapper.no_params")
+def bench_no_params() -> BenchmarkResult:
+    app = SpyAPI(config=build_config(), defer_routes=False)
+
+    @app.get("/health", "health")
+    def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    event = build_event()
+    return measure(lambda: health(event, None), number=5000)
+
+
+@benchmark("wrapper.no_params.metrics")
+def bench_no_params_metrics() -> BenchmarkResult:
+    app = SpyAPI(config=build_config(), defer_routes=False, metrics=True)
+    app.metrics.stream = io.StringIO()  # type: ignore
+
+    @app.get("/health", "health")
+    def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    event = build_event()
+    return measure(lambda: health(event, None), number=5000)
+
+
+@benchmark("wrapper.query_params")
+def bench_query_params() -> BenchmarkResult:
+    app = SpyAPI(config=build_config(), defer_routes=False)
+
+    @app.get("/search/{category}", "search")
+    def search(
+        category: str = Path(),
+        q: str = Query(),
+        limit: int = Query(),
+        offset: int = Query(),
+        sort: str | None = Query(),
+        order: str | None = Query(),
+        min_price: int | None = Query(),
+        max_price: int | None = Query(),
+        in_stock: bool | None = Query(),
+        tag: str | None = Query(),
+        brand: str | None = Query(),
+    ) -> dict[str, t.Any]:
+        return {
+            "category": category,
+            "q": q,
+            "page": (limit, offset),
+            "ordering": (sort, order),
+            "price": (min_price, max_price),
+            "filters": (in_stock, tag, brand),
+        }
+
+    query = {
+        "q": "shoes",
+        "limit": "10",
+        "offset": "20",
+        "sort": "price",
+        "order": "asc",
+        "min_price": "1",
+        "max_price": "100",
+        "in_stock": "true",
+        "tag": "new",
+        "brand": "spy",
+    }
+    event = build_event(pathParameters={"category": "fashion"}, queryStringParameters=query)
+    return measure(lambda: search(event, None), number=2000)
+
+
+@benchmark("wrapper.large_body")
+def bench_large_body() -> BenchmarkResult:
+    class Items(BaseModel):
+        items: list[Item]
+
+    app = SpyAPI(config=build_config(), defer_routes=False)
+
+    @app.post("/items", "create-items")
+    def create_items(items: Items) -> dict[str, int]:
+        return {"created": len(items.items)}
+
+    event = build_event(body=json.dumps({"items": [item.model_dump() for item in ITEMS]}))
+    return measure(lambda: create_items(event, None), number=20)
+
+
+@benchmark("wrapper.large_response_class")
+def bench_large_response_class() -> BenchmarkResult:
+    class Items(BaseModel):
+        items: list[Item]
+
+    app = SpyAPI(config=build_config(), defer_routes=False)
+
+    @app.get("/items", "list-items", response_class=Items)
+    def list_items() -> dict[str, list[Item]]:
+        return {"items": ITEMS}
+
+    event = build_event()
+    return measure(lambda: list_items(event, None), number=20)
+
+
+@benchmark("response.json")
+def bench_json_response() -> BenchmarkResult:
+    data = {"items": [item.model_dump() for item in ITEMS[:100]]}
+    return measure(lambda: JSONResponse(data).response, number=200)
+
+
+JSON_PAYLOADS: dict[str, tuple[t.Any, int]] = {
+    "small": ({"status": "ok", "count": 10, "items": [1, 2, 3]}, 5000),
+    "typed": (
+        {
+            "id": uuid.UUID("a2618752-dc19-4f40-adf5-6173d419f2ed"),
+            "created": datetime.datetime(2023, 5, 10, 12, 30),  # noqa: DTZ001
+            "day": datetime.date(2023, 5, 10),
+            "price": Decimal("10.5"),
+        },
+        5000,
+    ),
+    "list_1000": (
+        [
+            {
+                "id": i,
+                "name": f"item {i}",
+                "created": datetime.datetime(2023, 5, 10, 12, 30),  # noqa: DTZ001
+                "tags": ["a", "b", "c"],
+                "price": Decimal("10.5"),
+            }
+            for i in range(1000)
+        ],
+        20,
+    ),
+}
+
+
+def bench_json_backend(backend: JSONBackend, payload: t.Any, number: int, *, loads: bool) -> BenchmarkResult:
+    if loads:
+        encoded = backend.dumps(payload)
+        return measure(lambda: backend.loads(encoded), number=number)
+    return measure(lambda: backend.dumps(payload), number=number)
+
+
+def load_json_backends() -> dict[str, JSONBackend]:
+    """
+    Installed JSON backends, keyed by their benchmark name.
+    """
+    backends = {}
+    for name in JSON_BACKENDS:
+        try:
+            backends[name] = build_json_backend(name)  # type: ignore
+        except ImportError:
+            continue
+    backends["stdlib_compact"] = build_json_backend("stdlib", compact=True)
+    return backends
+
+
+for backend_name, backend in load_json_backends().items():
+    for payload_name, (payload, number) in JSON_PAYLOADS.items():
+        for operation in ("dumps", "loads"):
+            BENCHMARKS[f"json.{backend_name}.{payload_name}.{operation}"] = partial(
+                bench_json_backend, backend, payload, number, loads=operation == "loads"
+            )
+
+
+@benchmark("response.error")
+def bench_error_response() -> BenchmarkResult:
+    errors = [f"Required parameter param_{i} not found in query." for i in range(5)]
+    return measure(lambda: ErrorResponse(errors, status_code=422).response, number=5000)
+
+
+def write_app_module(directory: str, routes: int) -> str:
+    lines = ["from aws_spy import Path, SpyAPI", "app = SpyAPI(config=None)"]
+    for i in range(routes):
+        lines += [
+            f'@app.get("/items{i}/{{item_id}}", "item-{i}")',
+            f"def item_{i}(item_id: int = Path()) -> dict:",
+            "    return {}",
+        ]
+    with open(os.path.join(directory, f"bench_app_{routes}.py"), "w") as file:
+        file.write("\n".join(lines) + "\n")
+    return f"bench_app_{routes}"
+
+
+def measure_cold_start(module: str, directory: str, *, lambda_environment: bool, repeat: int = 5) -> BenchmarkResult:
+    """
+    Fresh interpreter importing the app module and serving one request, like a Lambda cold start.
+    """
+    statement = (
+        "import time; start = time.perf_counter_ns()\n"
+        f"import {module}\n"
+        f"{module}.item_0({{'pathParameters': {{'item_id': '1'}}}}, None)\n"
+        "print((time.perf_counter_ns() - start) / 1000)"
+    )
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join([directory, *sys.path])}
+    if lambda_environment:
+        environment.update({"AWS_LAMBDA_FUNCTION_NAME": "bench", "_HANDLER": f"{module}.item_0"})
+    command = [sys.executable, "-c", statement]
+    timings = [
+        float(subprocess.run(command, capture_output=True, text=True, check=True, env=environment).stdout)  # noqa: S603
+        for _ in range(repeat)
+    ]
+    return BenchmarkResult(p50_us=statistics.median(timings), min_us=min(timings), samples=repeat)
+
+
+def bench_cold_start(routes: int, *, lambda_environment: bool) -> BenchmarkResult:
+    with tempfile.TemporaryDirectory() as directory:
+        module = write_app_module(directory, routes)
+        return measure_cold_start(module, directory, lambda_environment=lambda_environment)
+
+
+# eager validates all routes on import, as tests and CLI do, lambda defers all but the served one
+for routes in ROUTE_COUNTS:
+    for lambda_environment, suffix in ((False, "eager"), (True, "lambda")):
+        BENCHMARKS[f"cold_start.{routes}_routes.{suffix}"] = partial(
+            bench_cold_start, routes, lambda_environment=lambda_environment
+        )
+
+
+def noop_handler() -> None:
+    ...
+
+
+@benchmark("cli.generate_serverless_file")
+def bench_generate_serverless_file() -> BenchmarkResult:
+    from aws_spy.helpers.cli import generate_serverless_file
+
+    app = SpyAPI(config=build_config(), defer_routes=False)
+    for i in range(100):
+        app.get(f"/items{i}", f"item-{i}")(noop_handler)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "serverless.yml")
+        return measure(lambda: generate_serverless_file(app, path), number=1, repeat=5)
+
+
+def run_benchmarks(pattern: str | None = None) -> dict[str, BenchmarkResult]:
+    return {name: function() for name, function in BENCHMARKS.items() if pattern is None or pattern in name}
+
+
+def dump_results(results: dict[str, BenchmarkResult], path: str) -> None:
+    data = {
+        "meta": {
+            "aws_spy": aws_spy.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> dict[str, BenchmarkResult]:
+    with open(path) as file:
+        return {name: BenchmarkResult(**result) for name, result in json.load(file)["results"].items()}
+
+
+def compare_results(
+    baseline: dict[str, BenchmarkResult], current: dict[str, BenchmarkResult], threshold: float = DEFAULT_THRESHOLD
+) -> list[Regression]:
+    """
+    Benchmarks whose median got slower than the baseline by more than `threshold` (0.1 is 10%).
+    """
+    return [
+        Regression(name=name, baseline_us=baseline[name].p50_us, current_us=result.p50_us)
+        for name, result in current.items()
+        if name in baseline and result.p50_us > baseline[name].p50_us * (1 + threshold)
+    ]
@@ -0,0 +1,47 @@
+import hashlib
+import json
+from pathlib import Path
+
+import typing_extensions as te
+
+BUILD_CACHE_PATH = ".spy/build-cache.json"
+
+
+def hash_files(files: dict[str, Path], *extra: str) -> str:
+    """
+    Content hash of given files, keyed by a stable name (e.g. path relative to the project),
+    so the hash doesn't depend on where the project is checked out.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(name.encode())
+        digest.update(hashlib.sha256(files[name].read_bytes()).digest())
+    for value in extra:
+        digest.update(value.encode())
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """
+    Local store of input hashes of already built (or deployed) artifacts.
+    """
+
+    def __init__(self: te.Self, path: str | Path) -> None:
+        self.path = Path(path)
+        try:
+            self.data: dict[str, dict[str, str]] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.data = {}
+
+    def get(self: te.Self, section: str, key: str) -> str | None:
+        return self.data.get(section, {}).get(key)
+
+    def set(self: te.Self, section: str, key: str, value: str) -> None:  # noqa: A003
+        self.data.setdefault(section, {})[key] = value
+
+    def is_fresh(self: te.Self, section: str, key: str, value: str) -> bool:
+        return self.get(section, key) == value
+
+    def save(self: te.Self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2, sort_keys=True))
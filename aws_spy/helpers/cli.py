@@ -1,24 +1,42 @@
+import hashlib
+import json
 import os
+import subprocess
 import sys
 import typing as t
 from argparse import ArgumentParser
 from collections.abc import Callable
 from functools import wraps
 from pathlib import Path
-from shutil import copyfile, copytree
 
 import yaml  # type: ignore
 
 from aws_spy import SpyAPI
 from aws_spy.core import logger
+from aws_spy.core.config import Function, Functions, get_spy_layer_stack
 from aws_spy.core.exceptions import RouteDefinitionError
-from aws_spy.core.schemas import Function, Functions
+from aws_spy.core.manifest import MANIFEST_FILE_NAME, DispatchEntry, write_manifest
+from aws_spy.core.schemas import Methods, SpyRoute
 from aws_spy.core.types import is_type_required
+from aws_spy.dispatch import get_router_function
 
 # from aws_spy.helpers.documentation import get_openapi
-from aws_spy.helpers.exceptions import PythonEnvironmentError, WrongArgumentError
+from aws_spy.helpers.build_cache import BUILD_CACHE_PATH, BuildCache, hash_files
+from aws_spy.helpers.exceptions import WrongArgumentError
+from aws_spy.helpers.layer import build_layer, get_missing_requirements, get_wheelhouse_path, populate_wheelhouse
+from aws_spy.helpers.packaging import (
+    build_package_patterns,
+    find_included_files,
+    find_local_imports,
+    find_unpackaged_data_files,
+    get_artifact_size,
+)
 from aws_spy.helpers.utils import LoadAppFromStringError, load_app_from_string
 
+LAYER_PYTHON_VERSION = "3.10"
+LAYER_WHEELHOUSE = "wheelhouse"
+LAYER_BUILD_DIR = ".spy/layers"
+
 
 def unpack_args(function: Callable[..., None]) -> Callable[..., None]:  # pragma: no cover
     @wraps(function)
@@ -57,51 +75,45 @@ def unpack_args(function: Callable[..., None]) -> Callable[..., None]:  # pragma
 
 
 @unpack_args
-def _deploy_layer(stage: str, region: str) -> None:  # pragma: no cover
-    return _deploy_layer(stage=stage, region=region)
-
-
-def deploy_layer(stage: str, region: str) -> None:  # pragma: no cover
-    site_packages = None
-    for path in sys.path:
-        if path.endswith("site-packages"):
-            site_packages = path
-
-    if site_packages is None:
-        msg = "Couldn't find site-packages folder."
-        raise PythonEnvironmentError(msg)
-    spy_package_name = "aws_spy"
-
-    serverlesspy_path = Path(os.path.join(site_packages, spy_package_name))
-    layer_path = Path(os.path.join(serverlesspy_path, "layer", "spy", "python"))
-    serverless_layer_path = Path(os.path.join(layer_path, spy_package_name))
-    serverless_layer_path.mkdir(parents=True, exist_ok=True)
-
-    for package in ("pydantic",):
-        package_path = Path(os.path.join(site_packages, package))
-        if not package_path.is_dir():
-            msg = f'Could not find "{package}" package. Make sure it is installed in your current environment.'
-            raise PythonEnvironmentError(msg)
-        copytree(str(package_path), os.path.join(layer_path, package))
-
-    copyfile(
-        os.path.join(site_packages, "typing_extensions.py"),
-        os.path.join(layer_path, "typing_extensions.py"),
-    )
+def _deploy_layer(
+    stage: str, region: str, architecture: str | None = None, wheelhouse: str | None = None
+) -> None:  # pragma: no cover
+    return deploy_layer(stage=stage, region=region, architecture=architecture or "arm64", wheelhouse=wheelhouse)
 
-    copytree(
-        os.path.join(serverlesspy_path, "core"),
-        os.path.join(serverless_layer_path, "core"),
+
+def deploy_layer(
+    stage: str, region: str, architecture: str = "arm64", wheelhouse: str | None = None
+) -> None:  # pragma: no cover
+    wheelhouse_path = get_wheelhouse_path(
+        Path(wheelhouse or LAYER_WHEELHOUSE).resolve(), architecture, LAYER_PYTHON_VERSION
+    )
+    if get_missing_requirements(wheelhouse_path, architecture, LAYER_PYTHON_VERSION):
+        wheelhouse_path.mkdir(parents=True, exist_ok=True)
+        populate_wheelhouse(wheelhouse_path, architecture, LAYER_PYTHON_VERSION)
+
+    cache = BuildCache(BUILD_CACHE_PATH)
+    build = build_layer(
+        architecture=architecture,
+        wheelhouse=wheelhouse_path,
+        build_dir=Path(LAYER_BUILD_DIR).resolve(),
+        python_version=LAYER_PYTHON_VERSION,
+        cache=cache,
     )
-    for file_to_copy in ("__init__.py", "main.py", "responses.py"):
-        copyfile(
-            os.path.join(serverlesspy_path, file_to_copy),
-            os.path.join(serverless_layer_path, file_to_copy),
+    logger.info("Built layer %s", build)
+
+    # every architecture deploys its own stack
+    deployment = f"{stage}:{region}:{get_spy_layer_stack(architecture)}"
+    if cache.is_fresh("deployments", deployment, build.content_hash):
+        logger.info("Layer already deployed to %s, skipping.", deployment)
+    else:
+        subprocess.run(
+            ["serverless", "deploy", "-s", stage, "-c", "spy-layer.yml", "--region", region],  # noqa: S603, S607
+            cwd=Path(__file__).resolve().parent.parent / "layer",
+            env={**os.environ, "SPY_LAYER_ARTIFACT": str(build.path), "SPY_LAYER_ARCHITECTURE": architecture},
+            check=True,
         )
-    current_working_dir = os.getcwd()
-    os.chdir(os.path.join(serverlesspy_path, "layer"))
-    os.system(f"serverless deploy -s {stage} -c spy-layer.yml --region {region}")  # noqa: S605
-    os.chdir(current_working_dir)
+        cache.set("deployments", deployment, build.content_hash)
+    cache.save()
 
 
 # @unpack_args
@@ -113,15 +125,52 @@ def deploy_layer(stage: str, region: str) -> None:  # pragma: no cover
 
 @unpack_args
 def _generate_serverless_file(app: SpyAPI, path: str) -> None:  # pragma: no cover
-    return generate_serverless_file(app=app, path=path)
+    generate_serverless_file(app=app, path=path)
+
+
+def package_function(
+    name: str, function: Function, *handlers: t.Callable[..., t.Any], include: list[str] | None = None
+) -> str:
+    """
+    Limits function's artifact to the project files its handlers import, and the ones matching `include` patterns.
+    Returns content hash of the function's code closure and definition.
+    """
+    root = os.getcwd()
+    files = sorted(
+        {
+            file
+            for handler in handlers
+            for file in find_local_imports(
+                handler.__code__.co_filename, [os.path.dirname(handler.__code__.co_filename), root]
+            )
+        }
+    )
+    function.package = {"patterns": build_package_patterns(files, root, include)}
+    files += find_included_files(root, include or [])
+    data_files = find_unpackaged_data_files(files, root)
+    if data_files:
+        logger.warning(
+            "%s: %s not packaged, add them to SpyAPI package_include if they are read at runtime",
+            name,
+            ", ".join(data_files),
+        )
+    logger.info("%s: %d files, %.1f KiB zipped", name, len(files), get_artifact_size(files) / 1024)
+    return hash_files({os.path.relpath(file, root): Path(file) for file in files}, function.model_dump_json())
 
 
-def generate_serverless_file(app: SpyAPI, path: str) -> None:
+def generate_serverless_file(app: SpyAPI, path: str) -> list[str]:
+    """
+    Returns names of functions added, changed or removed since the last deployment,
+    then other top-level sections of the file (e.g. provider) that changed, per build cache kept next to the file.
+    """
     if not path.endswith(".yml"):
         msg = "File is not YAML file."
         raise WrongArgumentError(msg)
 
     functions: dict[str, Function] = {}
+    content_hashes: dict[str, str] = {}
+    routers: dict[str, list[tuple[str, Methods, SpyRoute]]] = {}
+    dispatch: dict[str, list[DispatchEntry]] = {}
     for route_path, route_dict in app.routes.items():
         for method, route in route_dict.items():
             if route.authorizer is not None and (
@@ -132,17 +181,152 @@ def generate_serverless_file(app: SpyAPI, path: str) -> None:
                 msg = f"Authorizer {route.authorizer} not defined"
                 raise RouteDefinitionError(msg)
 
-            functions[route.name] = Function.from_route(route=route, method=method, path=route_path)
+            router_function = get_router_function(route.tags, app.router_functions) if app.router_functions else None
+            if router_function is not None:
+                routers.setdefault(router_function, []).append((route_path, method, route))
+                continue
+
+            functions[route.name] = Function.from_route(
+                route=route, method=method, path=route_path, architecture=app.config.provider.architecture
+            )
+            content_hashes[route.name] = package_function(
+                route.name, functions[route.name], route.handler, include=app.package_include
+            )
+    for name, routes in routers.items():
+        other_paths = [
+            path for other_name, other_routes in routers.items() if other_name != name for path, _, _ in other_routes
+        ]
+        functions[name] = Function.from_router(
+            name=name, routes=routes, other_paths=other_paths, architecture=app.config.provider.architecture
+        )
+        content_hashes[name] = package_function(
+            name, functions[name], *(route.handler for _, _, route in routes), include=app.package_include
+        )
+        dispatch[name] = [
+            (
+                method.upper(),
+                route_path,
+                Function.build_module_import_path(Function.generate_rel_path_for_function(route)),
+                route.handler.__name__,
+            )
+            for route_path, method, route in routes
+        ]
     for function in app.functions:
-        functions[function.name] = Function.from_function(function=function)
+        functions[function.name] = Function.from_function(
+            function=function, architecture=app.config.provider.architecture
+        )
+        content_hashes[function.name] = package_function(
+            function.name, functions[function.name], function.handler, include=app.package_include
+        )
 
     app.config.functions = functions
+    config = app.config.model_dump(exclude_none=True)
 
     with open(path, "w") as file:
-        yaml.dump(app.config.model_dump(exclude_none=True), file)
+        yaml.dump(config, file)
+
+    # resolved route definitions, loaded by Lambdas instead of introspecting handlers on cold start
+    write_manifest(
+        (route for route_dict in app.routes.values() for route in route_dict.values()),
+        os.path.join(os.path.dirname(path), MANIFEST_FILE_NAME),
+        dispatch,
+    )
+
+    # functions are hashed with their code, every other top-level section of the file (provider, plugins...) as is
+    config_hashes = {
+        key: hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+        for key, value in config.items()
+        if key != "functions"
+    }
+
+    # hashes of the generated file are recorded as deployed only once the deployment succeeds
+    cache = BuildCache(os.path.join(os.path.dirname(path), BUILD_CACHE_PATH))
+    changed = [
+        name for name, content_hash in content_hashes.items() if not cache.is_fresh("functions", name, content_hash)
+    ]
+    changed += [name for name in cache.data.get("functions", {}) if name not in content_hashes]
+    changed += [
+        key
+        for key in sorted({*cache.data.get("config", {}), *config_hashes})
+        if not cache.is_fresh("config", key, config_hashes.get(key, ""))
+    ]
+    cache.data["generated"] = content_hashes
+    cache.data["generated_config"] = config_hashes
+    cache.save()
+    logger.info("Changed: %s", ", ".join(changed) or "none")
+    return changed
+
+
+def record_deployed_functions(path: str) -> None:
+    """
+    Marks the last generated serverless file as deployed.
+    """
+    cache = BuildCache(os.path.join(os.path.dirname(path), BUILD_CACHE_PATH))
+    cache.data["functions"] = dict(cache.data.get("generated", {}))
+    cache.data["config"] = dict(cache.data.get("generated_config", {}))
+    cache.save()
+
+
+@unpack_args
+def _deploy(app: SpyAPI, path: str, stage: str, region: str) -> None:  # pragma: no cover
+    deploy(app=app, path=path, stage=stage, region=region)
+
+
+def deploy(app: SpyAPI, path: str, stage: str, region: str) -> None:  # pragma: no cover
+    """
+    Generates the serverless file and deploys it, unless nothing in it changed since the last deployment.
+    """
+    if not generate_serverless_file(app, path):
+        logger.info("Nothing changed since the last deployment, skipping.")
+        return
+    subprocess.run(
+        ["serverless", "deploy", "-s", stage, "--region", region],  # noqa: S603, S607
+        cwd=os.path.dirname(os.path.abspath(path)),
+        check=True,
+    )
+    record_deployed_functions(path)
+
+
+@unpack_args
+def _bench(
+    output: str | None = None, baseline: str | None = None, threshold: float | None = None, pattern: str | None = None
+) -> None:  # pragma: no cover
+    if not bench(output=output, baseline=baseline, threshold=threshold, pattern=pattern):
+        sys.exit(1)
+
+
+def bench(
+    *,
+    output: str | None = None,
+    baseline: str | None = None,
+    threshold: float | None = None,
+    pattern: str | None = None,
+) -> bool:
+    """
+    Runs benchmarks, optionally saving results and comparing them against a baseline.
+    Returns False when any benchmark regressed beyond the threshold.
+    """
+    from aws_spy.helpers.bench import DEFAULT_THRESHOLD, compare_results, dump_results, load_results, run_benchmarks
+
+    results = run_benchmarks(pattern)
+    for name, result in results.items():
+        print(f"{name:<40} p50 {result.p50_us:>12.2f} us  min {result.min_us:>12.2f} us")  # noqa: T201
+    if output is not None:
+        dump_results(results, output)
+    if baseline is None:
+        return True
+
+    regressions = compare_results(
+        load_results(baseline), results, DEFAULT_THRESHOLD if threshold is None else threshold
+    )
+    for regression in regressions:
+        logger.error("Regression %s", regression)
+    return not regressions
 
 
 FUNCTIONS_DEFINITIONS: dict[str, Callable[..., None]] = {
+    "bench": _bench,
+    "deploy": _deploy,
     "layer": _deploy_layer,
     # "openapi": generate_openapi,
     "sls": _generate_serverless_file,
@@ -153,5 +337,7 @@ def cli_handler() -> None:  # pragma: no cover
     parser = ArgumentParser()
     parser.add_argument("function", type=Functions)
     args, _ = parser.parse_known_args()
+    # validate every route while the app is loaded, even when running inside Lambda-like environments
+    os.environ["SPY_DEFER_ROUTES"] = "0"
 
     return FUNCTIONS_DEFINITIONS[args.function](parser=parser)
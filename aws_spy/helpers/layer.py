@@ -0,0 +1,265 @@
+import compileall
+import fnmatch
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from aws_spy.core import logger
+from aws_spy.helpers.build_cache import BuildCache, hash_files
+from aws_spy.helpers.exceptions import PythonEnvironmentError
+
+# only what Lambdas import at runtime, deploy-time helpers (CLI, TestClient) stay out of the layer
+LAYER_RUNTIME_FILES = ("__init__.py", "dependencies.py", "dispatch.py", "main.py", "responses.py", "runtime.py")
+LAYER_REQUIREMENTS = ("pydantic",)
+# compiled dependencies of the requirements, a pure Python wheel never stands in for them
+LAYER_NATIVE_REQUIREMENTS = ("pydantic_core",)
+# wheel platform tags per Lambda architecture
+ARCHITECTURES = {
+    "arm64": ("manylinux2014_aarch64", "aarch64"),
+    "x86_64": ("manylinux2014_x86_64", "x86_64"),
+}
+# matched against every path component of the extracted files
+STRIP_PATTERNS = ("__pycache__", "*.pyc", "*.pyi", "py.typed", "tests", "test", "v1", "mypy.py")
+# only METADATA is kept from dist-info, so importlib.metadata still finds the distributions
+DIST_INFO_KEEP = ("METADATA",)
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+LAMBDA_LAYER_PATH = "/opt/python"
+
+
+@dataclass(frozen=True)
+class LayerBuild:
+    architecture: str
+    path: Path
+    size: int
+    import_time: float | None
+    content_hash: str
+    cached: bool = False
+
+    def __str__(self) -> str:
+        import_time = f"{self.import_time * 1000:.1f} ms" if self.import_time is not None else "not measured"
+        description = f"{self.architecture}: {self.path} ({self.size / 1024 / 1024:.2f} MiB, import {import_time})"
+        return f"{description}, unchanged" if self.cached else description
+
+
+def is_stripped(relative_path: str) -> bool:
+    parts = PurePosixPath(relative_path).parts
+    for index, part in enumerate(parts):
+        if part.endswith(".dist-info"):
+            return parts[index + 1 :] not in [(name,) for name in DIST_INFO_KEEP]
+        if any(fnmatch.fnmatch(part, pattern) for pattern in STRIP_PATTERNS):
+            return True
+    return False
+
+
+def is_wheel_compatible(wheel_name: str, architecture: str, python_version: str) -> bool:
+    python_tags, _, platform_tags = wheel_name.removesuffix(".whl").split("-")[-3:]
+    _, machine = ARCHITECTURES[architecture]
+    cpython_tag = "cp" + python_version.replace(".", "")
+    return any(tag in ("py3", cpython_tag) for tag in python_tags.split(".")) and any(
+        tag == "any" or tag.endswith(machine) for tag in platform_tags.split(".")
+    )
+
+
+def get_wheel_distribution(wheel_name: str) -> str:
+    return wheel_name.split("-")[0].lower().replace(".", "_")
+
+
+def get_missing_requirements(wheelhouse: Path, architecture: str, python_version: str) -> list[str]:
+    """
+    Layer requirements without a wheel for given architecture and Python version in the wheelhouse,
+    native ones need a platform specific wheel.
+    """
+    wheels = get_compatible_wheels(wheelhouse, architecture, python_version) if wheelhouse.is_dir() else []
+    distributions = {get_wheel_distribution(wheel.name) for wheel in wheels}
+    native_distributions = {
+        get_wheel_distribution(wheel.name) for wheel in wheels if not wheel.name.endswith("-any.whl")
+    }
+    return [
+        *(requirement for requirement in LAYER_REQUIREMENTS if requirement not in distributions),
+        *(requirement for requirement in LAYER_NATIVE_REQUIREMENTS if requirement not in native_distributions),
+    ]
+
+
+def get_wheelhouse_path(wheelhouse: Path, architecture: str, python_version: str) -> Path:
+    """
+    Wheels are downloaded per architecture and Python version, so pure Python wheels downloaded for one
+    never make the wheelhouse look complete for another.
+    """
+    return wheelhouse / f"{architecture}-py{python_version}"
+
+
+def populate_wheelhouse(wheelhouse: Path, architecture: str, python_version: str) -> None:  # pragma: no cover
+    platform, _ = ARCHITECTURES[architecture]
+    command = [
+        sys.executable,
+        "-m",
+        "pip",
+        "download",
+        "--only-binary=:all:",
+        f"--platform={platform}",
+        f"--python-version={python_version}",
+        "--implementation=cp",
+        f"--dest={wheelhouse}",
+        *LAYER_REQUIREMENTS,
+    ]
+    subprocess.run(command, check=True)  # noqa: S603
+
+
+def install_wheels(wheelhouse: Path, target: Path, architecture: str, python_version: str) -> None:
+    """
+    Extracts wheels for given architecture, wheels are plain zips, so no pip is needed.
+    """
+    wheels = get_compatible_wheels(wheelhouse, architecture, python_version)
+    if not wheels:
+        msg = f'No wheels for "{architecture}" found in "{wheelhouse}".'
+        raise PythonEnvironmentError(msg)
+    for wheel in wheels:
+        with zipfile.ZipFile(wheel) as archive:
+            for member in archive.namelist():
+                if not member.endswith("/") and not is_stripped(member):
+                    archive.extract(member, target)
+
+
+def get_compatible_wheels(wheelhouse: Path, architecture: str, python_version: str) -> list[Path]:
+    return sorted(
+        wheel for wheel in wheelhouse.glob("*.whl") if is_wheel_compatible(wheel.name, architecture, python_version)
+    )
+
+
+def get_spy_package_files() -> dict[str, Path]:
+    """
+    aws_spy files shipped with the layer, keyed by their path inside the layer.
+    """
+    spy_path = Path(__file__).resolve().parent.parent
+    files = {
+        source.relative_to(spy_path.parent).as_posix(): source
+        for source in sorted(spy_path.joinpath("core").rglob("*.py"))
+        if not is_stripped(source.relative_to(spy_path).as_posix())
+    }
+    files.update({f"{spy_path.name}/{file_name}": spy_path / file_name for file_name in LAYER_RUNTIME_FILES})
+    return files
+
+
+def get_layer_inputs(wheelhouse: Path, architecture: str, python_version: str) -> dict[str, Path]:
+    inputs = {wheel.name: wheel for wheel in get_compatible_wheels(wheelhouse, architecture, python_version)}
+    inputs.update(get_spy_package_files())
+    return inputs
+
+
+def copy_spy_package(target: Path) -> None:
+    for relative_path, source in get_spy_package_files().items():
+        (target / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target / relative_path)
+
+
+def precompile(target: Path, python_version: str, optimize: int) -> bool:
+    """
+    Precompiles bytecode, so Lambdas don't compile on cold start (layers are read-only there).
+    Unchecked hash based .pyc are deterministic and skip source stat on import.
+    """
+    if f"{sys.version_info.major}.{sys.version_info.minor}" != python_version:
+        logger.warning("Python %s is needed to precompile the layer, skipping.", python_version)
+        return False
+    return compileall.compile_dir(
+        str(target),
+        quiet=1,
+        optimize=optimize,
+        workers=0,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        # paths as mounted in Lambda, also keeps .pyc files independent of the build directory
+        stripdir=str(target),
+        prependdir=LAMBDA_LAYER_PATH,
+    )
+
+
+def zip_deterministic(source: Path, zip_path: Path) -> None:
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        for path in sorted(source.rglob("*")):
+            if path.is_dir():
+                continue
+            info = zipfile.ZipInfo(path.relative_to(source).as_posix(), date_time=ZIP_DATE_TIME)
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, path.read_bytes())
+
+
+def measure_import_time(python_path: Path, architecture: str, python_version: str) -> float | None:
+    """
+    Import time of the runtime surface from the built layer only (site-packages disabled).
+    Measurable only when host matches the layer's architecture and Python version.
+    """
+    _, machine = ARCHITECTURES[architecture]
+    host_machine = os.uname().machine.replace("arm64", "aarch64")
+    if host_machine != machine or f"{sys.version_info.major}.{sys.version_info.minor}" != python_version:
+        return None
+    statement = "import time; start = time.perf_counter(); import aws_spy.main; print(time.perf_counter() - start)"
+    result = subprocess.run(
+        [sys.executable, "-S", "-c", statement],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=False,
+        env={"PYTHONPATH": str(python_path)},
+    )
+    if result.returncode:
+        logger.warning("Could not import the layer: %s", result.stderr.strip())
+        return None
+    return float(result.stdout)
+
+
+def build_layer(
+    *,
+    architecture: str,
+    wheelhouse: Path,
+    build_dir: Path,
+    python_version: str = "3.10",
+    optimize: int = 0,
+    cache: BuildCache | None = None,
+) -> LayerBuild:
+    """
+    Builds the spy layer zip for given architecture out of a local wheelhouse.
+    `optimize` has to match the PYTHONOPTIMIZE level Lambdas run with, otherwise .pyc files are ignored.
+    With cache given, the build is skipped when none of the inputs changed since the last one.
+    """
+    if architecture not in ARCHITECTURES:
+        msg = f'Unsupported architecture "{architecture}".'
+        raise PythonEnvironmentError(msg)
+
+    zip_path = build_dir / f"spy-layer-{architecture}.zip"
+    content_hash = hash_files(
+        get_layer_inputs(wheelhouse, architecture, python_version), architecture, python_version, str(optimize)
+    )
+    if cache is not None and cache.is_fresh("layers", architecture, content_hash) and zip_path.is_file():
+        return LayerBuild(
+            architecture=architecture,
+            path=zip_path,
+            size=zip_path.stat().st_size,
+            import_time=None,
+            content_hash=content_hash,
+            cached=True,
+        )
+
+    layer_dir = build_dir / architecture
+    python_path = layer_dir / "python"
+    shutil.rmtree(layer_dir, ignore_errors=True)
+    python_path.mkdir(parents=True)
+
+    install_wheels(wheelhouse, python_path, architecture, python_version)
+    copy_spy_package(python_path)
+    precompile(python_path, python_version, optimize)
+
+    zip_deterministic(layer_dir, zip_path)
+    if cache is not None:
+        cache.set("layers", architecture, content_hash)
+    return LayerBuild(
+        architecture=architecture,
+        path=zip_path,
+        size=zip_path.stat().st_size,
+        import_time=measure_import_time(python_path, architecture, python_version),
+        content_hash=content_hash,
+    )
@@ -0,0 +1,129 @@
+import ast
+import io
+import os
+import zipfile
+from functools import cache
+from glob import glob
+from pathlib import Path
+
+from aws_spy.core.manifest import MANIFEST_FILE_NAME
+
+# shipped with the spy layer, never part of function artifacts
+LAYER_PACKAGES = ("aws_spy",)
+
+
+def _resolve_module(module_name: str, search_paths: list[Path]) -> Path | None:
+    parts = module_name.split(".")
+    if parts[0] in LAYER_PACKAGES:
+        return None
+    for search_path in search_paths:
+        candidate = search_path.joinpath(*parts)
+        if candidate.with_suffix(".py").is_file():
+            return candidate.with_suffix(".py")
+        if (candidate / "__init__.py").is_file():
+            return candidate / "__init__.py"
+    return None
+
+
+def _imported_module_names(file_path: Path, package: str) -> frozenset[str]:
+    # handlers usually share modules, so every file is parsed once per its version
+    return _parse_imported_module_names(file_path, file_path.stat().st_mtime_ns, package)
+
+
+@cache
+def _parse_imported_module_names(file_path: Path, mtime_ns: int, package: str) -> frozenset[str]:  # noqa: ARG001
+    tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package.split(".")[: len(package.split(".")) - node.level + 1] if package else []
+                module = ".".join([*base, node.module] if node.module else base)
+            else:
+                module = node.module or ""
+            if not module:
+                continue
+            names.add(module)
+            # "from package import module" imports submodules as well
+            names.update(f"{module}.{alias.name}" for alias in node.names)
+    return frozenset(names)
+
+
+def find_local_imports(file_path: str, search_paths: list[str]) -> list[str]:
+    """
+    Walks the import graph statically, starting from handler's file.
+    Returns project files the handler needs (including parent packages' __init__.py), third party
+    packages are left out, they are shipped by requirements or layers.
+    """
+    paths = [Path(search_path).resolve() for search_path in search_paths]
+    start = Path(file_path).resolve()
+    seen: set[Path] = set()
+    to_visit = [(start, "")]
+    while to_visit:
+        current, package = to_visit.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        for module_name in _imported_module_names(current, package):
+            parts = module_name.split(".")
+            # importing a submodule runs every parent package first
+            for i in range(1, len(parts) + 1):
+                resolved = _resolve_module(".".join(parts[:i]), paths)
+                if resolved is not None and resolved not in seen:
+                    resolved_package = ".".join(parts[:i] if resolved.name == "__init__.py" else parts[: i - 1])
+                    to_visit.append((resolved, resolved_package))
+    return sorted(str(path) for path in seen)
+
+
+def build_package_patterns(files: list[str], root: str, include: list[str] | None = None) -> list[str]:
+    """
+    Serverless `package.patterns`, everything is excluded but the given files, `include` patterns and route manifest.
+    """
+    root_path = Path(root).resolve()
+    return [
+        "!**",
+        *(Path(file).relative_to(root_path).as_posix() for file in files),
+        *(include or []),
+        MANIFEST_FILE_NAME,
+    ]
+
+
+def find_included_files(root: str, include: list[str]) -> list[str]:
+    """
+    Files matching `include` glob patterns, relative to the project root.
+    """
+    return sorted(
+        os.path.join(root, path)
+        for pattern in include
+        for path in glob(pattern, root_dir=root, recursive=True)
+        if os.path.isfile(os.path.join(root, path))
+    )
+
+
+def find_unpackaged_data_files(files: list[str], root: str) -> list[str]:
+    """
+    Non-Python files sitting in packages of the packaged files, which imports can't tell are needed,
+    e.g. templates read with `Path(__file__).parent` or `importlib.resources`.
+    """
+    root_path = Path(root).resolve()
+    packaged = {Path(file).resolve() for file in files}
+    data_files = []
+    for package in {path.parent for path in packaged if (path.parent / "__init__.py").is_file()}:
+        for path in package.iterdir():
+            if path.is_file() and path.suffix not in (".py", ".pyc") and not path.name.startswith("."):
+                if path not in packaged:
+                    data_files.append(path.relative_to(root_path).as_posix())
+    return sorted(data_files)
+
+
+def get_artifact_size(files: list[str]) -> int:
+    """
+    Size of the zipped function code, without requirements and layers.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for file in files:
+            archive.write(file)
+    return buffer.tell()
@@ -1,42 +1,68 @@
 import typing as t
+from collections.abc import Callable
 from functools import wraps
 
 import typing_extensions as te
 from pydantic import BaseModel
 
-from aws_spy.core.event_utils import export_params_from_event, export_request_body
-from aws_spy.core.exceptions import (
-    BaseSpyError,
-    FunctionDefinitionError,
-    RouteDefinitionError,
-)
-from aws_spy.core.responses import BaseResponseSPY
+from aws_spy.core.cache import ResponseCache
+from aws_spy.core.compression import Compression
+from aws_spy.core.encoders import JSONBackend, JSONBackendName, build_json_backend
+from aws_spy.core.exceptions import FunctionDefinitionError, RouteDefinitionError
+from aws_spy.core.metrics import Metrics, MetricsRecorder
 from aws_spy.core.schemas import (
     LH,
     Decorator,
     Methods,
-    ServerlessConfig,
+    RouteStub,
     SpyFunction,
     SpyRoute,
+    is_lambda_handler,
+    should_defer_routes,
 )
-from aws_spy.responses import ErrorResponse, JSONResponse
+from aws_spy.runtime import compile_function, compile_route
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from aws_spy.asgi import ASGIApp
+    from aws_spy.core.batch import SpyBatchFunction
+    from aws_spy.core.config import ServerlessConfig
 
 
 class _SPY:
-    routes: dict[str, dict[Methods, SpyRoute]]
+    _routes: dict[str, dict[Methods, SpyRoute | RouteStub]]
     functions: list[SpyFunction]
     function_unique_ids: set[str]
 
-    def __init__(self: te.Self, prefix: str | None = None) -> None:
-        self.routes = {}
+    def __init__(
+        self: te.Self,
+        prefix: str | None = None,
+        compression: Compression | bool | None = None,
+        defer_routes: bool | None = None,
+        metrics: Metrics | bool | None = None,
+    ) -> None:
+        self._routes = {}
         self.functions = []
         self.function_unique_ids = set()
         if isinstance(prefix, str) and not prefix.startswith("/"):
             prefix = "/" + prefix
         self.prefix = prefix or ""
+        self.compression = compression
+        self.defer_routes = should_defer_routes() if defer_routes is None else defer_routes
+        self.metrics = MetricsRecorder(Metrics() if metrics is True else metrics) if metrics else None
+        self.json_backend: JSONBackend | None = None
+
+    @property
+    def routes(self: te.Self) -> dict[str, dict[Methods, SpyRoute]]:
+        """
+        Registered routes, deferred ones are materialised on access.
+        """
+        for methods in self._routes.values():
+            for method, route in methods.items():
+                methods[method] = route.materialize()
+        return self._routes  # type: ignore
 
     def register_router(self: te.Self, router: t.Any) -> None:
-        for path, methods in router.routes.items():
+        for path, methods in router._routes.items():
             for method, route in methods.items():
                 self.add_route(path, method, route)
         for function in router.functions:
@@ -49,7 +75,7 @@ class _SPY:
         self.function_unique_ids.add(function.name)
         self.functions.append(function)
 
-    def add_route(self: te.Self, path: str, method: Methods, route: SpyRoute) -> None:
+    def add_route(self: te.Self, path: str, method: Methods, route: SpyRoute | RouteStub) -> None:
         if not path.startswith("/"):
             path = "/" + path
         path = self.prefix + path
@@ -57,15 +83,30 @@ class _SPY:
             msg = f"There is already {route.name} lambda registered."
             raise RouteDefinitionError(msg)
 
-        if path in self.routes.keys() and method in self.routes[path]:
+        if path in self._routes.keys() and method in self._routes[path]:
             msg = f'There is already existing "{method.upper()}" method definition under "{path}" path.'
             raise RouteDefinitionError(msg)
 
-        if path not in self.routes.keys():
-            self.routes[path] = {}
+        if path not in self._routes.keys():
+            self._routes[path] = {}
 
+        if route.compression is None:
+            route.compression = self.compression
+        if route.metrics is None:
+            route.metrics = self.metrics
+        if route.json_backend is None:
+            route.json_backend = self.json_backend
         self.function_unique_ids.add(route.name)
-        self.routes[path][method] = route
+        self._routes[path][method] = route
+
+    def compile(self: te.Self) -> None:  # noqa: A003
+        """
+        Builds runtime plans for all registered routes upfront,
+        otherwise every route is compiled on its first invocation.
+        """
+        for methods in self.routes.values():
+            for route in methods.values():
+                compile_route(route)
 
     def function(
         self: te.Self,
@@ -86,17 +127,148 @@ class _SPY:
                 layers=layers,
             )
             self.add_function(function)
+            # event validator is built upfront, so invocations only run it
+            plan = compile_function(function)
 
             @wraps(handler)
-            def wrapper(*args) -> dict[str, t.Any]:
-                if function.skip_validation:
-                    return handler(*args)
-                return handler(*args)
+            def wrapper(*args) -> t.Any:
+                return plan(*args)
 
             return wrapper
 
         return decorartor
 
+    def sqs(
+        self: te.Self,
+        name: str,
+        *,
+        queue: str,
+        model: t.Any = None,
+        batch_size: int = 10,
+        maximum_batching_window: int = 0,
+        max_concurrency: int = 1,
+        columnar: bool = False,
+        use_vpc: bool | None = False,
+        layers: list[str] | None = None,
+    ) -> Decorator:
+        """
+        Function consuming SQS `queue`, its handler gets a single message body validated into `model`,
+        or into the handler's first argument annotation. Raising fails only the message being processed.
+        With `columnar` the handler gets the whole batch at once, as a column per field of the flat `model`.
+        """
+
+        def decorator(handler: LH) -> LH:
+            # batch functions are imported only by apps declaring them, not by HTTP Lambdas
+            from aws_spy.core.batch import SpySQSFunction
+
+            function = SpySQSFunction(
+                name=name,
+                handler=handler,
+                queue=queue,
+                record_model=model,
+                batch_size=batch_size,
+                maximum_batching_window=maximum_batching_window,
+                max_concurrency=max_concurrency,
+                columnar=columnar,
+                use_vpc=use_vpc,
+                layers=layers,
+            )
+            return self.add_batch_function(function)
+
+        return decorator
+
+    def kinesis(
+        self: te.Self,
+        name: str,
+        *,
+        stream: str,
+        model: t.Any = None,
+        batch_size: int = 100,
+        maximum_batching_window: int = 0,
+        starting_position: t.Literal["LATEST", "TRIM_HORIZON"] = "LATEST",
+        max_concurrency: int = 1,
+        columnar: bool = False,
+        use_vpc: bool | None = False,
+        layers: list[str] | None = None,
+    ) -> Decorator:
+        """
+        Function consuming Kinesis `stream`, its handler gets a single record's data validated into `model`,
+        or the lazily decoded `KinesisRecord` itself.
+        """
+
+        def decorator(handler: LH) -> LH:
+            from aws_spy.core.batch import SpyKinesisFunction
+
+            function = SpyKinesisFunction(
+                name=name,
+                handler=handler,
+                stream=stream,
+                record_model=model,
+                batch_size=batch_size,
+                maximum_batching_window=maximum_batching_window,
+                starting_position=starting_position,
+                max_concurrency=max_concurrency,
+                columnar=columnar,
+                use_vpc=use_vpc,
+                layers=layers,
+            )
+            return self.add_batch_function(function)
+
+        return decorator
+
+    def dynamodb_stream(
+        self: te.Self,
+        name: str,
+        *,
+        stream: str,
+        model: t.Any = None,
+        batch_size: int = 100,
+        maximum_batching_window: int = 0,
+        starting_position: t.Literal["LATEST", "TRIM_HORIZON"] = "LATEST",
+        max_concurrency: int = 1,
+        columnar: bool = False,
+        use_vpc: bool | None = False,
+        layers: list[str] | None = None,
+    ) -> Decorator:
+        """
+        Function consuming DynamoDB `stream`, its handler gets a single record's item image validated into `model`,
+        or the lazily unmarshalled `DynamoDBRecord` itself.
+        """
+
+        def decorator(handler: LH) -> LH:
+            from aws_spy.core.batch import SpyDynamoDBStreamFunction
+
+            function = SpyDynamoDBStreamFunction(
+                name=name,
+                handler=handler,
+                stream=stream,
+                record_model=model,
+                batch_size=batch_size,
+                maximum_batching_window=maximum_batching_window,
+                starting_position=starting_position,
+                max_concurrency=max_concurrency,
+                columnar=columnar,
+                use_vpc=use_vpc,
+                layers=layers,
+            )
+            return self.add_batch_function(function)
+
+        return decorator
+
+    def add_batch_function(self: te.Self, function: "SpyBatchFunction") -> LH:
+        from aws_spy.core.batch import compile_batch_function
+
+        self.add_function(function)
+
+        @wraps(function.handler)
+        def wrapper(event: dict[str, t.Any], context: t.Any = None) -> dict[str, t.Any]:
+            plan = function.plan
+            if plan is None:
+                plan = compile_batch_function(function)
+            return plan(event, context)
+
+        return wrapper
+
     def route(
         self: te.Self,
         *,
@@ -112,9 +284,17 @@ class _SPY:
         use_vpc: bool | None = None,
         skip_validation: bool | None = None,
         layers: list[str] | None = None,
+        compression: Compression | bool | None = None,
+        cache: ResponseCache | bool | None = None,
+        etag: bool = False,
     ) -> Decorator:
+        if (cache or etag) and method != Methods.GET:
+            msg = f'Responses of {method.upper()} method on "{path}" path can\'t be cached nor tagged with ETag!'
+            raise RouteDefinitionError(msg)
+
         def decorator(handler: LH) -> LH:
-            route = SpyRoute(
+            route_class = RouteStub if self.defer_routes and not is_lambda_handler(handler) else SpyRoute
+            route = route_class(
                 method=method,
                 path=path,
                 name=name,
@@ -128,49 +308,21 @@ class _SPY:
                 use_vpc=use_vpc,
                 skip_validation=skip_validation,
                 layers=layers,
+                compression=compression,
+                cache=cache,
+                etag=etag,
             )
             self.add_route(path, method, route)
 
             @wraps(handler)
             def wrapper(*args) -> dict[str, t.Any]:
-                if route.skip_validation:
-                    return handler(*args)
-                event = args[0]
-                context = args[1]
-                kwargs, errors = {}, []
-                for params, errors_ in [
-                    export_params_from_event(event.get("pathParameters"), route.path_params, "path"),
-                    export_params_from_event(event.get("headers"), route.header_params, "header"),
-                    export_params_from_event(event.get("queryStringParameters"), route.query_params, "query"),
-                ]:
-                    kwargs.update(params)
-                    errors += errors_
-
-                if route.request_body and route.request_body_arg_name:
-                    request_body, request_body_errors = export_request_body(event.get("body", ""), route.request_body)
-                    errors += request_body_errors
-                    kwargs[route.request_body_arg_name] = request_body
-
-                if errors:
-                    return ErrorResponse(errors, status_code=422).response
-                if route.add_event:
-                    kwargs["event"] = event
-                if route.add_context:
-                    kwargs["context"] = context
-
-                try:
-                    return_obj = handler(**kwargs)
-                except BaseSpyError as e:
-                    return ErrorResponse(
-                        e.error, status_code=e.status_code, additional_headers=e.additional_headers
-                    ).response
-
-                if not isinstance(return_obj, BaseResponseSPY):
-                    return_obj = JSONResponse(return_obj)
-                return_obj.route = route
-
-                return return_obj.response
+                plan = route.plan
+                if plan is None:
+                    plan = compile_route(route.materialize())
+                return plan(*args)
 
+            # lets TestClient decode responses with the route's JSON backend
+            wrapper.route = route  # type: ignore[attr-defined]
             return wrapper
 
         return decorator
@@ -189,6 +341,9 @@ class _SPY:
         use_vpc: bool = True,
         skip_validation: bool = False,
         layers: list[str] | None = None,
+        compression: Compression | bool | None = None,
+        cache: ResponseCache | bool | None = None,
+        etag: bool = False,
     ) -> Decorator:
         return self.route(
             method=Methods.GET,
@@ -203,6 +358,9 @@ class _SPY:
             use_vpc=use_vpc,
             skip_validation=skip_validation,
             layers=layers,
+            compression=compression,
+            cache=cache,
+            etag=etag,
         )
 
     def post(
@@ -219,6 +377,7 @@ class _SPY:
         use_vpc: bool = True,
         skip_validation: bool = False,
         layers: list[str] | None = None,
+        compression: Compression | bool | None = None,
     ) -> Decorator:
         return self.route(
             method=Methods.POST,
@@ -233,6 +392,7 @@ class _SPY:
             use_vpc=use_vpc,
             skip_validation=skip_validation,
             layers=layers,
+            compression=compression,
         )
 
     def delete(
@@ -249,6 +409,7 @@ class _SPY:
         use_vpc: bool = True,
         skip_validation: bool = False,
         layers: list[str] | None = None,
+        compression: Compression | bool | None = None,
     ) -> Decorator:
         return self.route(
             method=Methods.DELETE,
@@ -263,6 +424,7 @@ class _SPY:
             use_vpc=use_vpc,
             skip_validation=skip_validation,
             layers=layers,
+            compression=compression,
         )
 
     def put(
@@ -279,6 +441,7 @@ class _SPY:
         use_vpc: bool = True,
         skip_validation: bool = False,
         layers: list[str] | None = None,
+        compression: Compression | bool | None = None,
     ) -> Decorator:
         return self.route(
             method=Methods.PUT,
@@ -293,6 +456,7 @@ class _SPY:
             use_vpc=use_vpc,
             skip_validation=skip_validation,
             layers=layers,
+            compression=compression,
         )
 
     def patch(
@@ -309,6 +473,7 @@ class _SPY:
         use_vpc: bool = True,
         skip_validation: bool = False,
         layers: list[str] | None = None,
+        compression: Compression | bool | None = None,
     ) -> Decorator:
         return self.route(
             method=Methods.PATCH,
@@ -323,6 +488,7 @@ class _SPY:
             use_vpc=use_vpc,
             skip_validation=skip_validation,
             layers=layers,
+            compression=compression,
         )
 
 
@@ -330,20 +496,63 @@ class SpyAPI(_SPY):
     def __init__(
         self: te.Self,
         *,
-        config: ServerlessConfig,
+        config: "ServerlessConfig | Callable[[], ServerlessConfig]",
         environment: dict[str, t.Any] | None = None,
         title: str | None = None,
         version: str | None = None,
         prefix: str | None = None,
+        json_backend: JSONBackend | JSONBackendName | None = None,
+        compact_json: bool = False,
+        compression: Compression | bool | None = None,
+        defer_routes: bool | None = None,
+        router_functions: dict[str, list[str] | None] | None = None,
+        metrics: Metrics | bool | None = None,
+        package_include: list[str] | None = None,
     ) -> None:
-        super().__init__(prefix)
+        super().__init__(prefix, compression, defer_routes, metrics)
+        if isinstance(json_backend, JSONBackend):
+            self.json_backend = json_backend
+        elif json_backend is not None or compact_json:
+            # scoped to routes of this app, other apps in the process keep their own backends
+            self.json_backend = build_json_backend(json_backend or "stdlib", compact=compact_json)
 
         self.title = title or "My API"
         self.version = version or "v0.0.1"
-        self.config: ServerlessConfig = config
+        self._config = config
         self.environment = environment
+        # router Lambda name -> tags of routes it serves (None for all the rest), see aws_spy.dispatch
+        self.router_functions = router_functions
+        # patterns of files, relative to the project root, shipped with every function besides imported modules,
+        # e.g. templates or data files read at runtime
+        self.package_include = package_include or []
+
+    @property
+    def config(self: te.Self) -> "ServerlessConfig":
+        # config may be given as a factory, so Lambdas never build deploy-time models
+        if callable(self._config):
+            self._config = self._config()
+        return self._config
+
+    @config.setter
+    def config(self: te.Self, config: "ServerlessConfig") -> None:
+        self._config = config
+
+    def as_asgi(self: te.Self, *, max_workers: int | None = None) -> "ASGIApp":
+        """
+        ASGI app serving the same routes, e.g. `uvicorn module:app.as_asgi` with `--factory`.
+        Routes registered afterwards are not served.
+        """
+        from aws_spy.asgi import ASGIApp
+
+        return ASGIApp(self, max_workers=max_workers)
 
 
 class SpyRouter(_SPY):
-    def __init__(self: te.Self, prefix: str | None = None) -> None:
-        super().__init__(prefix)
+    def __init__(
+        self: te.Self,
+        prefix: str | None = None,
+        compression: Compression | bool | None = None,
+        defer_routes: bool | None = None,
+        metrics: Metrics | bool | None = None,
+    ) -> None:
+        super().__init__(prefix, compression, defer_routes, metrics)
@@ -1,17 +1,25 @@
-import json
+import io
 import typing as t
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum
 
 import typing_extensions as te
 from pydantic import BaseModel
 
-from aws_spy.core.encoders import JSONEncoder
+from aws_spy.core.encoders import JSONBackend, get_json_backend, get_model_serializer
 from aws_spy.core.responses import BaseResponseSPY
 from aws_spy.core.schemas import SpyRoute
 
 
+def get_route_json_backend(route: SpyRoute | None) -> JSONBackend:
+    if route is None or route.json_backend is None:
+        return get_json_backend()
+    return route.json_backend
+
+
 class ContentType(str, Enum):
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
 
 
 class JSONResponse(BaseResponseSPY):
@@ -21,10 +29,13 @@ class JSONResponse(BaseResponseSPY):
         *,
         status_code: int | None = None,
         additional_headers: dict[str, t.Any] | None = None,
+        etag: str | None = None,
     ) -> None:
         self.data = data
         self.status_code = status_code
         self.additional_headers = additional_headers
+        # version token of the data, used as ETag of routes with `etag=True`
+        self.etag = etag
         self.route: SpyRoute | None = None
 
     @property
@@ -35,19 +46,14 @@ class JSONResponse(BaseResponseSPY):
         if self.additional_headers is not None:
             headers.update(self.additional_headers)
 
-        if self.route is not None and self.route.response_class is not None and isinstance(self.data, dict):
-            self.data = self.route.response_class.model_validate(self.data)
-
-        if (
-            self.route is not None
-            and self.route.response_class is not None
-            and isinstance(self.data, BaseModel)
-            and not isinstance(self.data, self.route.response_class)
-        ):
-            self.data = self.route.response_class.model_validate(self.data.model_dump())
-
-        if isinstance(self.data, BaseModel):
-            self.data = self.data.model_dump()
+        json_backend = get_route_json_backend(self.route)
+        response_class = self.route.response_class if self.route is not None else None
+        if response_class is not None and isinstance(self.data, dict | BaseModel):
+            body = json_backend.dumps_model(get_model_serializer(response_class), self.data)
+        elif isinstance(self.data, BaseModel):
+            body = json_backend.dumps_model(get_model_serializer(type(self.data)), self.data)
+        else:
+            body = json_backend.dumps(self.data)
 
         if self.status_code is not None:
             status_code = self.status_code
@@ -58,7 +64,7 @@ class JSONResponse(BaseResponseSPY):
 
         return {
             "statusCode": status_code,
-            "body": json.dumps(self.data, cls=JSONEncoder, ensure_ascii=False),
+            "body": body,
             "headers": headers,
         }
 
@@ -82,6 +88,7 @@ class ErrorResponse(BaseResponseSPY):
         self.errors = errors
         self.status_code = status_code
         self.additional_headers = additional_headers
+        self.route: SpyRoute | None = None
 
     @property
     def response(self: te.Self) -> dict[str, t.Any]:
@@ -100,10 +107,107 @@ class ErrorResponse(BaseResponseSPY):
 
         return {
             "statusCode": self.status_code,
-            "body": json.dumps(
-                body,
-                cls=JSONEncoder,
-                ensure_ascii=False,
-            ),
+            "body": get_route_json_backend(self.route).dumps(body),
             "headers": headers,
         }
+
+
+class StreamingResponse(BaseResponseSPY):
+    """
+    Response built from an iterable of chunks.
+    Lambda responses are always buffered, the managed Python runtime can't stream them,
+    so `response` writes the chunks one by one into a single body without materialising the items first.
+    """
+
+    def __init__(
+        self: te.Self,
+        content: Iterable[str | bytes],
+        *,
+        media_type: str = ContentType.JSON.value,
+        status_code: int | None = None,
+        additional_headers: dict[str, t.Any] | None = None,
+    ) -> None:
+        self.content = content
+        self.media_type = media_type
+        self.status_code = status_code
+        self.additional_headers = additional_headers
+        self.route: SpyRoute | None = None
+
+    @property
+    def headers(self: te.Self) -> dict[str, t.Any]:
+        headers = {
+            "Content-Type": self.media_type,
+        }
+        if self.additional_headers is not None:
+            headers.update(self.additional_headers)
+        return headers
+
+    def get_status_code(self: te.Self) -> int:
+        if self.status_code is not None:
+            return self.status_code
+        if self.route is None or self.route.status_code is None:
+            return 200
+        return self.route.status_code
+
+    def iter_chunks(self: te.Self) -> Iterator[str]:
+        for chunk in self.content:
+            yield chunk.decode() if isinstance(chunk, bytes) else chunk
+
+    def stream(self: te.Self, write: Callable[[str], t.Any]) -> None:
+        for chunk in self.iter_chunks():
+            write(chunk)
+
+    @property
+    def response(self: te.Self) -> dict[str, t.Any]:
+        buffer = io.StringIO()
+        self.stream(buffer.write)
+        return {
+            "statusCode": self.get_status_code(),
+            "body": buffer.getvalue(),
+            "headers": self.headers,
+        }
+
+
+class JSONStreamResponse(StreamingResponse):
+    """
+    Encodes items of an iterable (models, dicts, rows...) one at a time,
+    as a JSON array (`ndjson=False`) or as newline delimited JSON.
+    With route's `response_class` set, every item is validated and serialized with it.
+    """
+
+    def __init__(
+        self: te.Self,
+        data: Iterable[t.Any],
+        *,
+        ndjson: bool = False,
+        status_code: int | None = None,
+        additional_headers: dict[str, t.Any] | None = None,
+    ) -> None:
+        super().__init__(
+            data,
+            media_type=ContentType.NDJSON.value if ndjson else ContentType.JSON.value,
+            status_code=status_code,
+            additional_headers=additional_headers,
+        )
+        self.ndjson = ndjson
+
+    def encode(self: te.Self, item: t.Any) -> str:
+        json_backend = get_route_json_backend(self.route)
+        response_class = self.route.response_class if self.route is not None else None
+        if response_class is not None and isinstance(item, dict | BaseModel):
+            return json_backend.dumps_model(get_model_serializer(response_class), item)
+        if isinstance(item, BaseModel):
+            return json_backend.dumps_model(get_model_serializer(type(item)), item)
+        return json_backend.dumps(item)
+
+    def iter_chunks(self: te.Self) -> Iterator[str]:
+        if self.ndjson:
+            for item in self.content:
+                yield self.encode(item) + "\n"
+            return
+
+        separator = "["
+        for item in self.content:
+            yield separator + self.encode(item)
+            separator = ","
+        yield "[]" if separator == "[" else "]"
@@ -0,0 +1,457 @@
+import inspect
+import typing as t
+from collections.abc import Callable, Iterator
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+
+from pydantic import BaseModel, TypeAdapter
+
+from aws_spy.core.cache import CACHEABLE_STATUS_CODES, ResponseCache, ResponseCacheStore, build_cache_key
+from aws_spy.core.compression import Compression, compress_response, decode_request_body, get_header
+from aws_spy.core.encoders import ModelSerializer, get_model_serializer, get_type_adapter
+from aws_spy.core.etag import (
+    build_not_modified,
+    compute_etag,
+    etag_matches,
+    is_head_request,
+    not_modified,
+    quote_etag,
+    strip_body,
+)
+from aws_spy.core.event_utils import export_request_body, get_request_method
+from aws_spy.core.exceptions import (
+    BaseSpyError,
+    RequestBodyTooLargeError,
+    RouteDefinitionError,
+    UnsupportedContentEncodingError,
+)
+from aws_spy.core.metrics import MetricsRecorder, PhaseTimer, server_timing_header
+from aws_spy.core.responses import BaseResponseSPY
+from aws_spy.core.schemas import LH, SpyFunction, SpyRoute, get_event_model
+from aws_spy.dependencies import DependencyGraph
+from aws_spy.responses import ErrorResponse, JSONResponse, JSONStreamResponse
+
+Extractor = Callable[[dict[str, t.Any]], tuple[dict[str, t.Any], list[str]]]
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePlan:
+    """
+    Runtime descriptor of a single route, built once per route.
+    Everything that can be decided from the route definition is decided here,
+    so an invocation only pays for the work its route actually needs.
+    """
+
+    route: SpyRoute
+    handler: LH
+    extract: Extractor | None
+    add_event: bool
+    add_context: bool
+    skip_validation: bool
+    compression: Compression | None
+    is_async: bool = False
+    dependencies: DependencyGraph | None = None
+    cache: ResponseCacheStore | None = None
+    etag: bool = False
+
+    def __call__(self, *args: t.Any) -> dict[str, t.Any]:
+        if self.is_async:
+            # asyncio is imported only by apps having async handlers
+            from aws_spy.core.concurrency import run_sync
+
+            return run_sync(self.call_async(*args))
+        return self.run(args)
+
+    async def call_async(self, *args: t.Any) -> dict[str, t.Any]:
+        """
+        Same as calling the plan, but awaits coroutine handlers.
+        Calling the plan of an async handler runs this on the persistent event loop.
+        """
+        return await self.run_async(args)
+
+    def run(self, args: tuple[t.Any, ...], timer: PhaseTimer | None = None) -> dict[str, t.Any]:
+        """
+        Serves an invocation, ends a `timer` phase after each step when given (see TimedRoutePlan).
+        """
+        if self.skip_validation:
+            response = self.handler(*args)
+            if timer is not None:
+                timer.lap("handler")
+            return response
+
+        kwargs = self.prepare(args, timer)
+        if not isinstance(kwargs, dict):
+            return self.respond(kwargs)
+        if self.cache is not None:
+            return self.call_cached(kwargs, args, timer)
+        return self.invoke(kwargs, args, timer)
+
+    async def run_async(self, args: tuple[t.Any, ...], timer: PhaseTimer | None = None) -> dict[str, t.Any]:
+        if self.skip_validation:
+            response = await self.handler(*args)
+            if timer is not None:
+                timer.lap("handler")
+            return response
+
+        kwargs = self.prepare(args, timer)
+        if not isinstance(kwargs, dict):
+            return self.respond(kwargs)
+        if self.cache is not None:
+            return await self.call_cached_async(kwargs, args, timer)
+        return await self.invoke_async(kwargs, args, timer)
+
+    def invoke(
+        self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], timer: PhaseTimer | None = None
+    ) -> dict[str, t.Any]:
+        try:
+            if self.dependencies is None:
+                return self.complete(self.handler(**kwargs), args[0], timer)
+            return self.call_with_dependencies(kwargs, args, timer)
+        except BaseSpyError as e:
+            if timer is not None:
+                timer.lap("handler")
+            return self.respond(
+                ErrorResponse(e.error, status_code=e.status_code, additional_headers=e.additional_headers)
+            )
+
+    async def invoke_async(
+        self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], timer: PhaseTimer | None = None
+    ) -> dict[str, t.Any]:
+        try:
+            if self.dependencies is None:
+                return self.complete(await self.handler(**kwargs), args[0], timer)
+            return await self.call_with_dependencies_async(kwargs, args, timer)
+        except BaseSpyError as e:
+            if timer is not None:
+                timer.lap("handler")
+            return self.respond(
+                ErrorResponse(e.error, status_code=e.status_code, additional_headers=e.additional_headers)
+            )
+
+    def complete(self, return_obj: t.Any, event: dict[str, t.Any], timer: PhaseTimer | None) -> dict[str, t.Any]:
+        if timer is not None:
+            timer.lap("handler")
+        response = self.finish(return_obj, event)
+        if timer is not None:
+            timer.lap("serialize")
+        return response
+
+    def cache_key(self, kwargs: dict[str, t.Any], event: dict[str, t.Any]) -> str:
+        variants = []
+        if self.compression is not None:
+            # compressed responses differ per Accept-Encoding
+            variants.append(get_header(event.get("headers"), "Accept-Encoding"))
+        if self.etag:
+            # bodiless responses to HEAD requests
+            variants.append(get_request_method(event))
+        return build_cache_key(kwargs, *variants)
+
+    def call_cached(
+        self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], timer: PhaseTimer | None = None
+    ) -> dict[str, t.Any]:
+        key = self.cache_key(kwargs, args[0])
+        response = self.cache.get(key)  # type: ignore
+        if response is None:
+            return self.cache.set(key, self.invoke(kwargs, args, timer))  # type: ignore
+        return (self.etag and not_modified(args[0], response)) or response
+
+    async def call_cached_async(
+        self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], timer: PhaseTimer | None = None
+    ) -> dict[str, t.Any]:
+        key = self.cache_key(kwargs, args[0])
+        response = self.cache.get(key)  # type: ignore
+        if response is None:
+            return self.cache.set(key, await self.invoke_async(kwargs, args, timer))  # type: ignore
+        return (self.etag and not_modified(args[0], response)) or response
+
+    def call_with_dependencies(
+        self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], timer: PhaseTimer | None
+    ) -> dict[str, t.Any]:
+        """
+        Yielding dependencies are torn down once the response is serialized (or the handler raises),
+        so generators returned by the handler can still use them.
+        """
+        with ExitStack() as stack:
+            self.dependencies.solve(kwargs, args, stack)  # type: ignore
+            return self.complete(self.handler(**kwargs), args[0], timer)
+
+    async def call_with_dependencies_async(
+        self, kwargs: dict[str, t.Any], args: tuple[t.Any, ...], timer: PhaseTimer | None
+    ) -> dict[str, t.Any]:
+        async with AsyncExitStack() as stack:
+            await self.dependencies.solve_async(kwargs, args, stack)  # type: ignore
+            return self.complete(await self.handler(**kwargs), args[0], timer)
+
+    def prepare(self, args: tuple[t.Any, ...], timer: PhaseTimer | None = None) -> dict[str, t.Any] | ErrorResponse:
+        event = args[0]
+        if self.extract is None:
+            kwargs: dict[str, t.Any] = {}
+        else:
+            try:
+                kwargs, errors = self.extract_event(event, timer)
+            except BaseSpyError as e:
+                return ErrorResponse(e.error, status_code=e.status_code, additional_headers=e.additional_headers)
+            if errors:
+                return ErrorResponse(errors, status_code=422)
+        if self.add_event:
+            kwargs["event"] = event
+        if self.add_context:
+            kwargs["context"] = args[1]
+        return kwargs
+
+    def extract_event(
+        self, event: dict[str, t.Any], timer: PhaseTimer | None  # noqa: ARG002
+    ) -> tuple[dict[str, t.Any], list[str]]:
+        # params and body are extracted at once, TimedRoutePlan times them apart
+        return self.extract(event)  # type: ignore
+
+    def respond(self, error: ErrorResponse) -> dict[str, t.Any]:
+        error.route = self.route
+        return error.response
+
+    def finish(self, return_obj: t.Any, event: dict[str, t.Any]) -> dict[str, t.Any]:
+        if not isinstance(return_obj, BaseResponseSPY):
+            # generators are encoded item by item instead of being materialised first
+            return_obj = (
+                JSONStreamResponse(return_obj) if isinstance(return_obj, Iterator) else JSONResponse(return_obj)
+            )
+        return_obj.route = self.route
+
+        if self.etag:
+            return self.finish_conditional(return_obj, event)
+        if self.compression is None:
+            return return_obj.response
+        return compress_response(
+            return_obj.response, get_header(event.get("headers"), "Accept-Encoding"), self.compression
+        )
+
+    def finish_conditional(self, return_obj: BaseResponseSPY, event: dict[str, t.Any]) -> dict[str, t.Any]:
+        """
+        Tags the response with an ETag and answers matching If-None-Match with a bodiless 304.
+        Version token given to the response is used as is, so serialization is skipped when it matches.
+        """
+        if_none_match = get_header(event.get("headers"), "If-None-Match")
+        version = getattr(return_obj, "etag", None)
+        if version is not None:
+            etag = quote_etag(version)
+            if etag_matches(if_none_match, etag):
+                return build_not_modified(etag)
+            response = return_obj.response
+        else:
+            response = return_obj.response
+            body = response.get("body")
+            if int(response.get("statusCode", 200)) not in CACHEABLE_STATUS_CODES or not isinstance(body, str | bytes):
+                return response
+            etag = compute_etag(body)
+            if etag_matches(if_none_match, etag):
+                return build_not_modified(etag)
+
+        if self.compression is not None:
+            response = compress_response(
+                response, get_header(event.get("headers"), "Accept-Encoding"), self.compression
+            )
+            if "Content-Encoding" in response["headers"]:
+                # encoded bytes differ from the tagged ones, so the tag is only weakly equal
+                etag = f"W/{etag}"
+        response["headers"] = {**(response.get("headers") or {}), "ETag": etag}
+        return strip_body(response) if is_head_request(event) else response
+
+
+@dataclass(frozen=True, slots=True)
+class TimedRoutePlan(RoutePlan):
+    """
+    Route plan recording durations of invocation phases, used only for routes with metrics enabled,
+    so untimed routes don't pay for it.
+    """
+
+    validate_params: Extractor | None = None
+    extract_body: Extractor | None = None
+    metrics: MetricsRecorder | None = None
+
+    def __call__(self, *args: t.Any) -> dict[str, t.Any]:
+        if self.is_async:
+            # asyncio is imported only by apps having async handlers
+            from aws_spy.core.concurrency import run_sync
+
+            return run_sync(self.call_async(*args))
+        timer = PhaseTimer()
+        return self.report(self.run(args, timer), timer)
+
+    async def call_async(self, *args: t.Any) -> dict[str, t.Any]:
+        timer = PhaseTimer()
+        return self.report(await self.run_async(args, timer), timer)
+
+    def extract_event(self, event: dict[str, t.Any], timer: PhaseTimer | None) -> tuple[dict[str, t.Any], list[str]]:
+        kwargs: dict[str, t.Any] = {}
+        errors: list[str] = []
+        if self.validate_params is not None:
+            kwargs, errors = self.validate_params(event)
+            timer.lap("params")  # type: ignore
+        if self.extract_body is not None:
+            body_kwargs, body_errors = self.extract_body(event)
+            kwargs.update(body_kwargs)
+            errors = errors + body_errors
+            timer.lap("body")  # type: ignore
+        return kwargs, errors
+
+    def report(self, response: t.Any, timer: PhaseTimer) -> t.Any:
+        phases = timer.stop()
+        status_code = response.get("statusCode", 200) if isinstance(response, dict) else None
+        if self.metrics.config.server_timing and isinstance(response, dict):  # type: ignore
+            response["headers"] = {**(response.get("headers") or {}), "Server-Timing": server_timing_header(phases)}
+        self.metrics.record(self.route.name, status_code, phases)  # type: ignore
+        return response
+
+
+def read_request_body(
+    event: dict[str, t.Any], request_body: type[BaseModel]
+) -> tuple[BaseModel | dict[str, t.Any] | None, list[str]]:
+    try:
+        body = decode_request_body(event)
+    except RequestBodyTooLargeError as e:
+        raise BaseSpyError(str(e), status_code=413) from e
+    except UnsupportedContentEncodingError as e:
+        raise BaseSpyError(str(e), status_code=415) from e
+    except ValueError as e:
+        return None, [str(e)]
+    return export_request_body(body, request_body)
+
+
+def build_phase_extractors(route: SpyRoute) -> tuple[Extractor | None, Extractor | None]:
+    """
+    Params and request body extractors of a route, kept apart so each phase can be timed.
+    """
+    validate_params = route.params_validator.validate if route.params_validator else None
+    if not route.request_body_arg_name:
+        return validate_params, None
+
+    request_body = route.request_body
+    request_body_arg_name = route.request_body_arg_name
+
+    def extract_body(event: dict[str, t.Any]) -> tuple[dict[str, t.Any], list[str]]:
+        body, errors = read_request_body(event, request_body)  # type: ignore
+        return {request_body_arg_name: body}, errors
+
+    return validate_params, extract_body
+
+
+def build_extractor(route: SpyRoute) -> Extractor | None:
+    validate_params, extract_body = build_phase_extractors(route)
+    if extract_body is None:
+        return validate_params
+    if validate_params is None:
+        return extract_body
+
+    request_body = route.request_body
+    request_body_arg_name = route.request_body_arg_name
+
+    def extract(event: dict[str, t.Any]) -> tuple[dict[str, t.Any], list[str]]:
+        kwargs, errors = validate_params(event)  # type: ignore
+        body, body_errors = read_request_body(event, request_body)  # type: ignore
+        kwargs[request_body_arg_name] = body  # type: ignore
+        return kwargs, errors + body_errors
+
+    return extract
+
+
+def build_dependency_graph(route: SpyRoute) -> DependencyGraph | None:
+    if not route.dependencies or route.skip_validation:
+        return None
+    params = [*route.path_params, *route.header_params, *route.query_params]
+    graph = DependencyGraph(
+        route.dependencies,
+        {(param.in_.in_, param.name): param.arg_name for param in params},
+        inspect.signature(route.handler).parameters,
+    )
+    if graph.is_async and not inspect.iscoroutinefunction(route.handler):
+        msg = f"Async dependencies of {route.name} route need an async handler!"
+        raise RouteDefinitionError(msg)
+    return graph
+
+
+def build_cache_store(route: SpyRoute) -> ResponseCacheStore | None:
+    if not route.cache or route.skip_validation:
+        return None
+    return ResponseCacheStore(route.name, ResponseCache() if route.cache is True else route.cache)
+
+
+def compile_route(route: SpyRoute) -> RoutePlan:
+    if route.plan is None:
+        if route.params_validator and not route.skip_validation:
+            route.params_validator.validator  # noqa: B018
+        options: dict[str, t.Any] = {
+            "route": route,
+            "handler": route.handler,
+            "extract": None if route.skip_validation else build_extractor(route),
+            "add_event": route.add_event,
+            "add_context": route.add_context,
+            "skip_validation": route.skip_validation,
+            "compression": Compression() if route.compression is True else route.compression or None,
+            "is_async": inspect.iscoroutinefunction(route.handler),
+            "dependencies": build_dependency_graph(route),
+            "cache": build_cache_store(route),
+            "etag": route.etag,
+        }
+        if route.metrics is None:
+            route.plan = RoutePlan(**options)
+        else:
+            validate_params, extract_body = build_phase_extractors(route)
+            route.plan = TimedRoutePlan(
+                **options, validate_params=validate_params, extract_body=extract_body, metrics=route.metrics
+            )
+    return route.plan
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionPlan:
+    """
+    Runtime descriptor of a function invoked directly, e.g. by another service or `lambda invoke`.
+    """
+
+    function: SpyFunction
+    handler: LH
+    validator: TypeAdapter | None
+    serializer: ModelSerializer | None
+    skip_validation: bool
+    is_async: bool = False
+
+    def __call__(self, event: t.Any, *args: t.Any) -> t.Any:
+        if self.is_async:
+            from aws_spy.core.concurrency import run_sync
+
+            return run_sync(self.call_async(event, *args))
+        if self.skip_validation:
+            return self.handler(event, *args)
+        return self.serialize(self.handler(self.validate(event), *args))
+
+    async def call_async(self, event: t.Any, *args: t.Any) -> t.Any:
+        if self.skip_validation:
+            return await self.handler(event, *args)
+        return self.serialize(await self.handler(self.validate(event), *args))
+
+    def validate(self, event: t.Any) -> t.Any:
+        if self.validator is None:
+            return event
+        if isinstance(event, str | bytes):
+            # JSON payload parsed and validated in a single pass
+            return self.validator.validate_json(event)
+        return self.validator.validate_python(event)
+
+    def serialize(self, return_obj: t.Any) -> t.Any:
+        if self.serializer is None or return_obj is None:
+            return return_obj
+        return self.serializer.to_jsonable(return_obj)
+
+
+def compile_function(function: SpyFunction) -> FunctionPlan:
+    if function.plan is None:
+        event_model = None if function.skip_validation else get_event_model(function.handler)
+        function.plan = FunctionPlan(
+            function=function,
+            handler=function.handler,
+            validator=get_type_adapter(event_model) if event_model is not None else None,
+            serializer=get_model_serializer(function.response_class) if function.response_class else None,
+            skip_validation=function.skip_validation,
+            is_async=inspect.iscoroutinefunction(function.handler),
+        )
+    return function.plan
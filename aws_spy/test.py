@@ -1,9 +1,9 @@
-import json
 import typing as t
 
 import typing_extensions as te
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from aws_spy.core.encoders import JSONBackend, get_json_backend
 from aws_spy.core.schemas import LH, Methods
 
 
@@ -12,12 +12,14 @@ class APIResponse(BaseModel):
     status_code: int | None
     headers: dict[str, t.Any] | None
     raw: dict[str, t.Any]
+    # backend of the route that answered, so tests check the app's own wire format
+    json_backend: t.Any = Field(None, exclude=True, repr=False)
 
     @property
     def json(self: te.Self) -> dict[str, t.Any]:
         try:
-            return json.loads(self.body)
-        except json.JSONDecodeError:  # pragma: no cover
+            return (self.json_backend or get_json_backend()).loads(self.body)
+        except ValueError:  # pragma: no cover
             return {}
 
 
@@ -132,8 +134,14 @@ class TestClient:
     @staticmethod
     def _call(handler: LH, event: dict[str, t.Any]) -> APIResponse:
         response = handler(event, None)
+        route = getattr(handler, "route", None)
+        json_backend: JSONBackend | None = route.json_backend if route is not None else None
         return APIResponse(
-            status_code=response["statusCode"], raw=response, body=response["body"], headers=response["headers"]
+            status_code=response["statusCode"],
+            raw=response,
+            body=response["body"],
+            headers=response["headers"],
+            json_backend=json_backend,
         )
 
     @staticmethod
@@ -158,5 +166,5 @@ class TestClient:
             "headers": base_headers,
             "queryStringParameters": query_params,
             "pathParameters": path_params,
-            "body": json.dumps(body),
+            "body": get_json_backend().dumps(body),
         }
@@ -67,3 +67,15 @@ def build_data_path() -> t.Callable[[str], str]:
         return os.path.join(os.path.dirname(__file__), "data", file_name)
 
     return _build_data_path
+
+
+@pytest.fixture
+def build_sqs_event() -> t.Callable[..., dict[str, t.Any]]:
+    def _build_sqs_event(*bodies: str, queue: str = "arn:aws:sqs:eu-west-1:123:orders") -> dict[str, t.Any]:
+        return {
+            "Records": [
+                {"messageId": f"m{index}", "body": body, "eventSourceARN": queue} for index, body in enumerate(bodies)
+            ]
+        }
+
+    return _build_sqs_event
@@ -1,3 +1,6 @@
+import base64
+import gzip
+import json
 import typing as t
 import uuid
 
@@ -5,7 +8,8 @@ import pytest
 from polyfactory.factories.pydantic_factory import ModelFactory
 from pydantic import BaseModel
 
-from aws_spy import BaseSpyError, Header, Path, Query, SpyAPI
+from aws_spy import BaseSpyError, Header, Path, Query, ServerlessConfig, SpyAPI
+from aws_spy.core.compression import MAX_REQUEST_BODY_SIZE, Compression
 from aws_spy.core.schemas import Methods
 from aws_spy.responses import JSONResponse
 from aws_spy.test import APIResponse, TestClient
@@ -42,9 +46,9 @@ def test_api_functions(method: Methods, app: SpyAPI) -> None:
         event,
         context,
         request: ExampleRequest,
-        user_id: int = Path(),  # noqa: B008
+        user_id: int = Path(),
         car_id: uuid.UUID = Path(),  # noqa: B008
-        user_id_header: int = Header("user_id"),  # noqa: B008
+        user_id_header: int = Header("user_id"),
         car_id_query: uuid.UUID = Query("car_id"),  # noqa: B008
     ) -> JSONResponse:
         assert event
@@ -121,3 +125,50 @@ def test_api_functions_without_response(method: Methods, app: SpyAPI) -> None:
     assert response.status_code == 201
     assert ExampleResponse(**response.json)
     assert response.headers == {"Content-Type": "application/json"}
+
+
+@pytest.mark.parametrize("app_compression", [True, None])
+def test_api_functions_compression(config: ServerlessConfig, app_compression: bool | None) -> None:
+    app = SpyAPI(config=config, compression=app_compression)
+    route_compression = Compression(minimum_size=10) if app_compression is None else None
+
+    @app.post("/path", "lambda", status_code=200, compression=route_compression)
+    def handler(request: ExampleRequest) -> list[dict[str, t.Any]]:
+        return [request.model_dump()] * 100
+
+    body = ExampleRequestFactory.build()
+    event = {
+        "headers": {"Content-Encoding": "gzip", "Accept-Encoding": "gzip"},
+        "body": base64.b64encode(gzip.compress(body.model_dump_json().encode())).decode(),
+        "isBase64Encoded": True,
+    }
+    response = handler(event, None)
+    assert response["statusCode"] == 200
+    assert response["isBase64Encoded"] is True
+    assert response["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(base64.b64decode(response["body"]))) == [body.model_dump()] * 100
+
+    event["headers"] = {"Content-Encoding": "gzip"}
+    response = handler(event, None)
+    assert "isBase64Encoded" not in response
+    assert json.loads(response["body"]) == [body.model_dump()] * 100
+
+    event["body"] = base64.b64encode(gzip.compress(b" " * (MAX_REQUEST_BODY_SIZE + 1))).decode()
+    response = handler(event, None)
+    assert response["statusCode"] == 413
+
+    event["headers"] = {"Content-Encoding": "zstd"}
+    response = handler(event, None)
+    assert response["statusCode"] == 415
+    assert json.loads(response["body"]) == {"message": "Unsupported content encoding: zstd"}
+
+
+def test_api_functions_generator(app: SpyAPI) -> None:
+    @app.get("/path", "lambda", response_class=ExampleResponse)
+    def handler() -> t.Iterator[dict[str, int]]:
+        for x in range(3):
+            yield {"x": x, "y": 2}
+
+    response: APIResponse = client.get(handler)
+    assert response.status_code == 200
+    assert response.json == [{"x": 0, "y": 2}, {"x": 1, "y": 2}, {"x": 2, "y": 2}]
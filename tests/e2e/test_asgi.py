@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+import typing as t
+
+import pytest
+from pydantic import BaseModel
+
+from aws_spy import Header, Path, Query, SpyAPI
+from aws_spy.asgi import ASGIApp, PathMatcher, compile_path
+
+
+class Item(BaseModel):
+    name: str
+
+
+async def call(
+    asgi: ASGIApp,
+    method: str,
+    path: str,
+    *,
+    query_string: bytes = b"",
+    headers: list[tuple[bytes, bytes]] | None = None,
+    body: bytes = b"",
+) -> tuple[int, dict[bytes, bytes], bytes]:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": headers or [],
+        "client": ("127.0.0.1", 5000),
+    }
+    # body arrives in two chunks, as ASGI servers may split it
+    messages = [
+        {"type": "http.request", "body": body[:1], "more_body": True},
+        {"type": "http.request", "body": body[1:], "more_body": False},
+    ]
+    sent: list[dict[str, t.Any]] = []
+
+    async def receive() -> dict[str, t.Any]:
+        return messages.pop(0)
+
+    async def send(message: dict[str, t.Any]) -> None:
+        sent.append(message)
+
+    await asgi(scope, receive, send)
+    return sent[0]["status"], dict(sent[0]["headers"]), sent[1]["body"]
+
+
+def request(asgi: ASGIApp, method: str, path: str, **kwargs: t.Any) -> tuple[int, dict[bytes, bytes], bytes]:
+    return asyncio.run(call(asgi, method, path, **kwargs))
+
+
+@pytest.fixture
+def asgi(app: SpyAPI) -> ASGIApp:
+    @app.get("/items/{item_id}", "get-item")
+    def get_item(item_id: int = Path(), limit: int | None = Query(), token: str | None = Header("X-Token")) -> dict:
+        return {"item_id": item_id, "limit": limit, "token": token, "thread": threading.current_thread().name}
+
+    @app.get("/items", "list-items")
+    async def list_items() -> list:
+        await asyncio.sleep(0)
+        return [{"name": "first"}]
+
+    @app.post("/items", "create-item")
+    def create_item(item: Item) -> Item:
+        return item
+
+    return app.as_asgi()
+
+
+def test_compile_path() -> None:
+    pattern = compile_path("/users/{user_id}/items/{item_id}")
+    assert pattern.match("/users/1/items/abc").groupdict() == {"user_id": "1", "item_id": "abc"}  # type: ignore
+    assert pattern.match("/users/1/items") is None
+    assert pattern.match("/users/1/items/abc/def") is None
+
+
+def test_path_matcher_prefers_static(app: SpyAPI) -> None:
+    @app.get("/users/{user_id}", "get-user")
+    def get_user(user_id: str = Path()) -> None:
+        ...
+
+    @app.get("/users/me", "get-me")
+    def get_me() -> None:
+        ...
+
+    matcher = PathMatcher(app.routes)
+    assert matcher.match("/users/me")[1] == {}  # type: ignore
+    assert matcher.match("/users/1")[1] == {"user_id": "1"}  # type: ignore
+    assert matcher.match("/users") is None
+
+
+def test_path_params_decoded_once(app: SpyAPI) -> None:
+    @app.get("/files/{name}", "get-file")
+    def get_file(name: str = Path()) -> dict:
+        return {"name": name}
+
+    # "%2541" in the URL, ASGI servers decode it into the scope's "/files/%41"
+    status, _, body = request(app.as_asgi(), "GET", "/files/%41")
+    assert status == 200
+    assert json.loads(body) == {"name": "%41"}
+
+
+def test_sync_handler(asgi: ASGIApp) -> None:
+    status, headers, body = request(asgi, "GET", "/items/1", query_string=b"limit=10", headers=[(b"x-token", b"abc")])
+    assert status == 200
+    assert headers[b"content-type"] == b"application/json"
+    data = json.loads(body)
+    assert data.pop("thread").startswith("spy")
+    assert data == {"item_id": 1, "limit": 10, "token": "abc"}
+
+
+def test_async_handler(asgi: ASGIApp) -> None:
+    status, _, body = request(asgi, "GET", "/items")
+    assert status == 200
+    assert json.loads(body) == [{"name": "first"}]
+
+
+def test_request_body(asgi: ASGIApp) -> None:
+    status, _, body = request(asgi, "POST", "/items", body=b'{"name": "new"}')
+    assert status == 201
+    assert json.loads(body) == {"name": "new"}
+
+
+def test_validation_error(asgi: ASGIApp) -> None:
+    status, _, _ = request(asgi, "GET", "/items/abc")
+    assert status == 422
+
+
+def test_head(asgi: ASGIApp) -> None:
+    status, headers, body = request(asgi, "HEAD", "/items/1")
+    assert status == 200
+    assert headers[b"content-type"] == b"application/json"
+    assert body == b""
+
+
+@pytest.mark.parametrize(("method", "path", "status_code"), [("GET", "/missing", 404), ("DELETE", "/items", 405)])
+def test_not_matched(asgi: ASGIApp, method: str, path: str, status_code: int) -> None:
+    assert request(asgi, method, path)[0] == status_code
+
+
+def test_lifespan(asgi: ASGIApp) -> None:
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent: list[dict[str, t.Any]] = []
+
+    async def receive() -> dict[str, t.Any]:
+        return messages.pop(0)
+
+    async def send(message: dict[str, t.Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(asgi({"type": "lifespan"}, receive, send))
+    assert sent == [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}]
@@ -1,3 +1,4 @@
+import marshal
 import os
 import typing as t
 from pathlib import Path
@@ -6,12 +7,19 @@ import pytest
 import yaml
 from deepdiff import DeepDiff
 
-from aws_spy import SpyAPI
+from aws_spy import Path as PathParam
+from aws_spy import ServerlessConfig, SpyAPI
 from aws_spy.core.exceptions import RouteDefinitionError
-from aws_spy.helpers.cli import generate_serverless_file
+from aws_spy.core.manifest import MANIFEST_FILE_NAME
+from aws_spy.helpers.cli import generate_serverless_file, record_deployed_functions
 from aws_spy.helpers.exceptions import WrongArgumentError
 
 
+def load_manifest_file(path: str) -> dict[str, t.Any]:
+    with open(path, "rb") as file:
+        return marshal.load(file)  # noqa: S302
+
+
 def are_two_yaml_files_same(file_path_1: str, file_path_2: str) -> bool:
     with open(file_path_1) as file_1:
         with open(file_path_2) as file_2:
@@ -65,3 +73,135 @@ def test_generate_file_wrong_authorizer(app: SpyAPI) -> None:
     file_path = "serverless.yml"
     with pytest.raises(RouteDefinitionError, match=f"Authorizer {authorizer} not defined"):
         generate_serverless_file(app, file_path)
+
+
+def test_generate_file_changed_functions(app: SpyAPI, tmp_path: Path) -> None:
+    file_path = str(os.path.join(tmp_path, "serverless.yml"))
+
+    @app.get("/first", "first")
+    def handler() -> None:
+        ...
+
+    changed = generate_serverless_file(app, file_path)
+    assert changed[0] == "first"
+    assert "provider" in changed
+    # not deployed yet
+    assert generate_serverless_file(app, file_path) == changed
+    record_deployed_functions(file_path)
+    assert generate_serverless_file(app, file_path) == []
+
+    @app.get("/second", "second", layers=["test-layer"])
+    def handler1() -> None:
+        ...
+
+    assert generate_serverless_file(app, file_path) == ["second"]
+
+
+def test_generate_file_changed_provider(app: SpyAPI, tmp_path: Path) -> None:
+    file_path = str(os.path.join(tmp_path, "serverless.yml"))
+
+    @app.get("/first", "first")
+    def handler() -> None:
+        ...
+
+    generate_serverless_file(app, file_path)
+    record_deployed_functions(file_path)
+
+    app.config.provider.region = "eu-west-1"
+    assert generate_serverless_file(app, file_path) == ["provider"]
+    record_deployed_functions(file_path)
+    assert generate_serverless_file(app, file_path) == []
+
+
+def test_generate_file_removed_function(app: SpyAPI, tmp_path: Path) -> None:
+    file_path = str(os.path.join(tmp_path, "serverless.yml"))
+
+    @app.get("/first", "first")
+    def handler() -> None:
+        ...
+
+    @app.get("/second", "second")
+    def handler1() -> None:
+        ...
+
+    generate_serverless_file(app, file_path)
+    record_deployed_functions(file_path)
+
+    del app.routes["/second"]
+    assert generate_serverless_file(app, file_path) == ["second"]
+    record_deployed_functions(file_path)
+    assert generate_serverless_file(app, file_path) == []
+
+
+def test_generate_file_is_deterministic(app: SpyAPI, tmp_path: Path) -> None:
+    @app.get("/test", "test-route", layers=["b-layer", "a-layer", "b-layer"])
+    def handler() -> None:
+        ...
+
+    file_path = str(os.path.join(tmp_path, "serverless.yml"))
+    generate_serverless_file(app, file_path)
+    with open(file_path) as file:
+        config = yaml.safe_load(file)
+    assert config["functions"]["test-route"]["layers"] == [
+        "${cf:spy-layer-arm64-${opt:stage}.ServerlesspyLayerExport}",
+        "b-layer",
+        "a-layer",
+    ]
+    assert config["plugins"] == [
+        "serverless-python-requirements",
+        "serverless-plugin-common-excludes",
+        "serverless-plugin-include-dependencies",
+    ]
+
+
+def test_generate_file_layer_architecture(app: SpyAPI, tmp_path: Path) -> None:
+    app.config.provider.architecture = "x86_64"
+
+    @app.get("/test", "test-route")
+    def handler() -> None:
+        ...
+
+    file_path = str(os.path.join(tmp_path, "serverless.yml"))
+    generate_serverless_file(app, file_path)
+    with open(file_path) as file:
+        config = yaml.safe_load(file)
+    assert config["functions"]["test-route"]["layers"] == [
+        "${cf:spy-layer-x86_64-${opt:stage}.ServerlesspyLayerExport}",
+    ]
+
+
+def test_generate_file_router_functions(config: ServerlessConfig, tmp_path: Path) -> None:
+    app = SpyAPI(config=config, router_functions={"admin": ["admin"]})
+
+    @app.get("/admin/users", "list-users", tags=["admin"], layers=["test-layer"])
+    def handler() -> None:
+        ...
+
+    @app.delete("/admin/users/{user_id}", "delete-user", tags=["admin"])
+    def handler1(user_id: int = PathParam()) -> None:
+        ...
+
+    @app.get("/health", "health")
+    def handler2() -> None:
+        ...
+
+    file_path = str(os.path.join(tmp_path, "serverless.yml"))
+    generate_serverless_file(app, file_path)
+    with open(file_path) as file:
+        functions = yaml.safe_load(file)["functions"]
+
+    assert set(functions) == {"admin", "health"}
+    assert functions["admin"]["handler"] == "aws_spy.dispatch.handler"
+    assert functions["admin"]["environment"] == {"SPY_ROUTER": "admin"}
+    assert functions["admin"]["events"] == [
+        {"httpApi": {"path": "/admin/users", "method": "*"}},
+        {"httpApi": {"path": "/admin/users/{proxy+}", "method": "*"}},
+    ]
+    assert "test-layer" in functions["admin"]["layers"]
+    module = "tests.integration.test_generate_serverless_file"
+    assert load_manifest_file(str(tmp_path / MANIFEST_FILE_NAME))["dispatch"] == {
+        "admin": [
+            ("GET", "/admin/users", module, "handler"),
+            ("DELETE", "/admin/users/{user_id}", module, "handler1"),
+        ]
+    }
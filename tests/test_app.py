@@ -1,7 +1,8 @@
 import pytest
 
-from aws_spy import ServerlessConfig, SpyAPI, SpyRouter, __version__
-from aws_spy.core.schemas import Methods
+from aws_spy import Path, ServerlessConfig, SpyAPI, SpyRouter, __version__
+from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.schemas import Methods, RouteStub, SpyRoute
 
 
 def test_app() -> None:
@@ -43,3 +44,71 @@ def test_register_router(config: ServerlessConfig, method: Methods) -> None:
     assert len(app.routes) == 1
     assert len(app.functions) == 1
     assert app.routes["/api/router/path"][method]
+
+
+def test_app_lazy_conf(config: ServerlessConfig) -> None:
+    app = SpyAPI(config=lambda: config)
+    assert app.config == config
+
+
+def test_deferred_routes(config: ServerlessConfig) -> None:
+    app = SpyAPI(config=config, defer_routes=True)
+
+    @app.get("/path/{user_id}", "lambda")
+    def handler(user_id: int = Path()) -> dict:
+        return {"user_id": user_id}
+
+    stub = app._routes["/path/{user_id}"][Methods.GET]
+    assert isinstance(stub, RouteStub)
+    assert stub.route is None
+
+    response = handler({"pathParameters": {"user_id": "1"}}, None)
+    assert response["statusCode"] == 200
+    assert isinstance(stub.route, SpyRoute)
+    assert isinstance(app.routes["/path/{user_id}"][Methods.GET], SpyRoute)
+
+
+def test_deferred_routes_validated_on_access(config: ServerlessConfig) -> None:
+    app = SpyAPI(config=config, defer_routes=True)
+
+    @app.get("/path/{user_id}", "lambda")
+    def handler() -> None:
+        ...
+
+    with pytest.raises(RouteDefinitionError):
+        app.routes  # noqa: B018
+
+
+def test_lambda_handler_route_is_eager(config: ServerlessConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("_HANDLER", f"{__name__.rpartition('.')[-1]}.served")
+    app = SpyAPI(config=config, defer_routes=True)
+
+    @app.get("/served", "served")
+    def served() -> None:
+        ...
+
+    @app.get("/other", "other")
+    def other() -> None:
+        ...
+
+    assert isinstance(app._routes["/served"][Methods.GET], SpyRoute)
+    assert isinstance(app._routes["/other"][Methods.GET], RouteStub)
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, False),
+        ({"AWS_LAMBDA_FUNCTION_NAME": "lambda"}, True),
+        ({"AWS_LAMBDA_FUNCTION_NAME": "lambda", "SPY_DEFER_ROUTES": "0"}, False),
+        ({"SPY_DEFER_ROUTES": "1"}, True),
+    ],
+)
+def test_defer_routes_detection(
+    config: ServerlessConfig, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], expected: bool  # noqa: FBT001
+) -> None:
+    monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+    monkeypatch.delenv("SPY_DEFER_ROUTES", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    assert SpyAPI(config=config).defer_routes is expected
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+import time
+import typing as t
+
+import pytest
+from pydantic import BaseModel
+
+from aws_spy import SpyAPI
+from aws_spy.core.config import Function
+from aws_spy.core.exceptions import FunctionDefinitionError
+
+
+class Order(BaseModel):
+    order_id: int
+    amount: float
+
+
+def build_order(order_id: int) -> str:
+    return json.dumps({"order_id": order_id, "amount": 1.5})
+
+
+def test_sqs_records_validated(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    orders = []
+
+    @app.sqs("orders", queue="arn:aws:sqs:eu-west-1:123:orders")
+    def handler(order: Order) -> None:
+        if order.order_id < 0:
+            msg = "Negative order"
+            raise ValueError(msg)
+        orders.append(order)
+
+    response = handler(build_sqs_event(build_order(1), "not json", build_order(-1), build_order(2)))
+    assert response == {"batchItemFailures": [{"itemIdentifier": "m1"}, {"itemIdentifier": "m2"}]}
+    assert orders == [Order(order_id=1, amount=1.5), Order(order_id=2, amount=1.5)]
+    assert handler(build_sqs_event(build_order(3))) == {"batchItemFailures": []}
+
+
+def test_sqs_unresolvable_annotations(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    orders = []
+
+    # string annotations, as with `from __future__ import annotations`, context's type imported for type checkers only
+    @app.sqs("orders", queue="arn")
+    def handler(order: "Order", context: "LambdaContext") -> None:  # type: ignore  # noqa: F821
+        orders.append((order, context))
+
+    handler(build_sqs_event(build_order(1)), "context")
+    assert orders == [(Order(order_id=1, amount=1.5), "context")]
+
+    @app.sqs("raw", queue="arn")
+    def raw(body: "Body") -> None:  # type: ignore  # noqa: F821
+        orders.append(body)
+
+    raw(build_sqs_event("raw"))
+    assert orders[-1] == "raw"
+
+
+def test_sqs_raw_record(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    seen = []
+
+    @app.sqs("raw", queue="arn", model=None)
+    def handler(body: str, record: dict, context: object) -> None:
+        seen.append((body, record["messageId"], context))
+
+    handler(build_sqs_event("a"), "context")
+    assert seen == [("a", "m0", "context")]
+
+    @app.sqs("record-only", queue="arn")
+    def record_only(record: dict) -> None:
+        seen.append(record["body"])
+
+    assert record_only(build_sqs_event("raw body")) == {"batchItemFailures": []}
+    assert seen[-1] == "raw body"
+
+
+def test_sqs_thread_concurrency(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    threads = set()
+
+    @app.sqs("orders", queue="arn", max_concurrency=4)
+    def handler(order: Order) -> None:
+        time.sleep(0.05)
+        threads.add(threading.current_thread().name)
+
+    start = time.perf_counter()
+    assert handler(build_sqs_event(*(build_order(index) for index in range(4)))) == {"batchItemFailures": []}
+    assert time.perf_counter() - start < 0.15
+    assert all(name.startswith("spy-orders") for name in threads)
+
+
+def test_sqs_async_concurrency(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    running = []
+    peak = []
+
+    @app.sqs("orders", queue="arn", max_concurrency=2)
+    async def handler(order: Order) -> None:
+        running.append(order.order_id)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(order.order_id)
+        if order.order_id == 3:
+            msg = "Failed"
+            raise ValueError(msg)
+
+    response = handler(build_sqs_event(*(build_order(index) for index in range(5))))
+    assert response == {"batchItemFailures": [{"itemIdentifier": "m3"}]}
+    assert max(peak) == 2
+
+
+def test_sqs_fifo_stops_at_failure(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    processed = []
+
+    @app.sqs("orders", queue="arn", max_concurrency=4)
+    def handler(order: Order) -> None:
+        if order.order_id == 1:
+            msg = "Failed"
+            raise ValueError(msg)
+        processed.append(order.order_id)
+
+    event = build_sqs_event(*(build_order(index) for index in range(4)), queue="arn:aws:sqs:eu-west-1:123:orders.fifo")
+    response = handler(event)
+    assert response == {"batchItemFailures": [{"itemIdentifier": f"m{index}"} for index in range(1, 4)]}
+    assert processed == [0]
+
+
+def test_sqs_event(app: SpyAPI) -> None:
+    @app.sqs("orders", queue="arn:aws:sqs:eu-west-1:123:orders", batch_size=100, maximum_batching_window=5)
+    def handler(order: Order) -> None:
+        ...
+
+    function = Function.from_function(function=app.functions[0])
+    assert function.events == [
+        {
+            "sqs": {
+                "arn": "arn:aws:sqs:eu-west-1:123:orders",
+                "batchSize": 100,
+                "maximumBatchingWindow": 5,
+                "functionResponseType": "ReportBatchItemFailures",
+            }
+        }
+    ]
+
+    with pytest.raises(FunctionDefinitionError, match="maximum_batching_window"):
+        app.sqs("big-batch", queue="arn", batch_size=100)(handler)
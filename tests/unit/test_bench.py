@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from aws_spy.helpers.bench import BENCHMARKS, BenchmarkResult, compare_results, dump_results, load_results, measure
+from aws_spy.helpers.cli import bench
+
+
+def test_measure() -> None:
+    calls = []
+    result = measure(lambda: calls.append(1), number=10, repeat=3)
+    assert len(calls) == 31
+    assert result.samples == 3
+    assert 0 < result.min_us <= result.p50_us
+
+
+def test_benchmarks_registered() -> None:
+    assert {
+        "wrapper.no_params",
+        "wrapper.query_params",
+        "wrapper.large_body",
+        "wrapper.large_response_class",
+        "response.json",
+        "response.error",
+        "json.stdlib.small.dumps",
+        "json.stdlib_compact.list_1000.loads",
+        "cold_start.10_routes.eager",
+        "cold_start.1000_routes.lambda",
+        "cli.generate_serverless_file",
+    } <= set(BENCHMARKS)
+
+
+def test_compare_results() -> None:
+    baseline = {"same": BenchmarkResult(10, 9, 5), "slower": BenchmarkResult(10, 9, 5)}
+    current = {
+        "same": BenchmarkResult(10.5, 9, 5),
+        "slower": BenchmarkResult(12, 11, 5),
+        "new": BenchmarkResult(1, 1, 5),
+    }
+    regressions = compare_results(baseline, current, threshold=0.1)
+    assert [regression.name for regression in regressions] == ["slower"]
+    assert regressions[0].ratio == 1.2
+    assert compare_results(baseline, current, threshold=0.25) == []
+
+
+def test_results_roundtrip(tmp_path: Path) -> None:
+    results = {"response.error": BenchmarkResult(10, 9, 5)}
+    dump_results(results, str(tmp_path / "baseline.json"))
+    assert load_results(str(tmp_path / "baseline.json")) == results
+
+
+def test_bench_against_baseline(tmp_path: Path) -> None:
+    baseline = str(tmp_path / "baseline.json")
+    assert bench(output=baseline, pattern="response.error")
+    assert bench(baseline=baseline, threshold=10, pattern="response.error")
+
+    dump_results({"response.error": BenchmarkResult(0.001, 0.001, 5)}, baseline)
+    assert not bench(baseline=baseline, pattern="response.error")
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from aws_spy.helpers.build_cache import BuildCache, hash_files
+
+
+def test_hash_files(tmp_path: Path) -> None:
+    first, second = tmp_path / "first.py", tmp_path / "second.py"
+    first.write_text("a = 1\n")
+    second.write_text("b = 2\n")
+
+    content_hash = hash_files({"first.py": first, "second.py": second}, "extra")
+    assert content_hash == hash_files({"second.py": second, "first.py": first}, "extra")
+    assert content_hash != hash_files({"first.py": first, "second.py": second}, "other")
+    assert content_hash != hash_files({"first.py": first, "renamed.py": second}, "extra")
+
+    second.write_text("b = 3\n")
+    assert content_hash != hash_files({"first.py": first, "second.py": second}, "extra")
+
+
+def test_build_cache(tmp_path: Path) -> None:
+    path = tmp_path / ".spy" / "build-cache.json"
+    cache = BuildCache(path)
+    assert cache.get("functions", "lambda") is None
+
+    cache.set("functions", "lambda", "abc")
+    cache.save()
+
+    cache = BuildCache(path)
+    assert cache.is_fresh("functions", "lambda", "abc")
+    assert not cache.is_fresh("functions", "lambda", "def")
+    assert not cache.is_fresh("layers", "lambda", "abc")
+
+
+def test_broken_build_cache(tmp_path: Path) -> None:
+    path = tmp_path / "build-cache.json"
+    path.write_text("{")
+    assert BuildCache(path).data == {}
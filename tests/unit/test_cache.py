@@ -0,0 +1,126 @@
+import json
+import time
+
+import pytest
+
+from aws_spy import Depends, Header, Query, SpyAPI
+from aws_spy.core.cache import InMemoryBackend, ResponseCache, ResponseCacheStore, build_cache_key
+from aws_spy.core.exceptions import BaseSpyError, RouteDefinitionError
+from aws_spy.core.schemas import Methods
+
+
+def build_response(body: str = "{}", status_code: int = 200) -> dict:
+    return {"statusCode": status_code, "headers": {"Content-Type": "application/json"}, "body": body}
+
+
+def test_cache_key() -> None:
+    assert build_cache_key({"b": 1, "a": "x"}) == build_cache_key({"a": "x", "b": 1})
+    assert build_cache_key({"a": 1}) != build_cache_key({"a": "1"})
+    assert build_cache_key({"a": 1, "event": {}}) == build_cache_key({"a": 1})
+    assert build_cache_key({"a": 1}, "gzip") != build_cache_key({"a": 1}, "br")
+
+
+def test_store_lru_eviction() -> None:
+    store = ResponseCacheStore("route", ResponseCache(max_entries=2))
+    store.set("a", build_response())
+    store.set("b", build_response())
+    assert store.get("a") is not None
+    store.set("c", build_response())
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.stats == {"hits": 3, "misses": 1, "entries": 2, "bytes": 4}
+
+
+def test_store_max_bytes() -> None:
+    store = ResponseCacheStore("route", ResponseCache(max_bytes=10))
+    store.set("big", build_response("x" * 11))
+    assert store.get("big") is None
+    store.set("a", build_response("x" * 6))
+    store.set("b", build_response("x" * 6))
+    assert store.get("a") is None
+    assert store.get("b") is not None
+
+
+def test_store_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = ResponseCacheStore("route", ResponseCache(ttl=10))
+    store.set("a", build_response())
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert store.get("a") is None
+    assert store.stats["entries"] == 0
+
+
+def test_store_skips_errors() -> None:
+    store = ResponseCacheStore("route", ResponseCache())
+    response = store.set("a", build_response(status_code=404))
+    assert "Cache-Control" not in response["headers"]
+    assert store.get("a") is None
+
+
+def test_store_returns_copies() -> None:
+    store = ResponseCacheStore("route", ResponseCache(ttl=30))
+    response = store.set("a", build_response())
+    assert response["headers"]["Cache-Control"] == "max-age=30"
+    response["headers"]["X-Extra"] = "1"
+    assert "X-Extra" not in store.get("a")["headers"]  # type: ignore
+
+
+def test_second_tier() -> None:
+    backend = InMemoryBackend()
+    first = ResponseCacheStore("route", ResponseCache(backend=backend))
+    second = ResponseCacheStore("route", ResponseCache(backend=backend))
+    first.set("a", build_response("cached"))
+    assert second.get("a")["body"] == "cached"  # type: ignore
+    assert second.stats["entries"] == 1
+    assert ResponseCacheStore("other-route", ResponseCache(backend=backend)).get("a") is None
+
+
+def test_cached_route(app: SpyAPI) -> None:
+    calls = []
+
+    @app.get("/config", "lambda", cache=ResponseCache(ttl=120, cache_control="public, max-age=120"))
+    def handler(version: int = Query()) -> dict[str, int]:
+        calls.append(version)
+        if version < 0:
+            msg = "Invalid version"
+            raise BaseSpyError(msg)
+        return {"version": version}
+
+    first = handler({"queryStringParameters": {"version": "1"}}, None)
+    second = handler({"queryStringParameters": {"version": "01"}}, None)
+    assert first == second
+    assert first["headers"]["Cache-Control"] == "public, max-age=120"
+    assert json.loads(first["body"]) == {"version": 1}
+    handler({"queryStringParameters": {"version": "2"}}, None)
+    assert calls == [1, 2]
+
+    assert handler({"queryStringParameters": {"version": "-1"}}, None)["statusCode"] == 400
+    assert handler({"queryStringParameters": {"version": "-1"}}, None)["statusCode"] == 400
+    assert calls == [1, 2, -1, -1]
+
+    store = app.routes["/config"][Methods.GET].plan.cache
+    assert store.stats["hits"] == 1
+    assert store.stats["misses"] == 4
+
+
+def test_cache_only_for_get(app: SpyAPI) -> None:
+    with pytest.raises(RouteDefinitionError, match="can't be cached"):
+        app.route(method=Methods.POST, path="/path", name="lambda", cache=True)
+
+
+def test_cache_without_dependencies(app: SpyAPI) -> None:
+    def current_user(authorization: str = Header()) -> str:
+        return authorization
+
+    def handler(user: str = Depends(current_user)) -> dict[str, str]:
+        return {"user": user}
+
+    def event_handler(event: dict) -> dict[str, str]:
+        return {"user": event["user"]}
+
+    # a hit would serve the response built for another user, without running the dependency
+    with pytest.raises(RouteDefinitionError, match="can't be cached"):
+        app.get("/me", "me", cache=True)(handler)
+    with pytest.raises(RouteDefinitionError, match="can't be cached"):
+        app.get("/event", "event", cache=True)(event_handler)
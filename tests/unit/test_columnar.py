@@ -0,0 +1,114 @@
+import array
+import json
+import typing as t
+
+import pytest
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from aws_spy import SpyAPI
+from aws_spy.core.columnar import ColumnBuilder, np
+from aws_spy.core.exceptions import FunctionDefinitionError
+
+
+class Trade(BaseModel):
+    symbol: str
+    price: float
+    quantity: int
+    is_buy: bool
+
+
+class Nested(BaseModel):
+    trade: Trade
+
+
+class Quote(BaseModel):
+    symbol: str = Field(alias="s", min_length=1)
+    size: int = 100
+
+
+def build_trade(quantity: int | str) -> str:
+    return json.dumps({"symbol": "ABC", "price": 1.5, "quantity": quantity, "is_buy": True})
+
+
+def test_column_builder() -> None:
+    rows = [
+        {"symbol": "A", "price": 1.5, "quantity": 1, "is_buy": True},
+        {"symbol": "B", "price": 2.0, "quantity": 2, "is_buy": False},
+    ]
+    columns = ColumnBuilder(Trade, use_numpy=False).build(rows)
+    assert columns == {
+        "symbol": ["A", "B"],
+        "price": array.array("d", [1.5, 2.0]),
+        "quantity": array.array("q", [1, 2]),
+        "is_buy": array.array("b", [1, 0]),
+    }
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+def test_column_builder_numpy() -> None:
+    rows = [
+        {"symbol": "A", "price": 1.5, "quantity": 1, "is_buy": True},
+        {"symbol": "B", "price": 2.0, "quantity": 2, "is_buy": False},
+    ]
+    columns = ColumnBuilder(Trade, use_numpy=True).build(rows)
+    assert columns["price"].dtype == np.float64
+    assert columns["quantity"].sum() == 3
+    assert columns["is_buy"].tolist() == [True, False]
+    assert columns["symbol"].tolist() == ["A", "B"]
+
+
+def test_column_builder_row_type() -> None:
+    builder = ColumnBuilder(Quote, use_numpy=False)
+    validate_json = TypeAdapter(builder.row_type).validate_json
+    rows = [validate_json('{"s": "A"}'), validate_json('{"s": "B", "size": 5}')]
+    assert rows == [{"symbol": "A"}, {"symbol": "B", "size": 5}]
+    assert builder.build(rows) == {"symbol": ["A", "B"], "size": array.array("q", [100, 5])}
+    for invalid in ('{"s": ""}', '{"symbol": "A"}', f'{{"s": "A", "size": {2**63}}}'):
+        with pytest.raises(ValidationError):
+            validate_json(invalid)
+
+
+def test_columnar_sqs(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    batches = []
+
+    @app.sqs("trades", queue="arn", model=Trade, columnar=True)
+    def handler(columns: dict, context: str) -> None:
+        batches.append((list(columns["quantity"]), context))
+        if sum(columns["quantity"]) > 10:
+            msg = "Too big"
+            raise ValueError(msg)
+
+    assert handler(build_sqs_event(build_trade(1), build_trade("x"), build_trade(2)), "context") == {
+        "batchItemFailures": [{"itemIdentifier": "m1"}]
+    }
+    assert batches == [([1, 2], "context")]
+
+    response = handler(build_sqs_event(build_trade(5), build_trade(6)))
+    assert response == {"batchItemFailures": [{"itemIdentifier": "m0"}, {"itemIdentifier": "m1"}]}
+
+    # too big for an int64 column, only that record fails
+    response = handler(build_sqs_event(build_trade(2**63), build_trade(3)))
+    assert response == {"batchItemFailures": [{"itemIdentifier": "m0"}]}
+    assert batches[-1] == ([3], None)
+
+
+def test_columnar_fifo(app: SpyAPI, build_sqs_event: t.Callable[..., dict[str, t.Any]]) -> None:
+    batches = []
+
+    @app.sqs("trades", queue="arn", model=Trade, columnar=True)
+    async def handler(columns: dict) -> None:
+        batches.append(list(columns["quantity"]))
+
+    event = build_sqs_event(build_trade(1), build_trade("x"), build_trade(2), queue="arn:aws:sqs:eu-west-1:1:t.fifo")
+    assert handler(event) == {"batchItemFailures": [{"itemIdentifier": "m1"}, {"itemIdentifier": "m2"}]}
+    assert batches == [[1]]
+
+
+def test_columnar_needs_flat_model(app: SpyAPI) -> None:
+    def handler(columns: dict) -> None:
+        ...
+
+    with pytest.raises(FunctionDefinitionError, match="flat pydantic model"):
+        app.sqs("nested", queue="arn", model=Nested, columnar=True)(handler)
+    with pytest.raises(FunctionDefinitionError, match="flat pydantic model"):
+        app.kinesis("no-model", stream="arn", columnar=True)(handler)
@@ -0,0 +1,118 @@
+import base64
+import gzip
+import json
+import typing as t
+import zlib
+
+import pytest
+
+from aws_spy.core.compression import (
+    Compression,
+    compress_response,
+    decode_request_body,
+    decompress,
+    get_header,
+    negotiate_encoding,
+)
+from aws_spy.core.exceptions import RequestBodyTooLargeError, UnsupportedContentEncodingError
+
+
+@pytest.mark.parametrize(
+    ["accept_encoding", "expected_encoding"],
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("gzip;q=0.5, deflate", "deflate"),
+        ("gzip;q=0, deflate;q=0", None),
+        ("*", "gzip"),
+        ("GZIP;q=0.8", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str | None, expected_encoding: str | None) -> None:
+    assert negotiate_encoding(accept_encoding, ["gzip", "deflate"]) == expected_encoding
+
+
+def test_get_header() -> None:
+    assert get_header({"Accept-Encoding": "gzip"}, "accept-encoding") == "gzip"
+    assert get_header({"accept-encoding": "gzip"}, "Accept-Encoding") == "gzip"
+    assert get_header(None, "Accept-Encoding") is None
+
+
+def test_compress_response() -> None:
+    body = json.dumps([{"x": i} for i in range(100)])
+    response = {"statusCode": 200, "body": body, "headers": {"Content-Type": "application/json"}}
+    compression = Compression(minimum_size=100, encodings=["gzip"])
+
+    compressed = compress_response(response, "gzip, deflate", compression)
+    assert compressed["isBase64Encoded"] is True
+    assert compressed["headers"] == {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+        "Vary": "Accept-Encoding",
+    }
+    assert gzip.decompress(base64.b64decode(compressed["body"])).decode() == body
+
+    assert compress_response(response, "deflate", compression) is response
+    assert compress_response(response, "gzip", Compression(minimum_size=len(body) + 1)) is response
+
+
+@pytest.mark.parametrize(
+    ["event", "expected_body"],
+    [
+        ({"body": '{"x": 1}'}, '{"x": 1}'),
+        ({"body": None}, None),
+        ({"body": base64.b64encode(b'{"x": 1}').decode(), "isBase64Encoded": True}, b'{"x": 1}'),
+        (
+            {
+                "body": base64.b64encode(gzip.compress(b'{"x": 1}')).decode(),
+                "isBase64Encoded": True,
+                "headers": {"content-encoding": "gzip"},
+            },
+            b'{"x": 1}',
+        ),
+        (
+            {
+                "body": base64.b64encode(zlib.compress(b'{"x": 1}')).decode(),
+                "isBase64Encoded": True,
+                "headers": {"Content-Encoding": "deflate"},
+            },
+            b'{"x": 1}',
+        ),
+    ],
+)
+def test_decode_request_body(event: dict[str, t.Any], expected_body: str | bytes | None) -> None:
+    assert decode_request_body(event) == expected_body
+
+
+def test_decode_request_body_error() -> None:
+    event = {"body": "bm90IGd6aXA=", "isBase64Encoded": True, "headers": {"Content-Encoding": "gzip"}}
+    with pytest.raises(ValueError, match="Request body could not be decoded."):
+        decode_request_body(event)
+
+
+def test_decode_request_body_unsupported_encoding() -> None:
+    event = {"body": "eA==", "isBase64Encoded": True, "headers": {"Content-Encoding": "zstd"}}
+    with pytest.raises(UnsupportedContentEncodingError, match="Unsupported content encoding: zstd"):
+        decode_request_body(event)
+
+
+def test_decode_request_body_invalid_base64() -> None:
+    with pytest.raises(ValueError, match="Request body could not be decoded."):
+        decode_request_body({"body": "not base64", "isBase64Encoded": True})
+
+
+@pytest.mark.parametrize(
+    ["data", "encoding"],
+    [
+        (gzip.compress(b"x" * 101), "gzip"),
+        (gzip.compress(b"x" * 60) * 2, "gzip"),
+        (zlib.compress(b"x" * 101), "deflate"),
+    ],
+)
+def test_decompress_max_size(data: bytes, encoding: str) -> None:
+    with pytest.raises(RequestBodyTooLargeError, match="bigger than 100 bytes"):
+        decompress(data, encoding, max_size=100)
+    assert len(decompress(data, encoding, max_size=200)) in (101, 120)
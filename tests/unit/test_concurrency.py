@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aws_spy import SpyAPI, offload, run_in_threadpool
+from aws_spy.core import concurrency
+from aws_spy.core.concurrency import get_event_loop, run_sync
+
+
+def test_event_loop_persists() -> None:
+    loop = get_event_loop()
+
+    async def running_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    assert run_sync(running_loop()) is loop
+    assert run_sync(running_loop()) is loop
+    assert get_event_loop() is loop
+
+
+def test_event_loop_recreated_when_closed() -> None:
+    loop = get_event_loop()
+    loop.close()
+    assert get_event_loop() is not loop
+
+
+def test_default_loop_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(concurrency.UVLOOP_ENV, "0")
+    loop = concurrency.new_event_loop()
+    assert type(loop).__module__.startswith("asyncio")
+    loop.close()
+
+
+def test_async_route(app: SpyAPI) -> None:
+    loops = []
+
+    @app.get("/items", "lambda")
+    async def handler() -> dict[str, int]:
+        loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        return {"count": 1}
+
+    first = handler({}, None)
+    second = handler({}, None)
+    assert first["statusCode"] == 200
+    assert first["body"] == second["body"]
+    assert loops[0] is loops[1]
+
+
+def test_async_function(app: SpyAPI) -> None:
+    @app.function("async-function")
+    async def handler(event: dict, context: None) -> dict:  # noqa: ARG001
+        await asyncio.sleep(0)
+        return event
+
+    assert handler({"x": 1}, None) == {"x": 1}
+
+
+def test_offload_runs_concurrently(app: SpyAPI) -> None:
+    @offload
+    def fetch(number: int) -> tuple[int, str]:
+        time.sleep(0.05)
+        return number, threading.current_thread().name
+
+    @app.get("/fan-out", "fan-out")
+    async def handler() -> list:
+        return list(await asyncio.gather(*(fetch(number) for number in range(5))))
+
+    start = time.perf_counter()
+    response = handler({}, None)
+    assert time.perf_counter() - start < 0.2
+    assert response["statusCode"] == 200
+    assert '"spy-offload' in response["body"]
+
+
+def test_run_in_threadpool_keeps_arguments() -> None:
+    def add(a: int, *, b: int) -> int:
+        return a + b
+
+    assert run_sync(run_in_threadpool(add, 1, b=2)) == 3
@@ -0,0 +1,231 @@
+import asyncio
+import json
+import typing as t
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from aws_spy import BaseSpyError, Depends, Header, Path, Query, SpyAPI
+from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.manifest import build_manifest_entry
+from aws_spy.core.schemas import Methods
+from aws_spy.dependencies import aclose_container, close_container
+
+
+@pytest.fixture(autouse=True)
+def container() -> Iterator[None]:
+    yield
+    close_container()
+
+
+def test_dependency_params(app: SpyAPI) -> None:
+    def pagination(limit: int = Query(), offset: int | None = Query()) -> tuple[int, int]:
+        return limit, offset or 0
+
+    def current_user(token: str = Header("x-token")) -> str:
+        if token != "secret":
+            msg = "Unauthorized"
+            raise BaseSpyError(msg, status_code=401)
+        return "user"
+
+    @app.get("/items/{item_id}", "lambda")
+    def handler(
+        item_id: int = Path(),
+        limit: int = Query(),
+        page: tuple[int, int] = Depends(pagination),
+        user: str = Depends(current_user),
+    ) -> dict[str, t.Any]:
+        return {"item_id": item_id, "limit": limit, "page": page, "user": user}
+
+    route = app.routes["/items/{item_id}"][Methods.GET]
+    assert [param.name for param in route.query_params] == ["limit", "offset"]
+    assert [param.name for param in route.header_params] == ["x-token"]
+
+    event = {
+        "pathParameters": {"item_id": "1"},
+        "queryStringParameters": {"limit": "10", "offset": "5"},
+        "headers": {"X-Token": "secret"},
+    }
+    response = handler(event, None)
+    assert json.loads(response["body"]) == {"item_id": 1, "limit": 10, "page": [10, 5], "user": "user"}
+
+    response = handler({**event, "headers": {"X-Token": "wrong"}}, None)
+    assert response["statusCode"] == 401
+
+    response = handler({**event, "headers": {}}, None)
+    assert response["statusCode"] == 422
+
+
+def test_dependency_cached_per_invocation(app: SpyAPI) -> None:
+    calls = []
+
+    def settings() -> dict[str, int]:
+        calls.append(1)
+        return {"page_size": 10}
+
+    def page_size(settings: dict[str, int] = Depends(settings)) -> int:
+        return settings["page_size"]
+
+    @app.get("/path", "lambda")
+    def handler(settings: dict = Depends(settings), size: int = Depends(page_size)) -> dict[str, int]:
+        return {"size": size}
+
+    handler({}, None)
+    handler({}, None)
+    assert len(calls) == 2
+
+
+def test_container_scope(app: SpyAPI) -> None:
+    events = []
+
+    def client() -> Iterator[object]:
+        events.append("open")
+        yield object()
+        events.append("close")
+
+    @app.get("/a", "a")
+    def a(event: dict, client: object = Depends(client, scope="container")) -> dict[str, int]:
+        return {"id": id(client)}
+
+    @app.get("/b", "b")
+    def b(client: object = Depends(client, scope="container")) -> dict[str, int]:
+        return {"id": id(client)}
+
+    assert a({}, None)["body"] == a({}, None)["body"] == b({}, None)["body"]
+    assert events == ["open"]
+    close_container()
+    assert events == ["open", "close"]
+    a({}, None)
+    assert events == ["open", "close", "open"]
+
+
+def test_yield_teardown(app: SpyAPI) -> None:
+    events = []
+
+    def session(event: dict) -> Iterator[str]:
+        events.append("open")
+        try:
+            yield event["session"]
+        except BaseSpyError:
+            events.append("rollback")
+            raise
+        finally:
+            events.append("close")
+
+    @app.post("/path", "lambda")
+    def handler(session: str = Depends(session), fail: bool | None = Query()) -> dict[str, str]:
+        events.append("handler")
+        if fail:
+            msg = "Failed"
+            raise BaseSpyError(msg, status_code=409)
+        return {"session": session}
+
+    assert handler({"session": "s"}, None)["statusCode"] == 201
+    assert events == ["open", "handler", "close"]
+
+    events.clear()
+    assert handler({"session": "s", "queryStringParameters": {"fail": "true"}}, None)["statusCode"] == 409
+    assert events == ["open", "handler", "rollback", "close"]
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_yield_teardown_after_serialization(app: SpyAPI, is_async: bool) -> None:  # noqa: FBT001
+    events = []
+
+    def session() -> Iterator[str]:
+        events.append("open")
+        yield "session"
+        events.append("close")
+
+    def items(session: str) -> Iterator[dict[str, str]]:
+        for index in range(2):
+            events.append(f"item{index}")
+            yield {"session": session}
+
+    if is_async:
+
+        @app.get("/path", "lambda")
+        async def handler(session: str = Depends(session)) -> Iterator[dict[str, str]]:
+            return items(session)
+
+    else:
+
+        @app.get("/path", "lambda")
+        def handler(session: str = Depends(session)) -> Iterator[dict[str, str]]:
+            return items(session)
+
+    assert json.loads(handler({}, None)["body"]) == [{"session": "session"}] * 2
+    assert events == ["open", "item0", "item1", "close"]
+
+
+def test_async_dependencies(app: SpyAPI) -> None:
+    events = []
+
+    async def connection() -> AsyncIterator[str]:
+        await asyncio.sleep(0)
+        events.append("connect")
+        yield "connection"
+        events.append("disconnect")
+
+    async def repository(connection: str = Depends(connection, scope="container")) -> str:
+        return f"repository({connection})"
+
+    def settings() -> str:
+        return "settings"
+
+    @app.get("/path", "lambda")
+    async def handler(repository: str = Depends(repository), settings: str = Depends(settings)) -> dict[str, str]:
+        return {"repository": repository, "settings": settings}
+
+    assert json.loads(handler({}, None)["body"]) == {"repository": "repository(connection)", "settings": "settings"}
+    handler({}, None)
+    assert events == ["connect"]
+    asyncio.run(aclose_container())
+    assert events == ["connect", "disconnect"]
+
+
+def test_async_dependency_of_sync_handler(app: SpyAPI) -> None:
+    async def connection() -> str:
+        return "connection"
+
+    @app.get("/path", "lambda")
+    def handler(connection: str = Depends(connection)) -> None:
+        ...
+
+    with pytest.raises(RouteDefinitionError, match="need an async handler"):
+        app.compile()
+
+
+def test_invalid_dependencies(app: SpyAPI) -> None:
+    def unknown(value: int) -> int:
+        return value
+
+    with pytest.raises(RouteDefinitionError, match='Unrecognized "value" param'):
+
+        @app.get("/a", "a")
+        def a(value: int = Depends(unknown)) -> None:
+            ...
+
+    def user(token: str = Header()) -> str:
+        return token
+
+    def client(user: str = Depends(user)) -> str:
+        return user
+
+    @app.get("/b", "b")
+    def b(client: str = Depends(client, scope="container")) -> None:
+        ...
+
+    with pytest.raises(RouteDefinitionError, match="can't depend on invocation scoped"):
+        app.compile()
+
+    with pytest.raises(RouteDefinitionError, match="Unknown"):
+        Depends(user, scope="request")  # type: ignore
+
+
+def test_manifest_skips_routes_with_dependencies(app: SpyAPI) -> None:
+    @app.get("/path", "lambda")
+    def handler(value: str = Depends(lambda: "value")) -> None:
+        ...
+
+    assert build_manifest_entry(app.routes["/path"][Methods.GET])["fingerprint"] is None
@@ -0,0 +1,149 @@
+import json
+import typing as t
+from pathlib import Path as FilePath
+
+import pytest
+
+from aws_spy import Path, ServerlessConfig, SpyAPI
+from aws_spy.core.config import Function
+from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.manifest import MANIFEST_FILE_NAME, load_manifest, write_manifest
+from aws_spy.dispatch import Dispatcher, DispatchTarget, RadixTree, get_router_function
+
+app = SpyAPI(config=None, defer_routes=True)  # type: ignore
+
+
+@app.get("/lazy/{item_id}", "lazy-item")
+def lazy_item(item_id: int = Path()) -> dict:
+    return {"item_id": item_id}
+
+
+def build_event(method: str, path: str, **kwargs: t.Any) -> dict[str, t.Any]:
+    return {"rawPath": path, "requestContext": {"http": {"method": method}, "stage": "$default"}, **kwargs}
+
+
+def test_radix_tree() -> None:
+    tree = RadixTree()
+    targets = {path: DispatchTarget("module", path) for path in ("/users", "/users/me", "/users/{user_id}/items/{id}")}
+    for path, target in targets.items():
+        tree.insert("GET", path, target)
+
+    assert tree.lookup("/users") == ({"GET": targets["/users"]}, {})
+    assert tree.lookup("/users/me/") == ({"GET": targets["/users/me"]}, {})
+    assert tree.lookup("/users/me/items/1") == (
+        {"GET": targets["/users/{user_id}/items/{id}"]},
+        {"user_id": "me", "id": "1"},
+    )
+    assert tree.lookup("/users/1") is None
+    assert tree.lookup("/") is None
+
+    with pytest.raises(RouteDefinitionError):
+        tree.insert("get", "/users", targets["/users"])
+
+
+@pytest.mark.parametrize(
+    ("tags", "expected"),
+    [(None, "api"), (["public"], "api"), (["admin"], "admin"), (["public", "admin"], "admin")],
+)
+def test_get_router_function(tags: list[str] | None, expected: str) -> None:
+    assert get_router_function(tags, {"api": None, "admin": ["admin"]}) == expected
+    assert get_router_function(tags, {"other": ["other"]}) is None
+
+
+@pytest.fixture
+def dispatcher(config: ServerlessConfig) -> Dispatcher:
+    app = SpyAPI(config=config, router_functions={"admin": ["admin"], "api": None})
+
+    @app.get("/users/{user_id}", "get-user")
+    def get_user(user_id: int = Path()) -> dict:
+        return {"user_id": user_id}
+
+    @app.delete("/users/{user_id}", "delete-user", tags=["admin"])
+    def delete_user(user_id: int = Path()) -> None:
+        ...
+
+    return Dispatcher.from_app(app, "api")
+
+
+def test_dispatcher(dispatcher: Dispatcher) -> None:
+    response = dispatcher(build_event("GET", "/users/1", pathParameters={"proxy": "users/1"}), None)
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"user_id": 1}
+
+    response = dispatcher(build_event("GET", "/users/1", pathParameters={"user_id": "2"}), None)
+    assert json.loads(response["body"]) == {"user_id": 2}
+
+    response = dispatcher({"path": "/users/3", "httpMethod": "GET"}, None)
+    assert json.loads(response["body"]) == {"user_id": 3}
+
+    event = build_event("GET", "/dev/users/4")
+    event["requestContext"]["stage"] = "dev"
+    assert json.loads(dispatcher(event, None)["body"]) == {"user_id": 4}
+
+
+def test_dispatcher_head(dispatcher: Dispatcher) -> None:
+    response = dispatcher(build_event("HEAD", "/users/1"), None)
+    assert response["statusCode"] == 200
+    assert response["body"] == ""
+    assert response["headers"]["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize(("method", "path", "status_code"), [("GET", "/missing", 404), ("DELETE", "/users/1", 405)])
+def test_dispatcher_not_matched(dispatcher: Dispatcher, method: str, path: str, status_code: int) -> None:
+    assert dispatcher(build_event(method, path), None)["statusCode"] == status_code
+
+
+def test_dispatcher_from_manifest(tmp_path: FilePath, monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest_path = str(tmp_path / MANIFEST_FILE_NAME)
+    write_manifest([], manifest_path, {"api": [("GET", "/lazy/{item_id}", __name__, "lazy_item")]})
+    monkeypatch.setenv("SPY_MANIFEST", manifest_path)
+    monkeypatch.setenv("SPY_ROUTER", "api")
+    load_manifest.cache_clear()
+    try:
+        dispatcher = Dispatcher.from_manifest()
+        with pytest.raises(RouteDefinitionError):
+            Dispatcher.from_manifest("other")
+    finally:
+        load_manifest.cache_clear()
+
+    target = dispatcher.tree.lookup("/lazy/1")[0]["GET"]  # type: ignore
+    assert target._handler is None
+    response = dispatcher(build_event("GET", "/lazy/1"), None)
+    assert json.loads(response["body"]) == {"item_id": 1}
+    assert target._handler is lazy_item
+
+
+@pytest.mark.parametrize(
+    ("paths", "expected"),
+    [
+        (["/users", "/users/{user_id}"], ["/users", "/users/{proxy+}"]),
+        (["/users/{user_id}", "/users/{user_id}/items"], ["/users/{proxy+}"]),
+        (["/users", "/items"], ["/{proxy+}"]),
+        (["/", "/items"], ["/", "/{proxy+}"]),
+    ],
+)
+def test_build_catch_all_events(paths: list[str], expected: list[str]) -> None:
+    events = Function.build_catch_all_events(paths, "jwt")
+    assert [event["httpApi"]["path"] for event in events] == expected
+    assert all(event["httpApi"]["method"] == "*" for event in events)
+    assert all(event["httpApi"]["authorizer"] == {"name": "jwt"} for event in events)
+
+
+def test_router_catch_all_collision(config: ServerlessConfig) -> None:
+    app = SpyAPI(config=config)
+    for path in ("/users/me", "/items", "/orders", "/payments", "/health"):
+        app.get(path, path.strip("/").split("/")[0], skip_validation=True)(lambda: None)
+    routes = {path: (path, method, route) for path, methods in app.routes.items() for method, route in methods.items()}
+    groups = {"api": ["/users/me", "/items"], "billing": ["/orders", "/payments"], "health": ["/health"]}
+
+    events = {}
+    for name, paths in groups.items():
+        other_paths = [path for other_name, other in groups.items() if other_name != name for path in other]
+        function = Function.from_router(name=name, routes=[routes[path] for path in paths], other_paths=other_paths)
+        events[name] = [(event["httpApi"]["method"], event["httpApi"]["path"]) for event in function.events]
+    # both groups would be served by ANY /{proxy+}, so their routes are declared one by one
+    assert events == {
+        "api": [("GET", "/users/me"), ("GET", "/items")],
+        "billing": [("GET", "/orders"), ("GET", "/payments")],
+        "health": [("*", "/health")],
+    }
@@ -1,9 +1,26 @@
 import json
+import typing as t
 from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from aws_spy.core.encoders import JSONEncoder
+import pytest
+import typing_extensions as te
+from pydantic import BaseModel
+
+from aws_spy import ServerlessConfig, SpyAPI, SpyRouter
+from aws_spy.core.encoders import (
+    ENCODERS,
+    JSONBackendName,
+    JSONEncoder,
+    StdlibJSONBackend,
+    build_json_backend,
+    encode_default,
+    get_json_backend,
+    get_model_serializer,
+    register_encoder,
+)
+from aws_spy.test import TestClient
 
 
 def test_json_encoder() -> None:
@@ -20,3 +37,127 @@ def test_json_encoder() -> None:
         '{"decimal": 0.55, "datetime": "2023-05-10T00:00:00", "date": "2022-05-10", '
         '"uuid": "a2618752-dc19-4f40-adf5-6173d419f2ed", "default": 1}'
     )
+
+
+class ExampleModel(BaseModel):
+    x: int
+    created: date
+
+
+class ExampleAttributes:
+    def __init__(self, x: int, created: date) -> None:
+        self.x = x
+        self.created = created
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        ExampleModel(x=1, created=date(2022, 5, 10)),
+        {"x": 1, "created": "2022-05-10"},
+        ExampleAttributes(x=1, created=date(2022, 5, 10)),
+    ],
+)
+def test_model_serializer(data: t.Any) -> None:
+    serializer = get_model_serializer(ExampleModel)
+    assert serializer is get_model_serializer(ExampleModel)
+    assert serializer.to_json(data) == '{"x":1,"created":"2022-05-10"}'
+
+
+class Money:
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "pydantic-core", "auto"])
+def test_json_backends(name: JSONBackendName) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    backend = build_json_backend(name, compact=True)
+    obj = {
+        "datetime": datetime(2023, 5, 10),  # noqa: DTZ001
+        "date": date(2022, 5, 10),
+        "uuid": UUID("a2618752-dc19-4f40-adf5-6173d419f2ed"),
+        "text": "zażółć",
+    }
+    encoded = backend.dumps(obj)
+    assert encoded == (
+        '{"datetime":"2023-05-10T00:00:00","date":"2022-05-10",'
+        '"uuid":"a2618752-dc19-4f40-adf5-6173d419f2ed","text":"zażółć"}'
+    )
+    assert backend.loads(encoded)["text"] == "zażółć"
+
+
+def test_stdlib_backend_separators() -> None:
+    assert build_json_backend("stdlib").dumps({"x": [1, 2]}) == '{"x": [1, 2]}'
+    assert build_json_backend("stdlib", compact=True).dumps({"x": [1, 2]}) == '{"x":[1,2]}'
+
+
+def test_register_encoder() -> None:
+    class Euro(Money):
+        ...
+
+    with pytest.raises(TypeError):
+        encode_default(Money(1))
+    register_encoder(Money, lambda o: o.amount)
+    try:
+        assert encode_default(Euro(2)) == 2
+        assert build_json_backend("pydantic-core").dumps({"money": Money(3)}) == '{"money":3}'
+    finally:
+        ENCODERS.pop(Money)
+
+
+def test_app_json_backend(config: ServerlessConfig) -> None:
+    default_backend = get_json_backend()
+    compact_app = SpyAPI(config=config, compact_json=True)
+    core_app = SpyAPI(config=config, json_backend="pydantic-core")
+    assert get_json_backend() is default_backend
+
+    def price() -> dict[str, Decimal]:
+        return {"amount": Decimal("1.5")}
+
+    router = SpyRouter()
+    routed = router.get("/routed", "routed")(price)
+    compact_app.register_router(router)
+    compact = compact_app.get("/price", "compact")(price)
+    core = core_app.get("/price", "core")(price)
+    default = SpyAPI(config=config).get("/price", "default")(price)
+
+    assert compact({}, None)["body"] == routed({}, None)["body"] == '{"amount":1.5}'
+    assert core({}, None)["body"] == '{"amount":"1.5"}'
+    assert default({}, None)["body"] == '{"amount": 1.5}'
+
+
+def test_test_client_json_backend(config: ServerlessConfig) -> None:
+    class DecimalJSONBackend(StdlibJSONBackend):
+        def loads(self: te.Self, data: str | bytes) -> t.Any:
+            return json.loads(data, parse_float=Decimal)
+
+    app = SpyAPI(config=config, json_backend=DecimalJSONBackend())
+
+    @app.get("/price", "price")
+    def price() -> dict[str, Decimal]:
+        return {"amount": Decimal("1.5")}
+
+    assert isinstance(TestClient.get(price).json["amount"], Decimal)
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        ("stdlib", '{"amount":1.5,"date":"05/10/2022"}'),
+        ("orjson", '{"amount":1.5,"date":"05/10/2022"}'),
+        # natively handled types don't go through registered encoders
+        ("pydantic-core", '{"amount":"1.5","date":"2022-05-10"}'),
+    ],
+)
+def test_backend_differences(name: JSONBackendName, expected: str) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    register_encoder(date, lambda o: o.strftime("%m/%d/%Y"))
+    try:
+        assert build_json_backend(name, compact=True).dumps({"amount": Decimal("1.5"), "date": date(2022, 5, 10)}) == (
+            expected
+        )
+    finally:
+        register_encoder(date, date.isoformat)
@@ -0,0 +1,130 @@
+import hashlib
+import json
+
+import pytest
+
+from aws_spy import SpyAPI
+from aws_spy.core import etag as etag_module
+from aws_spy.core.compression import Compression
+from aws_spy.core.config import Function
+from aws_spy.core.etag import compute_etag, etag_matches, quote_etag
+from aws_spy.core.exceptions import RouteDefinitionError
+from aws_spy.core.schemas import Methods
+from aws_spy.responses import JSONResponse
+
+
+def build_event(method: str = "GET", **headers: str) -> dict:
+    return {"headers": headers, "requestContext": {"http": {"method": method}}}
+
+
+def test_compute_etag() -> None:
+    etag = compute_etag('{"a": 1}')
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert etag == compute_etag(b'{"a": 1}')
+    assert etag != compute_etag('{"a": 2}')
+
+
+def test_compute_etag_without_xxhash(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(etag_module, "xxhash", None)
+    digest = hashlib.blake2b(b'{"a": 1}', digest_size=16).hexdigest()
+    assert compute_etag('{"a": 1}') == f'"{digest}"'
+
+
+@pytest.mark.parametrize(
+    ["if_none_match", "matches"],
+    [
+        (None, False),
+        ('"a"', True),
+        ('W/"a"', True),
+        ('"b", "a"', True),
+        ("*", True),
+        ('"b"', False),
+    ],
+)
+def test_etag_matches(if_none_match: str | None, matches: bool) -> None:  # noqa: FBT001
+    assert etag_matches(if_none_match, '"a"') is matches
+
+
+def test_quote_etag() -> None:
+    assert quote_etag("v1") == '"v1"'
+    assert quote_etag('"v1"') == '"v1"'
+    assert quote_etag('W/"v1"') == 'W/"v1"'
+
+
+def test_conditional_get(app: SpyAPI) -> None:
+    @app.get("/dashboard", "lambda", etag=True)
+    def handler() -> dict[str, list[int]]:
+        return {"values": list(range(100))}
+
+    response = handler(build_event(), None)
+    etag = response["headers"]["ETag"]
+    assert etag == compute_etag(response["body"])
+
+    not_modified = handler(build_event(**{"If-None-Match": etag}), None)
+    assert not_modified == {"statusCode": 304, "headers": {"ETag": etag}, "body": ""}
+    assert handler(build_event(**{"If-None-Match": '"other"'}), None)["statusCode"] == 200
+
+    head = handler(build_event("HEAD"), None)
+    assert head["body"] == ""
+    assert head["headers"]["ETag"] == etag
+
+
+def test_version_token_skips_serialization(app: SpyAPI) -> None:
+    serialized = []
+
+    @app.get("/dashboard", "lambda", etag=True)
+    def handler() -> JSONResponse:
+        return JSONResponse({"values": [1, 2]}, etag="v42")
+
+    response = handler(build_event(), None)
+    assert response["headers"]["ETag"] == '"v42"'
+    assert json.loads(response["body"]) == {"values": [1, 2]}
+
+    class Lazy(JSONResponse):
+        @property
+        def response(self) -> dict:
+            serialized.append(1)
+            return super().response
+
+    @app.get("/lazy", "lazy", etag=True)
+    def lazy() -> JSONResponse:
+        return Lazy({"values": [1, 2]}, etag="v42")
+
+    assert lazy(build_event(**{"If-None-Match": '"v42"'}), None)["statusCode"] == 304
+    assert serialized == []
+
+
+def test_etag_with_cache_and_compression(app: SpyAPI) -> None:
+    calls = []
+
+    @app.get("/dashboard", "lambda", etag=True, cache=True, compression=Compression(minimum_size=10))
+    def handler() -> dict[str, str]:
+        calls.append(1)
+        return {"value": "x" * 100}
+
+    response = handler(build_event(**{"Accept-Encoding": "gzip"}), None)
+    etag = response["headers"]["ETag"]
+    assert etag.startswith('W/"')
+    assert response["headers"]["Content-Encoding"] == "gzip"
+
+    cached = handler(build_event(**{"Accept-Encoding": "gzip", "If-None-Match": etag}), None)
+    assert cached["statusCode"] == 304
+    assert cached["headers"]["Cache-Control"] == "max-age=60"
+    assert handler(build_event("HEAD", **{"Accept-Encoding": "gzip"}), None)["body"] == ""
+    assert handler(build_event(**{"Accept-Encoding": "gzip"}), None)["body"] == response["body"]
+    assert len(calls) == 2
+
+
+def test_etag_only_for_get(app: SpyAPI) -> None:
+    with pytest.raises(RouteDefinitionError, match="tagged with ETag"):
+        app.route(method=Methods.PUT, path="/path", name="lambda", etag=True)
+
+
+def test_head_event(app: SpyAPI) -> None:
+    @app.get("/dashboard", "lambda", etag=True)
+    def handler() -> None:
+        ...
+
+    function = Function.from_route(route=app.routes["/dashboard"][Methods.GET], path="/dashboard", method=Methods.GET)
+    assert [event["httpApi"]["method"] for event in function.events] == ["GET", "HEAD"]
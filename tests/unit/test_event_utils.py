@@ -77,6 +77,13 @@ def gpm(
             {"user_id": None},
             [],
         ],
+        [
+            {"user_id": "false"},
+            [gpm("user_id", "user_id", bool)],
+            "header",
+            {"user_id": False},
+            [],
+        ],
         [
             {"user_id": "example"},
             [gpm("user_id", "user_id", ExampleEnum)],
@@ -110,6 +117,9 @@ def test_export_params_from_event_success(
     [
         (json.dumps({"a": 1, "b": "string", "c": True, "d": None}), False),
         ["", True],
+        [None, True],
+        ["{not json", True],
+        (json.dumps({"a": 1, "b": "string", "c": True, "d": None}).encode(), False),
         (
             json.dumps({"a": "str", "b": "string", "c": "str", "d": None}),
             True,
@@ -124,8 +134,23 @@ def test_export_params_from_event_success(
         ),
     ],
 )
-def test_export_request_body(body: str, expecting_errors: bool) -> None:  # noqa: FBT001
+def test_export_request_body(body: str | bytes | None, expecting_errors: bool) -> None:  # noqa: FBT001
     request_body, errors = export_request_body(body, ExampleRequestBody)
     assert bool(errors) == expecting_errors
     if not errors:
         assert isinstance(request_body, ExampleRequestBody)
+
+
+@pytest.mark.parametrize(
+    ["body", "expected_errors"],
+    [
+        ("", ["Request body is empty!"]),
+        (None, ["Request body is empty!"]),
+        ("{not json", ["Request body is empty!"]),
+        (json.dumps({"b": "string", "c": True, "d": None}), ["Value not found at: a"]),
+    ],
+)
+def test_export_request_body_errors(body: str | None, expected_errors: list[str]) -> None:
+    request_body, errors = export_request_body(body, ExampleRequestBody)
+    assert request_body is None
+    assert errors == expected_errors
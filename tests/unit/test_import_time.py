@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+RUNTIME_IMPORT = "from aws_spy import SpyAPI, SpyRouter, Query, Path, Header, BaseSpyError, responses"
+# self time of aws_spy modules as a share of the whole import, third party packages included,
+# close to the measured share (about 0.19), unlike absolute times it doesn't drift with machine load
+IMPORT_BUDGET_SHARE = 0.25
+IMPORT_RUNS = 5
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    command = [sys.executable, *args]
+    return subprocess.run(command, capture_output=True, text=True, check=True, cwd=ROOT_DIR)  # noqa: S603
+
+
+def imported_modules(statement: str) -> set[str]:
+    result = run_python("-c", f"import sys; {statement}; print(' '.join(sys.modules))")
+    return set(result.stdout.split())
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int]]:
+    times = {}
+    for line in run_python("-X", "importtime", "-c", statement).stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_package_import_is_lazy() -> None:
+    modules = imported_modules("import aws_spy")
+    assert "pydantic" not in modules
+    assert "aws_spy.main" not in modules
+
+
+def test_runtime_import_surface() -> None:
+    modules = imported_modules(RUNTIME_IMPORT)
+    assert "aws_spy.main" in modules
+    assert "aws_spy.core.config" not in modules
+    assert "asyncio" not in modules
+    assert "yaml" not in modules
+    assert not [name for name in modules if name.startswith("aws_spy.helpers")]
+    # batch and stream functions are imported by their decorators
+    assert "aws_spy.core.batch" not in modules
+    assert "aws_spy.core.streams" not in modules
+    assert "aws_spy.asgi" not in modules
+
+
+def test_runtime_import_budget() -> None:
+    # lazy attributes are imported with importlib, which -X importtime does not report
+    shares = []
+    for _ in range(IMPORT_RUNS):
+        times = import_times(f"import aws_spy.main, aws_spy.responses; {RUNTIME_IMPORT}")
+        assert "aws_spy.main" in times
+        own_time = sum(self_us for name, (self_us, _) in times.items() if name.startswith("aws_spy"))
+        shares.append(own_time / sum(self_us for self_us, _ in times.values()))
+    assert min(shares) < IMPORT_BUDGET_SHARE
@@ -0,0 +1,122 @@
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from aws_spy.helpers.build_cache import BuildCache
+from aws_spy.helpers.exceptions import PythonEnvironmentError
+from aws_spy.helpers.layer import build_layer, get_missing_requirements, is_stripped, is_wheel_compatible
+
+PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
+CPYTHON_TAG = f"cp{sys.version_info.major}{sys.version_info.minor}"
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("pydantic/main.py", False),
+        ("pydantic/__pycache__/main.cpython-310.pyc", True),
+        ("pydantic_core/_pydantic_core.pyi", True),
+        ("pydantic_core/py.typed", True),
+        ("pydantic/v1/main.py", True),
+        ("package/tests/test_main.py", True),
+        ("pydantic-2.0.dist-info/METADATA", False),
+        ("pydantic-2.0.dist-info/RECORD", True),
+        ("pydantic-2.0.dist-info/licenses/LICENSE", True),
+    ],
+)
+def test_is_stripped(path: str, expected: bool) -> None:  # noqa: FBT001
+    assert is_stripped(path) is expected
+
+
+@pytest.mark.parametrize(
+    ("wheel", "architecture", "expected"),
+    [
+        ("pydantic-2.0-py3-none-any.whl", "arm64", True),
+        ("pydantic-2.0-py3-none-any.whl", "x86_64", True),
+        ("core-2.0-cp310-cp310-manylinux_2_17_aarch64.manylinux2014_aarch64.whl", "arm64", True),
+        ("core-2.0-cp310-cp310-manylinux_2_17_aarch64.manylinux2014_aarch64.whl", "x86_64", False),
+        ("core-2.0-cp310-cp310-manylinux_2_17_x86_64.manylinux2014_x86_64.whl", "x86_64", True),
+        ("core-2.0-cp311-cp311-manylinux_2_17_x86_64.manylinux2014_x86_64.whl", "x86_64", False),
+    ],
+)
+def test_is_wheel_compatible(wheel: str, architecture: str, expected: bool) -> None:  # noqa: FBT001
+    assert is_wheel_compatible(wheel, architecture, "3.10") is expected
+
+
+@pytest.mark.parametrize(
+    ("wheels", "expected"),
+    [
+        ([], ["pydantic", "pydantic_core"]),
+        (["pydantic-2.0-py3-none-any.whl"], ["pydantic_core"]),
+        (["pydantic-2.0-py3-none-any.whl", "pydantic_core-2.0-py3-none-any.whl"], ["pydantic_core"]),
+        (
+            ["pydantic-2.0-py3-none-any.whl", "pydantic_core-2.0-cp310-cp310-manylinux2014_aarch64.whl"],
+            ["pydantic_core"],
+        ),
+        (["pydantic-2.0-py3-none-any.whl", "pydantic_core-2.0-cp310-cp310-manylinux2014_x86_64.whl"], []),
+    ],
+)
+def test_get_missing_requirements(tmp_path: Path, wheels: list[str], expected: list[str]) -> None:
+    for wheel in wheels:
+        (tmp_path / wheel).touch()
+    assert get_missing_requirements(tmp_path, "x86_64", "3.10") == expected
+
+
+@pytest.fixture
+def wheelhouse(tmp_path: Path) -> Path:
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    for wheel, files in {
+        "lib-1.0-py3-none-any.whl": ["lib/__init__.py", "lib/tests/test_lib.py", "lib-1.0.dist-info/RECORD"],
+        f"core-1.0-{CPYTHON_TAG}-{CPYTHON_TAG}-manylinux2014_aarch64.whl": ["core/__init__.py", "core/arm64.py"],
+        f"core-1.0-{CPYTHON_TAG}-{CPYTHON_TAG}-manylinux2014_x86_64.whl": ["core/__init__.py", "core/x86_64.py"],
+    }.items():
+        with zipfile.ZipFile(wheelhouse / wheel, "w") as archive:
+            for file in files:
+                archive.writestr(file, "VALUE = 1\n")
+    return wheelhouse
+
+
+@pytest.mark.parametrize("architecture", ["arm64", "x86_64"])
+def test_build_layer(wheelhouse: Path, tmp_path: Path, architecture: str) -> None:
+    builds = [
+        build_layer(
+            architecture=architecture,
+            wheelhouse=wheelhouse,
+            build_dir=tmp_path / build_dir,
+            python_version=PYTHON_VERSION,
+        )
+        for build_dir in ("first", "second")
+    ]
+    assert builds[0].path.read_bytes() == builds[1].path.read_bytes()
+    assert builds[0].size == builds[0].path.stat().st_size
+
+    with zipfile.ZipFile(builds[0].path) as archive:
+        names = archive.namelist()
+    assert f"python/core/{architecture}.py" in names
+    assert "python/lib/__init__.py" in names
+    assert f"python/lib/__pycache__/__init__.{sys.implementation.cache_tag}.pyc" in names
+    assert "python/aws_spy/main.py" in names
+    assert "python/aws_spy/core/config.py" in names
+    assert not any("tests" in name or "dist-info" in name or "helpers" in name for name in names)
+
+
+def test_build_layer_without_wheels(tmp_path: Path) -> None:
+    with pytest.raises(PythonEnvironmentError):
+        build_layer(architecture="arm64", wheelhouse=tmp_path, build_dir=tmp_path / "build")
+
+
+def test_build_layer_cache(wheelhouse: Path, tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "build-cache.json")
+    kwargs = {"architecture": "arm64", "wheelhouse": wheelhouse, "build_dir": tmp_path, "cache": cache}
+
+    build = build_layer(**kwargs)  # type: ignore
+    assert not build.cached
+    assert build_layer(**kwargs).cached  # type: ignore
+
+    (wheelhouse / "extra-1.0-py3-none-any.whl").write_bytes((wheelhouse / "lib-1.0-py3-none-any.whl").read_bytes())
+    rebuild = build_layer(**kwargs)  # type: ignore
+    assert not rebuild.cached
+    assert rebuild.content_hash != build.content_hash
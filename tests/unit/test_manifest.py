@@ -0,0 +1,95 @@
+import os
+import typing as t
+from pathlib import Path as FilePath
+
+import pytest
+from pydantic import BaseModel
+
+from aws_spy import Header, Path, Query, SpyAPI
+from aws_spy.core import schemas
+from aws_spy.core.manifest import MANIFEST_FILE_NAME, fingerprint, load_manifest, write_manifest
+from aws_spy.core.schemas import Methods, SpyRoute
+from aws_spy.helpers.cli import generate_serverless_file
+
+
+class User(BaseModel):
+    name: str
+
+
+def handler(
+    user: User,
+    event: dict,
+    user_id: int = Path(),
+    token: str = Header("X-Token"),
+    limit: int | None = Query(),
+) -> None:
+    ...
+
+
+def build_route() -> SpyRoute:
+    return SpyRoute(name="lambda", method=Methods.POST, path="/users/{user_id}", handler=handler)
+
+
+@pytest.fixture
+def manifest_path(tmp_path: FilePath, monkeypatch: pytest.MonkeyPatch) -> t.Iterator[str]:
+    path = str(tmp_path / MANIFEST_FILE_NAME)
+    monkeypatch.setenv("SPY_MANIFEST", path)
+    load_manifest.cache_clear()
+    yield path
+    load_manifest.cache_clear()
+
+
+def test_route_from_manifest(manifest_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = build_route()
+    write_manifest([expected], manifest_path)
+    load_manifest.cache_clear()
+
+    def resolve_handler_args(*_: t.Any) -> None:
+        pytest.fail("handler was introspected despite a manifest entry")
+
+    monkeypatch.setattr(schemas, "resolve_handler_args", resolve_handler_args)
+    route = build_route()
+
+    assert route.add_event and not route.add_context
+    assert route.request_body is User
+    assert route.request_body_arg_name == "user"
+    for attr_name in ("path_params", "header_params", "query_params"):
+        assert [param.model_dump(exclude={"in_"}) for param in getattr(route, attr_name)] == [
+            param.model_dump(exclude={"in_"}) for param in getattr(expected, attr_name)
+        ]
+    assert route.params_validator.validate(
+        {"pathParameters": {"user_id": "1"}, "headers": {"x-token": "abc"}, "queryStringParameters": {}}
+    ) == ({"user_id": 1, "token": "abc", "limit": None}, [])
+
+
+def test_stale_manifest_entry_is_ignored(manifest_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    write_manifest([build_route()], manifest_path)
+    load_manifest.cache_clear()
+
+    calls = []
+    resolve_handler_args = schemas.resolve_handler_args
+    monkeypatch.setattr(schemas, "resolve_handler_args", lambda h: calls.append(h) or resolve_handler_args(h))
+    SpyRoute(name="lambda", method=Methods.POST, path="/v2/users/{user_id}", handler=handler)
+    assert calls == [handler]
+
+
+def test_broken_manifest_is_ignored(manifest_path: str) -> None:
+    with open(manifest_path, "wb") as file:
+        file.write(b"not a manifest")
+    assert load_manifest() == {}
+
+
+def test_fingerprint() -> None:
+    def other(user: User, event: dict, user_id: int = Path(), token: str = Header("X-Other")) -> None:
+        ...
+
+    assert fingerprint(handler, "/path", Methods.GET) == fingerprint(handler, "/path", Methods.GET)
+    assert fingerprint(handler, "/path", Methods.GET) != fingerprint(handler, "/path", Methods.POST)
+    assert fingerprint(handler, "/path", Methods.GET) != fingerprint(other, "/path", Methods.GET)
+    assert fingerprint(print, "/path", Methods.GET) is None
+
+
+def test_generate_serverless_file_writes_manifest(app: SpyAPI, tmp_path: FilePath) -> None:
+    app.post("/users/{user_id}", "lambda")(handler)
+    generate_serverless_file(app, str(tmp_path / "serverless.yml"))
+    assert os.path.isfile(tmp_path / MANIFEST_FILE_NAME)
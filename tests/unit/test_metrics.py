@@ -0,0 +1,139 @@
+import io
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from aws_spy import Query, SpyAPI
+from aws_spy.core import metrics as metrics_module
+from aws_spy.core.config import ServerlessConfig
+from aws_spy.core.exceptions import BaseSpyError
+from aws_spy.core.metrics import Metrics, MetricsRecorder, PhaseTimer, server_timing_header
+from aws_spy.core.schemas import Methods
+from aws_spy.runtime import RoutePlan, TimedRoutePlan
+
+
+class ExampleRequest(BaseModel):
+    x: int
+
+
+@pytest.fixture
+def stream() -> io.StringIO:
+    return io.StringIO()
+
+
+def read_documents(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_plan_untimed_without_metrics(app: SpyAPI) -> None:
+    @app.get("/path", "lambda")
+    def handler() -> None:
+        ...
+
+    app.compile()
+    assert type(app.routes["/path"][Methods.GET].plan) is RoutePlan
+
+
+def test_phase_timer() -> None:
+    timer = PhaseTimer()
+    timer.lap("params")
+    timer.lap("handler")
+    phases = timer.stop()
+    assert list(phases) == ["params", "handler", "total"]
+    assert phases["total"] >= phases["params"] + phases["handler"]
+    assert server_timing_header({"handler": 1_500_000}) == "handler;dur=1.5"
+
+
+def test_emf_line_per_invocation(
+    config: ServerlessConfig, stream: io.StringIO, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(metrics_module, "_cold_start", True)
+    app = SpyAPI(config=config, metrics=Metrics(namespace="shop"))
+    app.metrics.stream = stream  # type: ignore
+
+    @app.post("/items", "create-item")
+    def handler(request: ExampleRequest, dry_run: bool = Query()) -> dict[str, int]:  # noqa: FBT001
+        return {"x": request.x}
+
+    app.compile()
+    assert isinstance(app.routes["/items"][Methods.POST].plan, TimedRoutePlan)
+
+    event = {"queryStringParameters": {"dry_run": "true"}, "body": '{"x": 1}'}
+    assert handler(event, None)["statusCode"] == 201
+    assert handler({"queryStringParameters": {"dry_run": "true"}, "body": "{}"}, None)["statusCode"] == 422
+
+    first, second = read_documents(stream)
+    assert first["_aws"]["CloudWatchMetrics"] == [
+        {
+            "Namespace": "shop",
+            "Dimensions": [["Route"]],
+            "Metrics": [
+                {"Name": name, "Unit": "Milliseconds"} for name in ("params", "body", "handler", "serialize", "total")
+            ],
+        }
+    ]
+    assert first["Route"] == "create-item"
+    assert first["StatusCode"] == 201
+    assert first["ColdStart"] is True
+    assert second["StatusCode"] == 422
+    assert second["ColdStart"] is False
+    assert "handler" not in second
+
+
+def test_emf_aggregated(config: ServerlessConfig, stream: io.StringIO) -> None:
+    app = SpyAPI(config=config, metrics=Metrics(flush_every=3))
+    app.metrics.stream = stream  # type: ignore
+
+    @app.get("/a", "a")
+    def a() -> None:
+        ...
+
+    @app.get("/b", "b")
+    def b() -> None:
+        raise BaseSpyError(error="Not found", status_code=404)
+
+    a({}, None)
+    b({}, None)
+    assert stream.getvalue() == ""
+    a({}, None)
+
+    documents = {document["Route"]: document for document in read_documents(stream)}
+    assert documents["a"]["StatusCode"] == [200, 200]
+    assert len(documents["a"]["handler"]) == 2
+    assert documents["b"]["StatusCode"] == [404]
+    assert len(documents["b"]["handler"]) == 1
+
+    a({}, None)
+    app.metrics.flush()  # type: ignore
+    assert len(read_documents(stream)) == 3
+    app.metrics.flush()  # type: ignore
+    assert len(read_documents(stream)) == 3
+
+
+def test_server_timing_header(config: ServerlessConfig, stream: io.StringIO) -> None:
+    app = SpyAPI(config=config, metrics=Metrics(server_timing=True))
+    app.metrics.stream = stream  # type: ignore
+
+    @app.get("/path", "lambda")
+    def handler() -> dict[str, str]:
+        return {"status": "ok"}
+
+    response = handler({}, None)
+    phases = [part.split(";")[0] for part in response["headers"]["Server-Timing"].split(", ")]
+    assert phases == ["handler", "serialize", "total"]
+
+
+def test_router_metrics_kept(config: ServerlessConfig) -> None:
+    recorder = MetricsRecorder(Metrics())
+    app = SpyAPI(config=config, metrics=True)
+
+    @app.get("/path", "lambda")
+    def handler() -> None:
+        ...
+
+    route = app.routes["/path"][Methods.GET]
+    assert route.metrics is app.metrics
+    route.metrics = recorder
+    app.add_route("/other", Methods.GET, route.model_copy(update={"name": "other"}))
+    assert app.routes["/other"][Methods.GET].metrics is recorder
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from aws_spy.core.manifest import MANIFEST_FILE_NAME
+from aws_spy.helpers.packaging import (
+    build_package_patterns,
+    find_included_files,
+    find_local_imports,
+    find_unpackaged_data_files,
+    get_artifact_size,
+)
+
+FILES = {
+    "functions/users.py": "import json\nimport aws_spy\nfrom app.services import db\nfrom helpers import format_user\n",
+    "functions/helpers.py": "def format_user(user):\n    return user\n",
+    "functions/orders.py": "import analytics\n",
+    "app/__init__.py": "",
+    "app/services/__init__.py": "from . import cache\n",
+    "app/services/cache.py": "",
+    "app/services/db.py": "from ..models import User\n",
+    "app/models.py": "",
+    "app/services/queries.sql": "SELECT 1",
+    "app/templates/user.html": "<p></p>",
+    "analytics/__init__.py": "".join(f"value_{i} = {i * 7919}\n" for i in range(5_000)),
+}
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    for name, content in FILES.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content)
+    return tmp_path
+
+
+def test_find_local_imports(project: Path) -> None:
+    files = find_local_imports(str(project / "functions/users.py"), [str(project / "functions"), str(project)])
+    assert build_package_patterns(files, str(project)) == [
+        "!**",
+        "app/__init__.py",
+        "app/models.py",
+        "app/services/__init__.py",
+        "app/services/cache.py",
+        "app/services/db.py",
+        "functions/helpers.py",
+        "functions/users.py",
+        MANIFEST_FILE_NAME,
+    ]
+
+
+def test_artifact_size(project: Path) -> None:
+    users = find_local_imports(str(project / "functions/users.py"), [str(project / "functions"), str(project)])
+    orders = find_local_imports(str(project / "functions/orders.py"), [str(project / "functions"), str(project)])
+    assert str(project / "analytics/__init__.py") in orders
+    assert str(project / "analytics/__init__.py") not in users
+    assert 0 < get_artifact_size(users) < get_artifact_size(orders)
+
+
+def test_package_data_files(project: Path) -> None:
+    files = find_local_imports(str(project / "functions/users.py"), [str(project / "functions"), str(project)])
+    assert find_unpackaged_data_files(files, str(project)) == ["app/services/queries.sql"]
+
+    include = ["app/services/*.sql", "app/templates/**"]
+    assert build_package_patterns(files, str(project), include)[-3:] == [*include, MANIFEST_FILE_NAME]
+    included = find_included_files(str(project), include)
+    assert included == [str(project / "app/services/queries.sql"), str(project / "app/templates/user.html")]
+    assert find_unpackaged_data_files(files + included, str(project)) == []
@@ -1,11 +1,13 @@
 import json
 import typing as t
+from decimal import Decimal
 
 import pytest
 from pydantic import BaseModel
 
+from aws_spy.core.encoders import get_json_backend, set_json_backend
 from aws_spy.core.schemas import SpyRoute
-from aws_spy.responses import JSONResponse
+from aws_spy.responses import JSONResponse, JSONStreamResponse, StreamingResponse
 
 
 class ExampleResponseClass(BaseModel):
@@ -67,3 +69,69 @@ def test_json_response(
     assert response["statusCode"] == 202
     assert response["body"] == expected_response_body
     assert response["headers"] == expected_headers
+
+
+class Price(BaseModel):
+    amount: Decimal
+    tags: list[str]
+
+
+def test_json_response_model_format() -> None:
+    # same output as dumping the model to a dict first, Decimal stays a number
+    response = JSONResponse(Price(amount=Decimal("1.5"), tags=["a"])).response
+    assert response["body"] == '{"amount": 1.5, "tags": ["a"]}'
+
+    backend = get_json_backend()
+    set_json_backend("pydantic-core")
+    try:
+        # compact pydantic-core output, with Decimal as a string, is opt-in
+        response = JSONResponse(Price(amount=Decimal("1.5"), tags=["a"])).response
+        assert response["body"] == '{"amount":"1.5","tags":["a"]}'
+    finally:
+        set_json_backend(backend)
+
+
+@pytest.mark.parametrize(
+    ["data", "ndjson", "expected_body", "expected_content_type"],
+    [
+        ([], False, "[]", "application/json"),
+        ([{"x": 1, "y": 2}], False, '[{"x": 1, "y": 2}]', "application/json"),
+        (
+            ({"x": i, "y": 2} for i in range(3)),
+            False,
+            '[{"x": 0, "y": 2},{"x": 1, "y": 2},{"x": 2, "y": 2}]',
+            "application/json",
+        ),
+        (
+            iter([ExampleResponseClass(x=1, y=2), SameAsExampleResponseClass(x=2, y=2)]),
+            True,
+            '{"x": 1, "y": 2}\n{"x": 2, "y": 2}\n',
+            "application/x-ndjson",
+        ),
+    ],
+)
+def test_json_stream_response(
+    data: t.Iterable[t.Any],
+    ndjson: bool,  # noqa: FBT001
+    expected_body: str,
+    expected_content_type: str,
+) -> None:
+    route = SpyRoute(
+        name="random",
+        path="/path",
+        method="get",
+        handler=lambda: "nothing",
+        response_class=ExampleResponseClass,
+    )
+    response_cls = JSONStreamResponse(data, ndjson=ndjson)
+    response_cls.route = route
+    response = response_cls.response
+    assert response["statusCode"] == 200
+    assert response["body"] == expected_body
+    assert response["headers"] == {"Content-Type": expected_content_type}
+
+
+def test_streaming_response_stream() -> None:
+    chunks: list[str] = []
+    StreamingResponse([b"a", "b"], media_type="text/plain").stream(chunks.append)
+    assert chunks == ["a", "b"]
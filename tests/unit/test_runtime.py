@@ -0,0 +1,115 @@
+import dataclasses
+import json
+import typing as t
+
+import pytest
+import typing_extensions as te
+from pydantic import BaseModel, ValidationError
+
+from aws_spy import Header, Path, SpyAPI
+from aws_spy.core.schemas import Methods
+from aws_spy.runtime import FunctionPlan, RoutePlan, build_extractor, compile_route
+
+
+class ExampleRequest(BaseModel):
+    x: int
+
+
+def test_compile(app: SpyAPI) -> None:
+    @app.get("/path", "lambda")
+    def handler() -> None:
+        ...
+
+    route = app.routes["/path"][Methods.GET]
+    assert route.plan is None
+    app.compile()
+    assert isinstance(route.plan, RoutePlan)
+    assert compile_route(route) is route.plan
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        route.plan.add_event = True  # type: ignore
+
+
+def test_plan_compiled_lazily(app: SpyAPI) -> None:
+    @app.get("/path", "lambda")
+    def handler() -> dict[str, str]:
+        return {"status": "ok"}
+
+    route = app.routes["/path"][Methods.GET]
+    response = handler({}, None)
+    assert response["statusCode"] == 200
+    assert isinstance(route.plan, RoutePlan)
+
+
+def test_build_extractor_without_params(app: SpyAPI) -> None:
+    @app.get("/path", "lambda")
+    def handler(event, context) -> None:  # noqa: ARG001
+        ...
+
+    assert build_extractor(app.routes["/path"][Methods.GET]) is None
+
+
+def test_build_extractor(app: SpyAPI) -> None:
+    @app.post("/path/{user_id}", "lambda")
+    def handler(request: ExampleRequest, user_id: int = Path(), token: str = Header()) -> None:  # noqa: ARG001
+        ...
+
+    extract = build_extractor(app.routes["/path/{user_id}"][Methods.POST])
+    assert extract is not None
+    kwargs, errors = extract({"pathParameters": {"user_id": "1"}, "headers": {"token": "abc"}, "body": '{"x": 1}'})
+    assert errors == []
+    assert kwargs == {"user_id": 1, "token": "abc", "request": ExampleRequest(x=1)}
+
+    kwargs, errors = extract({"pathParameters": {"user_id": "1"}, "headers": None, "body": '{"x": 1}'})
+    assert errors == ["Required parameter token not found in header."]
+
+
+class ExampleEvent(te.TypedDict):
+    x: int
+
+
+def test_function_validation(app: SpyAPI) -> None:
+    @app.function("model-function", response_class=ExampleRequest)
+    def handler(event: ExampleRequest, context: None) -> dict[str, t.Any]:  # noqa: ARG001
+        return {"x": event.x * 2, "extra": True}
+
+    assert isinstance(app.functions[0].plan, FunctionPlan)
+    assert handler({"x": "1"}, None) == {"x": 2}
+    assert handler(json.dumps({"x": 2}), None) == {"x": 4}
+    with pytest.raises(ValidationError):
+        handler({"x": "a"}, None)
+
+    @app.function("typed-dict-function")
+    def typed_dict(event: ExampleEvent, context: None) -> ExampleEvent:  # noqa: ARG001
+        return event
+
+    assert typed_dict(b'{"x": "3"}', None) == {"x": 3}
+
+
+def test_function_unresolvable_annotations(app: SpyAPI) -> None:
+    # string annotations, as with `from __future__ import annotations`, context's type imported for type checkers only
+    @app.function("model-function")
+    def handler(event: "ExampleRequest", context: "LambdaContext") -> dict[str, t.Any]:  # type: ignore  # noqa: F821
+        return {"x": event.x, "context": context}
+
+    assert handler({"x": "1"}, "context") == {"x": 1, "context": "context"}
+
+    @app.function("raw-event")
+    def raw(event: "Event", context: "LambdaContext") -> dict:  # type: ignore  # noqa: ARG001, F821
+        return event
+
+    assert raw({"x": "a"}, None) == {"x": "a"}
+
+
+def test_function_skip_validation(app: SpyAPI) -> None:
+    @app.function("lambda", response_class=ExampleRequest, skip_validation=True)
+    def handler(event: ExampleRequest, context: None) -> t.Any:  # noqa: ARG001
+        return event
+
+    assert handler({"x": "a"}, None) == {"x": "a"}
+
+    @app.function("raw-event")
+    def raw(event: dict, context: None) -> dict:  # noqa: ARG001
+        return event
+
+    assert raw({"x": "a"}, None) == {"x": "a"}
@@ -0,0 +1,92 @@
+import datetime
+import typing as t
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from pydantic import Field
+
+from aws_spy.core.params_alias import Header, Path, Query
+from aws_spy.core.schemas import ParamSchema
+from aws_spy.core.schemas_utils import ParamsValidator
+
+
+class ExampleEnum(str, Enum):
+    example = "example"
+
+
+def gpm(
+    name: str,
+    annotation: t.Any,
+    in_: t.Any,
+    is_required: bool = True,  # noqa: FBT001 FBT002
+) -> ParamSchema:
+    return ParamSchema(name=name, arg_name=name, in_=in_, annotation=annotation, is_required=is_required, enum=None)
+
+
+validator = ParamsValidator(
+    path=[gpm("user_id", UUID, Path())],
+    header=[gpm("X-Token", str, Header()), gpm("x-debug", bool, Header(), False)],
+    query=[
+        gpm("since", datetime.date, Query()),
+        gpm("limit", t.Annotated[int, Field(gt=0)], Query(), False),
+        gpm("kind", ExampleEnum, Query(), False),
+    ],
+)
+user_id = "a2618752-dc19-4f40-adf5-6173d419f2ed"
+
+
+def test_params_validator() -> None:
+    args, errors = validator.validate(
+        {
+            "pathParameters": {"user_id": user_id},
+            "headers": {"x-token": "abc", "X-Debug": "false"},
+            "queryStringParameters": {"since": "2023-05-10", "kind": "example"},
+        }
+    )
+    assert errors == []
+    assert args == {
+        "user_id": UUID(user_id),
+        "X-Token": "abc",
+        "x-debug": False,
+        "since": datetime.date(2023, 5, 10),
+        "limit": None,
+        "kind": ExampleEnum.example,
+    }
+
+
+@pytest.mark.parametrize(
+    ["event", "expected_errors"],
+    [
+        (
+            {"pathParameters": None, "headers": None, "queryStringParameters": None},
+            [
+                "Required parameter user_id not found in path.",
+                "Required parameter X-Token not found in header.",
+                "Required parameter since not found in query.",
+            ],
+        ),
+        (
+            {
+                "pathParameters": {"user_id": "1"},
+                "headers": {"x-token": "abc"},
+                "queryStringParameters": {"since": "today", "limit": "0", "kind": "other"},
+            },
+            [
+                "user_id should be UUID type.",
+                "since should be date type.",
+                "limit should be int type.",
+                "kind should be ExampleEnum type.",
+            ],
+        ),
+    ],
+)
+def test_params_validator_errors(event: dict[str, t.Any], expected_errors: list[str]) -> None:
+    args, errors = validator.validate(event)
+    assert args == {}
+    assert errors == expected_errors
+
+
+def test_empty_params_validator() -> None:
+    assert not ParamsValidator(path=[], header=[], query=[])
+    assert validator
@@ -0,0 +1,175 @@
+import base64
+import gzip
+import json
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel, Field
+
+from aws_spy import DynamoDBRecord, KinesisRecord, SpyAPI
+from aws_spy.core.config import Function
+from aws_spy.core.streams import get_dynamodb_converter, unmarshal_image
+
+
+class Reading(BaseModel):
+    sensor: str
+    value: float
+
+
+class Address(BaseModel):
+    city: str
+
+
+class User(BaseModel):
+    user_id: str = Field(alias="pk")
+    age: int
+    address: Address
+    tags: set[str] = Field(default_factory=set)
+
+
+def build_kinesis_event(*payloads: bytes) -> dict:
+    return {
+        "Records": [
+            {
+                "kinesis": {
+                    "partitionKey": f"p{index}",
+                    "sequenceNumber": str(index),
+                    "data": base64.b64encode(payload).decode(),
+                }
+            }
+            for index, payload in enumerate(payloads)
+        ]
+    }
+
+
+def build_reading(value: float) -> bytes:
+    return json.dumps({"sensor": "s", "value": value}).encode()
+
+
+def build_dynamodb_event(*images: dict, event_name: str = "INSERT") -> dict:
+    return {
+        "Records": [
+            {"eventName": event_name, "dynamodb": {"SequenceNumber": str(index), "NewImage": image}}
+            for index, image in enumerate(images)
+        ]
+    }
+
+
+def build_user_image(age: str) -> dict:
+    return {
+        "pk": {"S": "u1"},
+        "age": {"N": age},
+        "address": {"M": {"city": {"S": "Warsaw"}}},
+        "tags": {"SS": ["a", "b"]},
+        "unused": {"L": [{"NULL": True}]},
+    }
+
+
+def test_unmarshal_image() -> None:
+    image = {
+        "s": {"S": "x"},
+        "n": {"N": "1.5"},
+        "b": {"B": base64.b64encode(b"bytes").decode()},
+        "flag": {"BOOL": True},
+        "null": {"NULL": True},
+        "list": {"L": [{"N": "1"}, {"S": "a"}]},
+        "map": {"M": {"ns": {"NS": ["1", "2"]}}},
+    }
+    assert unmarshal_image(image) == {
+        "s": "x",
+        "n": Decimal("1.5"),
+        "b": b"bytes",
+        "flag": True,
+        "null": None,
+        "list": [Decimal(1), "a"],
+        "map": {"ns": {Decimal(1), Decimal(2)}},
+    }
+
+
+def test_dynamodb_converter() -> None:
+    converter = get_dynamodb_converter(User)
+    assert converter is get_dynamodb_converter(User)
+    assert converter(build_user_image("30")) == {
+        "pk": "u1",
+        "age": Decimal(30),
+        "address": {"city": "Warsaw"},
+        "tags": {"a", "b"},
+    }
+
+
+def test_kinesis_records(app: SpyAPI) -> None:
+    readings = []
+
+    @app.kinesis("readings", stream="arn:aws:kinesis:eu-west-1:123:stream/readings")
+    def handler(reading: Reading, record: KinesisRecord) -> None:
+        if reading.value < 0:
+            msg = "Negative reading"
+            raise ValueError(msg)
+        readings.append((record.partition_key, reading.value))
+
+    event = build_kinesis_event(build_reading(1), gzip.compress(build_reading(2)), build_reading(-1), build_reading(3))
+    assert handler(event) == {"batchItemFailures": [{"itemIdentifier": "2"}]}
+    assert readings == [("p0", 1.0), ("p1", 2.0)]
+
+
+def test_kinesis_record_decoded_lazily(app: SpyAPI) -> None:
+    records = []
+
+    @app.kinesis("readings", stream="arn", max_concurrency=2)
+    def handler(record: KinesisRecord) -> None:
+        records.append(record)
+        if record.partition_key == "p1":
+            assert record.data == b"payload"
+            msg = "Failed"
+            raise ValueError(msg)
+
+    event = build_kinesis_event(b"not base64 decoded", b"payload", b"other")
+    event["Records"][0]["kinesis"]["data"] = "%%%"
+    event["Records"][2]["kinesis"]["partitionKey"] = "p1"
+    assert handler(event) == {"batchItemFailures": [{"itemIdentifier": "1"}]}
+    assert len(records) == 3
+
+
+def test_dynamodb_stream(app: SpyAPI) -> None:
+    users = []
+
+    @app.dynamodb_stream("users", stream="arn:aws:dynamodb:eu-west-1:123:table/users/stream/1")
+    def handler(user: User, record: DynamoDBRecord) -> None:
+        users.append((record.event_name, user))
+
+    assert handler(build_dynamodb_event(build_user_image("30"), build_user_image("x"), build_user_image("31"))) == {
+        "batchItemFailures": [{"itemIdentifier": "1"}]
+    }
+    assert users == [("INSERT", User(pk="u1", age=30, address=Address(city="Warsaw"), tags={"a", "b"}))]
+
+
+def test_dynamodb_record(app: SpyAPI) -> None:
+    images = []
+
+    @app.dynamodb_stream("users", stream="arn")
+    def handler(record: DynamoDBRecord) -> None:
+        images.append((record.new_image, record.old_image))
+
+    handler(build_dynamodb_event({"pk": {"S": "u1"}}, event_name="MODIFY"))
+    assert images == [({"pk": "u1"}, None)]
+
+
+@pytest.mark.parametrize(["decorator", "stream_type"], [("kinesis", "kinesis"), ("dynamodb_stream", "dynamodb")])
+def test_stream_event(app: SpyAPI, decorator: str, stream_type: str) -> None:
+    @getattr(app, decorator)("consumer", stream="arn", starting_position="TRIM_HORIZON", batch_size=500)
+    def handler(record: dict) -> None:
+        ...
+
+    function = Function.from_function(function=app.functions[0])
+    assert function.events == [
+        {
+            "stream": {
+                "type": stream_type,
+                "arn": "arn",
+                "startingPosition": "TRIM_HORIZON",
+                "batchSize": 500,
+                "maximumBatchingWindow": 0,
+                "functionResponseType": "ReportBatchItemFailures",
+            }
+        }
+    ]